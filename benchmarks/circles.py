@@ -0,0 +1,22 @@
+import math
+import timeit
+from petrify import shape
+from petrify.geometry import tau
+from petrify.plane import Point2, Polygon2, Vector2
+
+def computed(origin, radius, segments):
+    # Circle construction before trigonometry tables were cached.
+    angles = (tau * float(a) / segments for a in range(segments))
+    return Polygon2([
+        origin + Vector2(math.cos(theta) * radius, math.sin(theta) * radius)
+        for theta in angles
+    ])
+
+holes = [Point2(x * 10, y * 10) for x in range(50) for y in range(20)]
+number = 5
+
+each = timeit.timeit(lambda: [computed(p, 2.5, 32) for p in holes], number=number)
+cached = timeit.timeit(lambda: [shape.Circle(p, 2.5, 32) for p in holes], number=number)
+print('1000 holes: {0:.3f}s computing trigonometry, {1:.3f}s from tables ({2:.1f}x)'.format(
+    each, cached, each / cached
+))
@@ -1,5 +1,6 @@
 import sys, random
-from petrify.solid import tau, Union, Box, Vector, Point
+from petrify.geometry import tau
+from petrify.solid import Union, Box, Vector, Point
 from petrify import engines
 
 if len(sys.argv) > 1:
@@ -0,0 +1,16 @@
+import timeit
+from petrify import solid
+from petrify.space import Point3
+
+def sphere():
+    return solid.Sphere(Point3(0, 0, 0), 10, segments=64)
+
+number = 5
+
+solid.BATCHED = float('inf')
+each = timeit.timeit(sphere, number=number)
+solid.BATCHED = 0
+batch = timeit.timeit(sphere, number=number)
+print('64-segment sphere: {0:.3f}s per quad, {1:.3f}s batched ({2:.1f}x)'.format(
+    each, batch, each / batch
+))
@@ -0,0 +1,18 @@
+import timeit
+from petrify.plane import Vector2
+from petrify.space import Vector3
+
+v3 = Vector3(1.0, 2.0, 3.0)
+v2 = Vector2(1.0, 2.0)
+number = 1000000
+
+cases = [
+    ('Vector3.xyz', lambda: v3.xyz, lambda: Vector3.__getattr__(v3, 'xyz')),
+    ('Vector3.xy', lambda: v3.xy, lambda: Vector3.__getattr__(v3, 'xy')),
+    ('Vector2.xy', lambda: v2.xy, lambda: Vector2.__getattr__(v2, 'xy')),
+]
+
+for name, fast, slow in cases:
+    f = timeit.timeit(fast, number=number)
+    s = timeit.timeit(slow, number=number)
+    print('{0}: {1:.3f}s property, {2:.3f}s __getattr__ ({3:.1f}x)'.format(name, f, s, s / f))
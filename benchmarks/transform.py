@@ -0,0 +1,22 @@
+import timeit
+from petrify.geometry import tau
+from petrify.space import Matrix3, Point3, Vector3
+
+m = Matrix3.translate(1, 2, 3) * Matrix3.rotate_axis(Vector3(1, 1, 0), tau / 7)
+points = [Point3(x, x * 0.5, -x) for x in range(1000)]
+number = 200
+
+each = timeit.timeit(lambda: [m * p for p in points], number=number)
+batch = timeit.timeit(lambda: m.transform_points(points), number=number)
+print('1000 points: {0:.3f}s per point, {1:.3f}s transform_points ({2:.1f}x)'.format(
+    each, batch, each / batch
+))
+
+try:
+    from petrify.space.array import PointArray3
+except ImportError:
+    pass
+else:
+    array = PointArray3(points)
+    arrayed = timeit.timeit(lambda: m * array, number=number)
+    print('1000 points: {0:.3f}s as a PointArray3 ({1:.1f}x)'.format(arrayed, each / arrayed))
@@ -0,0 +1,132 @@
+"""
+Shared implementation of the batched point and vector arrays in
+:py:mod:`petrify.plane.array` and :py:mod:`petrify.space.array`.
+
+Each array holds `n` points or vectors as a contiguous `(n, d)` NumPy array of
+floats, and mirrors the arithmetic of the scalar types it batches: adding a
+vector to a point gives a point, subtracting points gives vectors, and
+matrices translate points but not vectors.
+
+"""
+import numpy as np
+
+from .geometry import valid_scalar
+
+class VectorArray:
+    __slots__ = ['values']
+
+    dimensions = None
+    matrix_size = None
+    is_point = False
+
+    # Filled in by subclasses: the scalar type of each element, and the
+    # vector and point array classes of the same dimension.
+    element = None
+    vectors = None
+    points = None
+
+    def __init__(self, values):
+        if isinstance(values, VectorArray):
+            values = values.values
+        elif not isinstance(values, np.ndarray):
+            values = [tuple(v) for v in values]
+        values = np.array(values, dtype=np.float64).reshape((-1, self.dimensions))
+        self.values = values
+
+    @classmethod
+    def _wrap(cls, values):
+        array = cls.__new__(cls)
+        array.values = values
+        return array
+
+    def __copy__(self):
+        return self._wrap(self.values.copy())
+
+    copy = __copy__
+
+    def __repr__(self):
+        return '{0}({1!r})'.format(self.__class__.__name__, self.values.tolist())
+
+    def __len__(self):
+        return len(self.values)
+
+    def __iter__(self):
+        element = self.element
+        return (element(*row) for row in self.values.tolist())
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return self._wrap(self.values[key])
+        return self.element(*self.values[key].tolist())
+
+    def _coerce(self, other):
+        """ The values of `other` and whether it is a point, or `None`. """
+        if isinstance(other, VectorArray):
+            return other.values, other.is_point
+        elif isinstance(other, self.vectors.element):
+            return np.array(tuple(other), dtype=np.float64), \
+                isinstance(other, self.points.element)
+        elif hasattr(other, '__len__') and len(other) == self.dimensions:
+            # Plain sequences take on the type of the array, as they do with
+            # scalar points and vectors.
+            return np.array(tuple(other), dtype=np.float64), None
+        return None
+
+    def _combined(self, other, values):
+        # Mirrors the scalar types: like classes give vectors, unlike points.
+        _, point = other
+        if point is None:
+            return self._wrap(values)
+        return (self.vectors if point == self.is_point else self.points)._wrap(values)
+
+    def __add__(self, other):
+        coerced = self._coerce(other)
+        if coerced is None:
+            return NotImplemented
+        return self._combined(coerced, self.values + coerced[0])
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        coerced = self._coerce(other)
+        if coerced is None:
+            return NotImplemented
+        return self._combined(coerced, self.values - coerced[0])
+
+    def __mul__(self, other):
+        if not valid_scalar(other):
+            return NotImplemented
+        return self._wrap(self.values * other)
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        if not valid_scalar(other):
+            return NotImplemented
+        return self._wrap(self.values / other)
+
+    def __neg__(self):
+        return self._wrap(-self.values)
+
+    def _apply_transform(self, t):
+        n = self.matrix_size
+        m = np.array(t[:], dtype=np.float64).reshape((n, n)).T
+        d = self.dimensions
+        values = self.values @ m[:d, :d].T
+        if self.is_point:
+            values += m[:d, n - 1]
+        self.values = values
+
+    def magnitude_squared(self):
+        return np.einsum('ij,ij->i', self.values, self.values)
+
+    def magnitude(self):
+        return np.sqrt(self.magnitude_squared())
+
+    def normalized(self):
+        return self._wrap(self.values / self.magnitude()[:, np.newaxis])
+
+    def dot(self, other):
+        values, _ = self._coerce(other)
+        return np.einsum('ij,ij->i', self.values, np.broadcast_to(values, self.values.shape))
+
+    def snap(self, grid):
+        return self._wrap(np.round(self.values / grid) * grid)
@@ -9,7 +9,8 @@ Geometry geared towards modifying object edges.
 
 """
 from .solver import solve_matrix
-from .solid import tau, Node, Union
+from .geometry import tau
+from .solid import Node, Union
 from .space import LineSegment, Polygon
 
 from csg import core, geom
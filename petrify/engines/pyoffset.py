@@ -11,15 +11,25 @@ from ..solver import solve_matrix
 # paper at some point, and convert this code to Rust.
 
 def offset(polygon, amount):
-    def off(ps, v):
-        polygons = [nonlocal_offset([p], v) for p in ps]
-        return [ep for p in polygons if p is not None
-                for ep in p.exterior if ep is not None]
-
-    return ComplexPolygon(
-        interior=off(polygon.interior, amount),
-        exterior=off(polygon.exterior, -amount)
-    )
+    return offsets(polygon, [amount])[0]
+
+def offsets(polygon, amounts):
+    def off(ps, vs):
+        # Each simple polygon is skeletonized once, and every requested amount
+        # is read off of the same sequence of split events.
+        solved = [nonlocal_offsets([p], vs) for p in ps]
+        return [
+            [ep for polygons in solved if polygons[ix] is not None
+             for ep in polygons[ix].exterior if ep is not None]
+            for ix in range(len(vs))
+        ]
+
+    interior = off(polygon.interior, amounts)
+    exterior = off(polygon.exterior, [-amount for amount in amounts])
+    return [
+        ComplexPolygon(interior=i, exterior=e)
+        for i, e in zip(interior, exterior)
+    ]
 
 def magnitude(line, normal, inwards):
     # w * inwards = u * line.vector + normal
@@ -146,20 +156,30 @@ def find_first_split_event(rays):
     return (offset, [_rays for _rays in (a, b) if _rays])
 
 def nonlocal_offset(polygons, amount):
+    return nonlocal_offsets(polygons, [amount])[0]
+
+def nonlocal_offsets(polygons, amounts):
     all_rays = [to_rays(polygon) for polygon in polygons]
 
     offsets = [(rays, find_first_split_event(rays)) for rays in all_rays]
-    amounts = [o[1][0] for o in offsets if o[1]]
-    while amounts and amount >= min(amounts):
-        all_rays = [
-            rays
-            for original, pair in offsets
-            for rays in ([original] if not pair or pair[0] > amount else pair[1])
-        ]
-        offsets = [(rays, find_first_split_event(rays)) for rays in all_rays]
-        amounts = [o[1][0] for o in offsets if o[1]]
-
-    return ComplexPolygon([
-        Polygon([ray.p + ray.v * amount for ray in polygon])
-        for polygon in all_rays
-    ])
+    events = [o[1][0] for o in offsets if o[1]]
+
+    # Split events are processed in order of increasing offset, so the state
+    # reached for one amount is the starting point for the next larger one.
+    solutions = {}
+    for amount in sorted(set(amounts)):
+        while events and amount >= min(events):
+            all_rays = [
+                rays
+                for original, pair in offsets
+                for rays in ([original] if not pair or pair[0] > amount else pair[1])
+            ]
+            offsets = [(rays, find_first_split_event(rays)) for rays in all_rays]
+            events = [o[1][0] for o in offsets if o[1]]
+
+        solutions[amount] = ComplexPolygon([
+            Polygon([ray.p + ray.v * amount for ray in polygon])
+            for polygon in all_rays
+        ])
+
+    return [solutions[amount] for amount in amounts]
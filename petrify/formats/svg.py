@@ -105,15 +105,16 @@ class Path:
                     l = command.length(error=1e-5)
                     points = l / min_length.m_as(u.file)
                     for ix in range(0, max(0, int(points) - 1)):
-                        subpoint = from_complex(command.point(ix / points))
-                        current.append(self.t(subpoint))
-                current.append(self.t(from_complex(command.end)))
+                        current.append(from_complex(command.point(ix / points)))
+                current.append(from_complex(command.end))
             else:
                 if current: polygons.append(current)
-                current = [self.t(from_complex(command.start))]
+                current = [from_complex(command.start)]
 
         if current: polygons.append(current)
 
+        polygons = (self.transform.transform_points(p) for p in polygons)
+
         polygons = (Polygon(p).simplify() for p in polygons)
         return [p for p in polygons if p is not None]
 
@@ -1,3 +1,6 @@
+import itertools
+import operator
+
 class Concrete:
     def __new__(cls, *args):
         return object.__new__(cls)
@@ -48,6 +51,23 @@ class Point(Vector):
         else:
             return NotImplemented
 
+def swizzle(cls, axes):
+    """
+    Defines properties on `cls` for every two- and three-letter combination
+    of its `axes`, so common swizzles like `.xy` and `.xyz` don't need to go
+    through `__getattr__`:
+
+    >>> class Pair:
+    ...     def __init__(self, x, y): self.x, self.y = x, y
+    >>> swizzle(Pair, 'xy')
+    >>> Pair(1, 2).yx
+    (2, 1)
+
+    """
+    for n in (2, 3):
+        for names in itertools.product(axes, repeat=n):
+            setattr(cls, ''.join(names), property(operator.attrgetter(*names)))
+
 def embedding_from(args):
     embeds = list(set(a.embedding for a in args))
     assert (len(embeds) == 1), 'arguments must either be all spatial or all planar'
@@ -23,6 +23,8 @@ def valid_scalar(v):
     return isinstance(v, numbers.Number)
 
 class AbstractPolygon:
+    __slots__ = ()
+
     def __truediv__(self, v):
         if valid_scalar(v):
             return self * (1.0 / v)
@@ -41,11 +43,13 @@ class AbstractPolygon:
             return self.PointsConstructor([p * m for p in self.points])
         if isinstance(m, self.embedding.Vector):
             m = self.embedding.Matrix.scale(*m)
+        if isinstance(m, self.embedding.Matrix):
+            return self.PointsConstructor(m.transform_points(self.points))
         return self.PointsConstructor([p * m for p in self.points])
 
     def __add__(self, v):
         m = self.embedding.Matrix.translate(*v)
-        return self.PointsConstructor([p * m for p in self.points])
+        return self.PointsConstructor(m.transform_points(self.points))
 
     def __sub__(self, v):
         return self + (-v)
@@ -78,6 +82,8 @@ class AbstractPolygon:
         return center(self, point)
 
 class Geometry:
+    __slots__ = ()
+
     def _connect_unimplemented(self, other):
         raise AttributeError('Cannot connect %s to %s' %
                              (self.__class__, other.__class__))
@@ -0,0 +1,163 @@
+"""
+Spatial indices for repeated geometric queries.
+
+:py:class:`IntervalIndex` answers which of a fixed set of intervals contain a
+value, or overlap a range, in time proportional to the number of matches:
+
+>>> index = IntervalIndex([(0, 2, 'a'), (1, 3, 'b'), (4, 5, 'c')])
+>>> sorted(index.stab(1.5))
+['a', 'b']
+>>> sorted(index.overlap(2.5, 4))
+['b', 'c']
+
+:py:class:`FaceIndex` applies this to the faces of a mesh, keyed by their
+extent along a normal. Most uses should go through
+:py:meth:`petrify.solid.Node.index`, which builds these once per node.
+
+:py:class:`BoxGrid` buckets two-dimensional bounding boxes for proximity
+queries.
+
+"""
+import math
+
+class _Centered:
+    __slots__ = ['center', 'by_low', 'by_high', 'left', 'right']
+
+    def __init__(self, center, overlapping, left, right):
+        self.center = center
+        self.by_low = sorted(overlapping, key=lambda i: i[0])
+        self.by_high = sorted(overlapping, key=lambda i: -i[1])
+        self.left = left
+        self.right = right
+
+class IntervalIndex:
+    """
+    A static centered interval tree over `(low, high, value)` triples. Queries
+    include intervals touching their endpoints.
+
+    """
+    def __init__(self, intervals):
+        self.intervals = list(intervals)
+        self.root = self._build(self.intervals)
+
+    def __len__(self):
+        return len(self.intervals)
+
+    def _build(self, intervals):
+        if not intervals:
+            return None
+
+        endpoints = sorted(e for i in intervals for e in i[:2])
+        center = endpoints[len(endpoints) // 2]
+
+        left, right, overlapping = [], [], []
+        for i in intervals:
+            if i[1] < center:
+                left.append(i)
+            elif i[0] > center:
+                right.append(i)
+            else:
+                overlapping.append(i)
+
+        return _Centered(center, overlapping, self._build(left), self._build(right))
+
+    def stab(self, v):
+        """ Values of all intervals containing `v`. """
+        return self.overlap(v, v)
+
+    def overlap(self, low, high):
+        """ Values of all intervals overlapping the range from `low` to `high`. """
+        found = []
+        pending = [self.root]
+        while pending:
+            node = pending.pop()
+            if node is None:
+                continue
+            if high < node.center:
+                for i in node.by_low:
+                    if i[0] > high:
+                        break
+                    found.append(i[2])
+                pending.append(node.left)
+            elif low > node.center:
+                for i in node.by_high:
+                    if i[1] < low:
+                        break
+                    found.append(i[2])
+                pending.append(node.right)
+            else:
+                found.extend(i[2] for i in node.by_low)
+                pending.append(node.left)
+                pending.append(node.right)
+        return found
+
+class FaceIndex(IntervalIndex):
+    """
+    Indexes `polygons` by their extent along a `normal`, so queries like
+    "which faces cross this plane" only touch the faces that do:
+
+    >>> from petrify.space import Point, Polygon, Vector
+    >>> faces = [
+    ...     Polygon([Point(0, 0, 0), Point(1, 0, 0), Point(1, 0, 1)]),
+    ...     Polygon([Point(0, 0, 2), Point(1, 0, 2), Point(1, 0, 3)]),
+    ... ]
+    >>> index = FaceIndex(faces, Vector(0, 0, 2))
+    >>> index.crossing(0.5) == faces[:1]
+    True
+    >>> len(index.between(0.5, 2.5))
+    2
+
+    Heights are distances along the normalized `normal`.
+
+    """
+    def __init__(self, polygons, normal):
+        self.normal = normal.normalized()
+        n = self.normal
+
+        def extent(polygon):
+            heights = [n.dot(p) for p in polygon.points]
+            return (min(heights), max(heights), polygon)
+
+        super().__init__(extent(polygon) for polygon in polygons)
+
+    def crossing(self, height):
+        """ Faces touching the plane at `height` along the normal. """
+        return self.stab(height)
+
+    def between(self, low, high):
+        """ Faces touching the slab from `low` to `high` along the normal. """
+        return self.overlap(low, high)
+
+class BoxGrid:
+    """
+    A uniform grid over the two-dimensional bounding boxes of items, given as
+    `(xmin, ymin, xmax, ymax, value)` tuples, for finding everything near a
+    query box:
+
+    >>> grid = BoxGrid([(0, 0, 1, 1, 'a'), (5, 5, 6, 6, 'b')], 1.0)
+    >>> grid.query(0.5, 0.5, 2, 2)
+    ['a']
+
+    Items are returned at most once per query, in the order they were given.
+
+    """
+    def __init__(self, items, size):
+        self.size = size
+        self.cells = {}
+        self.items = []
+        for ix, (x0, y0, x1, y1, value) in enumerate(items):
+            self.items.append(value)
+            for key in self.keys(x0, y0, x1, y1):
+                self.cells.setdefault(key, []).append(ix)
+
+    def keys(self, x0, y0, x1, y1):
+        s = self.size
+        for i in range(math.floor(x0 / s), math.floor(x1 / s) + 1):
+            for j in range(math.floor(y0 / s), math.floor(y1 / s) + 1):
+                yield (i, j)
+
+    def query(self, x0, y0, x1, y1):
+        found = set()
+        for key in self.keys(x0, y0, x1, y1):
+            found.update(self.cells.get(key, ()))
+        return [self.items[ix] for ix in sorted(found)]
@@ -1,7 +1,10 @@
 from .engrave import Engrave
 from .part import Part, Tab
 from .pocket import Pocket
-from .feed import LinearStepFeed
+from .surface import Surface
+from .feed import ContourStepFeed, LinearStepFeed, TrochoidalStepFeed
+from .finish import RasterFinish, WaterlineFinish
+from .vcarve import VCarveFeed
 from .motion import Batch
 from .commands import ToolPause, ToolChange, Pause
-from .tool import StraightTip, Machine, Format
+from .tool import StraightTip, VBit, Kinematics, Machine, Format
@@ -0,0 +1,125 @@
+"""
+Fits circular arcs to runs of toolpath points, so curved paths can be emitted
+as single ``G02``/``G03`` moves instead of many short ``G01`` segments:
+
+>>> from petrify.shape import arc
+>>> points = arc(Point(5, 0), 5, tau / 2, 0, segments=16)
+>>> start, end = fit(points, 0.05)
+>>> start.snap(0.01)
+Point(0.0, 0.0)
+>>> Point(end.x, end.y).snap(0.01), Point(end.i, end.j).snap(0.01)
+(Point(10.0, 0.0), Point(5.0, 0.0))
+>>> end.clockwise
+True
+
+"""
+import math
+
+from ..geometry import tau
+from ..plane import Line, Point
+from .motion import Arc, Motion
+
+def circle(a, b, c):
+    """ The center of the circle through `a`, `b`, and `c`, if there is one. """
+    d = 2 * (a.x * (b.y - c.y) + b.x * (c.y - a.y) + c.x * (a.y - b.y))
+    if abs(d) < 1e-12:
+        return None
+    a2, b2, c2 = a.magnitude_squared(), b.magnitude_squared(), c.magnitude_squared()
+    x = (a2 * (b.y - c.y) + b2 * (c.y - a.y) + c2 * (a.y - b.y)) / d
+    y = (a2 * (c.x - b.x) + b2 * (a.x - c.x) + c2 * (b.x - a.x)) / d
+    return Point(x, y)
+
+def sweep(path, center):
+    """
+    The signed angle swept around `center` by `path`, or `None` if the path
+    ever changes direction.
+
+    """
+    total = 0
+    for a, b in zip(path, path[1:]):
+        u, v = a - center, b - center
+        angle = math.atan2(u.x * v.y - u.y * v.x, u.dot(v))
+        if angle == 0 or (total != 0 and (angle > 0) != (total > 0)):
+            return None
+        total += angle
+    return total
+
+def arc(path, tolerance):
+    """
+    Fits a single :py:class:`~petrify.machine.motion.Arc` from the first to the
+    last point of `path`, returning `None` if any point or segment midpoint
+    strays further than `tolerance` from the circle.
+
+    """
+    center = circle(path[0], path[len(path) // 2], path[-1])
+    if center is None:
+        return None
+
+    r = (path[0] - center).magnitude()
+    midpoints = ((a + b) / 2 for a, b in zip(path, path[1:]))
+    for p in (*path, *midpoints):
+        if abs((p - center).magnitude() - r) > tolerance:
+            return None
+
+    angle = sweep(path, center)
+    if angle is None or abs(angle) >= tau:
+        return None
+
+    offset = center - path[0]
+    return Arc(x=path[-1].x, y=path[-1].y, i=offset.x, j=offset.y, clockwise=angle < 0)
+
+def straight(path, tolerance):
+    chord = Line(path[0], path[-1] - path[0])
+    return all(chord.distance(p) <= tolerance for p in path[1:-1])
+
+def fit(path, tolerance, minimum=4):
+    """
+    Replaces runs of at least `minimum` points in `path` that lie on a circle
+    with arcs. Yields the points that remain, then an
+    :py:class:`~petrify.machine.motion.Arc` ending at the final point of each
+    fitted run.
+
+    """
+    yield path[0]
+
+    i = 0
+    while i < len(path) - 1:
+        end = i + minimum - 1
+        if end >= len(path) or arc(path[i:end + 1], tolerance) is None:
+            i += 1
+            yield path[i]
+            continue
+
+        # Grow the run exponentially, then binary search for its final point.
+        good, step = end, 1
+        while good + step < len(path) and arc(path[i:good + step + 1], tolerance):
+            good += step
+            step *= 2
+        bad = min(good + step, len(path))
+        while bad - good > 1:
+            middle = (good + bad) // 2
+            if arc(path[i:middle + 1], tolerance):
+                good = middle
+            else:
+                bad = middle
+
+        run = path[i:good + 1]
+        if straight(run, tolerance):
+            for p in run[1:]:
+                yield p
+        else:
+            yield arc(run, tolerance)
+        i = good
+
+def moves(path, tolerance, f):
+    """
+    Converts the moves after the start of `path` into motions at feed `f`,
+    fitting arcs within `tolerance`.
+
+    """
+    for move in list(fit(path, tolerance))[1:]:
+        if isinstance(move, Arc):
+            move.f = f
+            yield move
+        else:
+            yield Motion(x=move.x, y=move.y, f=f)
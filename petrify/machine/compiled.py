@@ -0,0 +1,249 @@
+"""
+A columnar representation of a compiled :py:class:`~petrify.machine.motion.Cut`,
+storing its command stream as NumPy arrays rather than as many small objects:
+
+>>> from petrify.plane import Vector
+>>> compiled = Compiled([
+...     (None, Motion(x=1.0, y=1.0, f=600.0)),
+...     (None, Motion(x=2.0, f=600.0)),
+... ])
+>>> moved = compiled + Vector(1, 0)
+>>> moved.x
+array([2., 3.])
+>>> moved.y
+array([ 1., nan])
+
+Axes left unchanged by a command are stored as `nan`. Each command also
+records the index of its `parent` phase in `.parents`, so per-phase
+properties like colors survive compilation.
+
+"""
+import math
+
+import numpy as np
+
+from ..geometry import tau
+from ..plane import Vector
+from .motion import Arc, Cut, Motion
+
+LINEAR = 0
+CLOCKWISE = 1
+COUNTERCLOCKWISE = 2
+OTHER = 3
+
+def filled(values, start=np.nan, barriers=None):
+    """
+    Carries the last known value of `values` forward over `nan` entries,
+    beginning with `start`. Any `barriers` (which must themselves be `nan`)
+    forget prior values, as if the run started over.
+
+    """
+    known = ~np.isnan(values)
+    if barriers is not None:
+        known |= barriers
+    ix = np.maximum.accumulate(np.where(known, np.arange(len(values)), -1))
+    return np.where(ix >= 0, values[ix], start)
+
+def previous(values, start=np.nan):
+    return np.concatenate([[start], values[:-1]]) if len(values) else values
+
+class Compiled(Cut):
+    def __init__(self, commands):
+        self.parents = []
+        self.others = {}
+        ids = {}
+
+        kind, phase, columns = [], [], []
+        nan = math.nan
+        for ix, (parent, command) in enumerate(commands):
+            phase.append(ids.setdefault(id(parent), len(ids)))
+            if len(self.parents) < len(ids):
+                self.parents.append(parent)
+
+            if isinstance(command, Arc):
+                kind.append(CLOCKWISE if command.clockwise else COUNTERCLOCKWISE)
+                i, j = command.i, command.j
+            elif isinstance(command, Motion):
+                kind.append(LINEAR)
+                i, j = nan, nan
+            else:
+                kind.append(OTHER)
+                self.others[ix] = command
+                columns.append((nan,) * 6)
+                continue
+
+            columns.append(tuple(
+                nan if v is None else v
+                for v in (command.x, command.y, command.z, command.f, i, j)
+            ))
+
+        self.kind = np.array(kind, dtype=np.int8)
+        self.phase = np.array(phase, dtype=np.int32)
+        values = np.array(columns, dtype=np.float64).reshape((-1, 6))
+        self.x, self.y, self.z, self.f, self.i, self.j = values.T.copy()
+
+    @classmethod
+    def _from_columns(cls, other, **columns):
+        compiled = cls.__new__(cls)
+        compiled.__dict__.update(other.__dict__)
+        compiled.__dict__.update(columns)
+        return compiled
+
+    def __len__(self):
+        return len(self.kind)
+
+    def __add__(self, v):
+        if not isinstance(v, Vector):
+            return NotImplemented
+        return self._from_columns(self, x=self.x + v.x, y=self.y + v.y)
+
+    def commands(self):
+        def value(v):
+            return None if math.isnan(v) else float(v)
+
+        columns = zip(
+            self.kind.tolist(), self.phase.tolist(),
+            self.x.tolist(), self.y.tolist(), self.z.tolist(), self.f.tolist(),
+            self.i.tolist(), self.j.tolist()
+        )
+        for ix, (kind, phase, x, y, z, f, i, j) in enumerate(columns):
+            parent = self.parents[phase]
+            if kind == OTHER:
+                yield (parent, self.others[ix])
+            elif kind == LINEAR:
+                yield (parent, Motion(x=value(x), y=value(y), z=value(z), f=value(f)))
+            else:
+                arc = Arc(value(x), value(y), i, j, kind == CLOCKWISE, value(z), value(f))
+                yield (parent, arc)
+
+    def positions(self):
+        """ Absolute `(x, y, z)` tool positions after each command. """
+        return tuple(filled(column, 0.0) for column in (self.x, self.y, self.z))
+
+    def distances(self):
+        """ The distance travelled by each command. """
+        x, y, z = self.positions()
+        px, py, pz = previous(x, 0.0), previous(y, 0.0), previous(z, 0.0)
+        dz = z - pz
+        distance = np.sqrt((x - px) ** 2 + (y - py) ** 2 + dz ** 2)
+
+        arcs = (self.kind == CLOCKWISE) | (self.kind == COUNTERCLOCKWISE)
+        if arcs.any():
+            cx, cy = px + self.i, py + self.j
+            start = np.arctan2(py - cy, px - cx)
+            end = np.arctan2(y - cy, x - cx)
+            angle = np.where(self.kind == CLOCKWISE, start - end, end - start) % tau
+            angle = np.where(angle == 0, tau, angle)
+            length = np.hypot(self.i, self.j) * angle
+            distance = np.where(arcs, np.hypot(length, dz), distance)
+
+        distance[self.kind == OTHER] = 0
+        return distance
+
+    def time(self, machine=None):
+        if machine is not None and machine.kinematics is not None:
+            return super().time(machine)
+
+        feed = filled(self.f, 0.0)
+        moving = (self.kind != OTHER)
+        distance = self.distances()[moving]
+        return float(np.sum(distance / feed[moving]))
+
+    def gcode(self, f, precision=4):
+        from .gcode import Writer
+        writer = Writer(f, precision)
+
+        barriers = self.kind == OTHER
+        motion = ~barriers
+
+        def changes(values):
+            rounded = np.round(values, precision)
+            prior = previous(filled(rounded, barriers=barriers))
+            return motion & ~np.isnan(rounded) & ~(rounded == prior)
+
+        x, y, z = (changes(v) for v in (self.x, self.y, self.z))
+
+        # Linear moves that don't change any axis are dropped entirely, and so
+        # can't change the modal motion mode or feedrate either.
+        skipped = (self.kind == LINEAR) & ~(x | y | z)
+        active = motion & ~skipped
+
+        modes = np.where(active, self.kind.astype(np.float64), np.nan)
+        mode = active & (modes != previous(filled(modes, barriers=barriers)))
+        feeds = np.where(active, np.round(self.f, precision), np.nan)
+        feed = active & ~np.isnan(feeds) & \
+            (feeds != previous(filled(feeds, barriers=barriers)))
+
+        words = {LINEAR: 'G01', CLOCKWISE: 'G02', COUNTERCLOCKWISE: 'G03'}
+        number = writer.number
+        rows = zip(
+            self.kind.tolist(), barriers.tolist(), (active | barriers).tolist(),
+            mode.tolist(), x.tolist(), y.tolist(), z.tolist(), feed.tolist(),
+            self.x.tolist(), self.y.tolist(), self.z.tolist(), self.f.tolist(),
+            self.i.tolist(), self.j.tolist()
+        )
+        for ix, row in enumerate(rows):
+            kind, barrier, emit, m, dx, dy, dz, df, vx, vy, vz, vf, vi, vj = row
+            if not emit:
+                continue
+            if barrier:
+                writer.line(self.others[ix].gcode())
+                continue
+
+            parts = [words[kind]] if m else []
+            if dx: parts.append('X' + number(vx))
+            if dy: parts.append('Y' + number(vy))
+            if dz: parts.append('Z' + number(vz))
+            if kind != LINEAR:
+                parts.append('I' + number(vi))
+                parts.append('J' + number(vj))
+            if df: parts.append('F' + number(vf))
+            writer.line(' '.join(parts))
+        writer.flush()
+
+    def segments(self):
+        """
+        Start and end points of every move, with the index of its phase, as
+        arrays of shape `(n, 3)`, `(n, 3)` and `(n,)`.
+
+        """
+        x, y, z = self.positions()
+        end = np.stack([x, y, z], axis=1)
+        start = np.stack([previous(x, 0.0), previous(y, 0.0), previous(z, 0.0)], axis=1)
+        moving = self.kind != OTHER
+        return start[moving], end[moving], self.phase[moving]
+
+    def visualize(self, colors={}):
+        import pythreejs as js
+
+        start, end, phase = self.segments()
+        delta = start - end
+        middle = (start + end) / 2
+
+        def arrow(angle):
+            c, s = math.cos(angle), math.sin(angle)
+            rotated = np.stack([
+                delta[:, 0] * c - delta[:, 1] * s,
+                delta[:, 0] * s + delta[:, 1] * c,
+                delta[:, 2]
+            ], axis=1)
+            return middle + rotated * 0.1
+
+        lines = np.stack([
+            start, end, middle, arrow(tau / 16), middle, arrow(-tau / 16)
+        ], axis=1).reshape((-1, 3)).astype(np.float32)
+
+        palette = np.array(
+            [getattr(p, 'color', [0, 1, 0]) for p in self.parents] or [[0, 1, 0]],
+            dtype=np.float32
+        )
+        line_colors = np.repeat(palette[phase], 6, axis=0)
+
+        geometry = js.BufferGeometry(
+            attributes={
+                'position': js.BufferAttribute(lines, normalized=False),
+                'color': js.BufferAttribute(line_colors, normalized=False),
+            },
+        )
+        material = js.LineBasicMaterial(vertexColors='VertexColors', linewidth=1)
+        return js.LineSegments(geometry, material)
@@ -1,9 +1,13 @@
 import math
 
+from .link import StayDown, crosses
 from .motion import PlanarToolpath, CutSteps
+from .rest import Cleared, Swept, difference
+from .sequence import Sequenced
+from ..geometry import tau
 from ..util import frange
 
-from ..plane import Line, LineSegment, Point, Vector
+from ..plane import ComplexPolygon, Line, LineSegment, Point, Polygon, Vector
 from ..decompose import grouper
 
 from .. import units
@@ -103,27 +107,72 @@ class LinearStepFeed:
     A feed strategy using linear stepover along y-axis scanlines to remove the
     desired material.
 
+    When `sequence` is set, toolpaths are reordered with
+    :py:class:`~petrify.machine.sequence.Sequenced` to minimize rapid travel.
+    Only pocket scanlines may be reversed; every other toolpath keeps its
+    cutting direction.
+    When `stay_down` is set, pocket toolpaths are linked at depth with
+    :py:class:`~petrify.machine.link.StayDown` wherever that is safe.
+    When `arc_tolerance` is given, curved runs of every toolpath are cut as
+    arcs that stay within that distance of the original points.
+
     """
 
-    def __init__(self, stepover, dz):
+    def __init__(self, stepover, dz, sequence=False, stay_down=False, arc_tolerance=None):
         assert(stepover > 0 and stepover <= 1)
         assert(dz > 0)
         self.stepover = stepover
         self.dz = dz
+        self.sequence = sequence
+        self.stay_down = stay_down
+        self.arc_tolerance = arc_tolerance
+
+    def sequenced(self, toolpaths, reverse=False):
+        if not self.sequence:
+            return toolpaths
+        return Sequenced(toolpaths, reverse=reverse).toolpaths
+
+    def linking(self, configuration, pocket):
+        if not self.stay_down:
+            return None
+        tool = configuration.tool
+        return StayDown(pocket.polygon.offset(-tool.radius), tool.radius)
 
-    def step(self, configuration, toolpaths, shape):
+    def step(self, configuration, toolpaths, shape, linking=None, reverse=False):
         start = shape.start or self.dz
         assert start > 0
         steps = Steps(-start, -shape.depth, -self.dz)
-        return CutSteps(toolpaths, steps, configuration)
+        return CutSteps(
+            self.sequenced(toolpaths, reverse), steps, configuration,
+            linking, self.arc_tolerance
+        )
 
     def pocket(self, configuration, pocket):
         lines = self.scanlines(configuration, pocket)
         paths = [ScanlineToolpath(b) for b in batch_scanlines(lines)]
         paths = sorted(paths, key=lambda p: p.path[0].x)
-        return self.step(configuration, paths, pocket)
+        linking = self.linking(configuration, pocket)
+        return self.step(configuration, paths, pocket, linking, reverse=True)
+
+    def rest(self, configuration, pocket, prior):
+        """
+        Clears only the stock left in `pocket` after it was cut with a larger
+        `prior` tool.
+
+        """
+        tool = configuration.tool
+        if prior.radius <= tool.radius:
+            return self.step(configuration, [], pocket)
+
+        reached = pocket.polygon.offset(-prior.radius)
+        cleared = Cleared(reached, prior.radius - tool.radius)
+        lines = self.scanlines(configuration, pocket, cleared)
+        paths = [ScanlineToolpath(b) for b in batch_scanlines(lines)]
+        paths = sorted(paths, key=lambda p: p.path[0].x)
+        linking = self.linking(configuration, pocket)
+        return self.step(configuration, paths, pocket, linking, reverse=True)
 
-    def scanlines(self, configuration, pocket):
+    def scanlines(self, configuration, pocket, cleared=None):
         tool = configuration.tool
         off = pocket.polygon.offset(-tool.radius)
         bounds = [
@@ -143,6 +192,9 @@ class LinearStepFeed:
             scan = Line(Point(0, y), Vector(1, 0))
             intersects = [scan.intersect(l) for l in bounds]
             xs = sorted(i.x for i in intersects if i is not None)
+            if cleared is not None:
+                intervals = difference(grouper(2, xs), cleared.intervals(y))
+                xs = [x for interval in intervals for x in interval]
             points = (Point(x, y) for x in xs)
             scanlines.append([(a, b) for a, b in grouper(2, points)])
 
@@ -186,4 +238,266 @@ class LinearStepFeed:
         toolpaths = sorted(toolpaths, key=lambda p: p.path[0].x)
 
         steps = Steps(-engrave.depth, -engrave.depth, -self.dz)
-        return CutSteps(toolpaths, steps, configuration)
+        return CutSteps(
+            self.sequenced(toolpaths), steps, configuration,
+            arc_tolerance=self.arc_tolerance
+        )
+
+
+def nearest_rotation(points, p):
+    """ Rotates a closed loop of `points` to start at the vertex nearest `p`. """
+    distance = lambda ix: (points[ix] - p).magnitude_squared()
+    ix = min(range(len(points)), key=distance)
+    return [*points[ix:], *points[:ix]]
+
+def clear_contours(level):
+    """
+    Offsets are computed separately for each simple polygon, so growing holes
+    can sweep past the shrinking outer boundary. Only contours that still lie
+    within the remaining pocket are kept; the stock around any that are
+    dropped is left to :py:meth:`ContourStepFeed.leftover`.
+
+    """
+    def within(polygons, points):
+        return [any(c) for c in zip(*(p.contains_many(points) for p in polygons))]
+
+    interior = [
+        i for i in level.interior
+        if level.exterior and all(within(level.exterior, i.points))
+    ]
+    exterior = [
+        e for e in level.exterior
+        if not level.interior or not any(within(level.interior, e.points))
+    ]
+    return ComplexPolygon(interior=interior, exterior=exterior)
+
+class ContourToolpath(PlanarToolpath):
+    """ A toolpath formed from nested offset contours, cut outside-in. """
+    def __init__(self, level, loop):
+        super().__init__(loop[0])
+        self.level = level
+        self.windings = []
+        self.trace(loop)
+
+    def trace(self, loop):
+        self.windings.append((len(self.path) - 1, Polygon(loop).clockwise()))
+        for p in loop[1:]:
+            self.move_to(p)
+        self.move_to(loop[0])
+
+    def link(self, level, loop):
+        loop = nearest_rotation(loop, self.current)
+        if loop[0] != self.current:
+            self.move_to(loop[0])
+        self.level = level
+        self.trace(loop)
+
+    def loops(self):
+        """
+        Splits this path into the contours it traces, each with the move on to
+        the next, and whether that contour winds clockwise.
+
+        """
+        ends = [ix for ix, _ in self.windings[1:]] + [len(self.path) - 1]
+        return [
+            (self.path[start:end + 1], clockwise)
+            for (start, clockwise), end in zip(self.windings, ends)
+        ]
+
+class ContourStepFeed(LinearStepFeed):
+    """
+    A feed strategy using concentric inward offsets of the pocket boundary,
+    linked together into continuous spiral-like toolpaths. Outlines and
+    engravings are cut identically to :py:class:`LinearStepFeed`.
+
+    Islands are offset separately from the boundary, so contours stop where
+    they collide. Any stock the contours cannot reach is then cleared with
+    scanlines, as with :py:class:`LinearStepFeed`.
+
+    """
+
+    def pocket(self, configuration, pocket):
+        return self.clear(configuration, pocket, self.contours(configuration, pocket))
+
+    def clear(self, configuration, pocket, contours):
+        paths = [
+            *self.passes(configuration, contours),
+            *self.leftover(configuration, pocket, contours)
+        ]
+        linking = self.linking(configuration, pocket)
+        return self.step(configuration, paths, pocket, linking)
+
+    def passes(self, configuration, contours):
+        """ The toolpaths that cut along each of `contours`. """
+        return contours
+
+    def reach(self, tool):
+        """ Distance from a contour within which its pass clears all stock. """
+        return tool.radius
+
+    def leftover(self, configuration, pocket, contours):
+        """ Scanlines over the stock in `pocket` that `contours` cannot reach. """
+        tool = configuration.tool
+        # Stock lies at most half a stepover from the nearest scanline, so a
+        # scanline may only be skipped where that is still within reach.
+        distance = self.reach(tool) - self.stepover * tool.diameter / 2
+        swept = Swept((s for c in contours for s in c.segments()), distance)
+        lines = self.scanlines(configuration, pocket, swept)
+        return [ScanlineToolpath(b) for b in batch_scanlines(lines)]
+
+    def first(self, tool):
+        """ Distance from the pocket boundary to the outermost contour. """
+        return tool.radius
+
+    def spacing(self, tool):
+        """ Distance between successive contours. """
+        return self.stepover * tool.diameter
+
+    def levels(self, configuration, pocket):
+        tool = configuration.tool
+        stepover = self.spacing(tool)
+
+        size = pocket.polygon.envelope().size
+        deepest = min(size.x, size.y) / 2
+        amounts = [-a for a in frange(self.first(tool), deepest, stepover)]
+
+        levels = []
+        for level in pocket.polygon.offsets(amounts):
+            level = clear_contours(level)
+            if not level.polygons:
+                break
+            levels.append(level)
+
+        # Whatever stock is left inside the final contour is less than one
+        # stepover wide; a half-step contour keeps it within reach of the tool.
+        if levels:
+            final = amounts[len(levels) - 1] - (stepover / 2)
+            tail = clear_contours(pocket.polygon.offset(final))
+            if tail.polygons:
+                levels.append(tail)
+
+        return levels
+
+    def contours(self, configuration, pocket):
+        levels = self.levels(configuration, pocket)
+
+        paths = []
+        for depth, level in enumerate(levels):
+            # Paths ending on the enclosing contour can step straight inwards
+            # to the next one, as long as that move stays within the contour.
+            available = [p for p in paths if p.level == depth - 1]
+            for polygon in level.polygons:
+                loop = list(polygon.points)
+
+                def distance(path):
+                    return min((q - path.current).magnitude_squared() for q in loop)
+
+                linked = None
+                for path in sorted(available, key=distance):
+                    start = nearest_rotation(loop, path.current)[0]
+                    if not crosses(levels[depth - 1], path.current, start):
+                        linked = path
+                        break
+
+                if linked is None:
+                    paths.append(ContourToolpath(depth, loop))
+                else:
+                    available.remove(linked)
+                    linked.link(depth, loop)
+
+        return paths
+
+
+def trochoid(path, radius, advance, segments=16, clockwise=False):
+    """
+    Follows `path` with small circular loops of the given `radius`, moving
+    forward by `advance` along the path with each loop. Loops turn
+    counter-clockwise unless `clockwise` is set.
+
+    """
+    lengths = [(b - a).magnitude() for a, b in zip(path, path[1:])]
+    total = sum(lengths)
+    if total == 0:
+        return list(path)
+
+    loops = math.ceil(total / advance)
+    steps = loops * segments
+
+    points = []
+    ix, start = 0, 0
+    for step in range(steps + 1):
+        s = total * step / steps
+        while ix < len(lengths) - 1 and start + lengths[ix] < s:
+            start += lengths[ix]
+            ix += 1
+        u = 0 if lengths[ix] == 0 else min(1, (s - start) / lengths[ix])
+        center = path[ix] + (path[ix + 1] - path[ix]) * u
+        angle = (-tau if clockwise else tau) * step / segments
+        points.append(center + Vector(math.cos(angle), math.sin(angle)) * radius)
+    return points
+
+class TrochoidalStepFeed(ContourStepFeed):
+    """
+    A constant-engagement feed strategy for pockets. Contour-parallel paths
+    like those of :py:class:`ContourStepFeed` are followed with small circular
+    loops, so the tool only ever bites into a sliver of fresh stock instead
+    of cutting full-width slots at entry and in corners. That allows much
+    more aggressive :py:class:`Speed` settings.
+
+    The `loop` radius and the `advance` made by each loop are fractions of
+    the tool diameter; `advance` bounds the radial engagement. Each band
+    cleared by a contour is `1 + 2 * loop` diameters wide, and adjacent
+    contours are `stepover + 2 * loop` diameters apart, so bands overlap by
+    `1 - stepover` of the diameter. Loops turn the same way as the contour
+    they follow.
+
+    Pockets too narrow for the loops are cleared with plain contours, using
+    the same options. Stock left between contours that collide with islands
+    is cleared with plain scanlines.
+
+    """
+
+    def __init__(self, stepover, dz, loop=0.25, advance=0.1, **options):
+        super().__init__(stepover, dz, **options)
+        assert(loop > 0)
+        assert(advance > 0 and advance <= 1)
+        self.loop = loop
+        self.advance = advance
+
+    def first(self, tool):
+        return tool.radius + self.loop * tool.diameter
+
+    def spacing(self, tool):
+        return 2 * self.loop * tool.diameter + self.stepover * tool.diameter
+
+    def plain(self):
+        """ The :py:class:`ContourStepFeed` used for pockets too narrow to loop. """
+        return ContourStepFeed(
+            self.stepover, self.dz, sequence=self.sequence,
+            stay_down=self.stay_down, arc_tolerance=self.arc_tolerance
+        )
+
+    def pocket(self, configuration, pocket):
+        contours = self.contours(configuration, pocket)
+        if not contours:
+            return self.plain().pocket(configuration, pocket)
+        return self.clear(configuration, pocket, contours)
+
+    def reach(self, tool):
+        return tool.radius + self.loop * tool.diameter
+
+    def passes(self, configuration, contours):
+        tool = configuration.tool
+        radius = self.loop * tool.diameter
+        advance = self.advance * tool.diameter
+
+        looped = []
+        for path in contours:
+            p = PlanarToolpath(None)
+            p.path = []
+            for loop, clockwise in path.loops():
+                points = trochoid(loop, radius, advance, clockwise=clockwise)
+                # Each loop ends where the next one starts.
+                p.path.extend(points[1:] if p.path else points)
+            looped.append(p)
+        return looped
@@ -0,0 +1,368 @@
+"""
+Three-dimensional finishing of a :py:class:`~petrify.machine.surface.Surface`.
+
+Tool-center heights come from "drop-cutter" queries: the tool is dropped
+along z at a given xy position until it first touches the mesh. For a flat
+:py:class:`~petrify.machine.tool.StraightTip` of radius 1 over a unit box:
+
+>>> from petrify.solid import Box
+>>> from petrify.space import Point, Vector
+>>> dropped = Dropped(Box(Point(0, 0, 0), Vector(1, 1, 1)), FlatCutter(1.0))
+>>> dropped.height(0.5, 0.5)
+1.0
+>>> dropped.height(1.5, 0.5)
+1.0
+>>> dropped.height(2.5, 0.5) is None
+True
+
+"""
+import math
+
+from ..index import BoxGrid
+from ..space import Point
+from ..util import frange
+from .motion import Cut, Motion
+from .slice import chain
+from .tool import StraightTip, VBit
+
+def triangles(polygons):
+    for polygon in polygons:
+        points = polygon.points
+        for ix in range(1, len(points) - 1):
+            yield (points[0], points[ix], points[ix + 1])
+
+def inside(triangle, x, y):
+    a, b, c = triangle
+    d1 = (b.x - a.x) * (y - a.y) - (b.y - a.y) * (x - a.x)
+    d2 = (c.x - b.x) * (y - b.y) - (c.y - b.y) * (x - b.x)
+    d3 = (a.x - c.x) * (y - c.y) - (a.y - c.y) * (x - c.x)
+    negative = d1 < 0 or d2 < 0 or d3 < 0
+    positive = d1 > 0 or d2 > 0 or d3 > 0
+    return not (negative and positive)
+
+class FlatCutter:
+    """ Drop-cutter queries for a flat-bottomed tool of the given `radius`. """
+    def __init__(self, radius):
+        self.radius = radius
+
+    def clip(self, a, b, x, y):
+        """ Where the segment `ab` enters and leaves the tool's footprint. """
+        dx, dy = b.x - a.x, b.y - a.y
+        fx, fy = a.x - x, a.y - y
+        qa = dx * dx + dy * dy
+        qb = 2 * (fx * dx + fy * dy)
+        qc = fx * fx + fy * fy - self.radius ** 2
+        if qa == 0:
+            return [] if qc > 0 else [0.0]
+        discriminant = qb * qb - 4 * qa * qc
+        if discriminant < 0:
+            return []
+        root = math.sqrt(discriminant)
+        t0, t1 = (-qb - root) / (2 * qa), (-qb + root) / (2 * qa)
+        if t1 < 0 or t0 > 1:
+            return []
+        return [max(0.0, t0), min(1.0, t1)]
+
+    def drop(self, triangle, x, y):
+        """
+        The height at which the tool centered at (`x`, `y`) first touches
+        `triangle`, or `None` if it never does.
+
+        """
+        heights = []
+        for a, b in zip(triangle, (*triangle[1:], triangle[0])):
+            for t in self.clip(a, b, x, y):
+                heights.append(a.z + (b.z - a.z) * t)
+
+        # The facet itself can peak inside the footprint, either towards its
+        # uphill direction or, when level, anywhere beneath the tool.
+        a, b, c = triangle
+        u, v = b - a, c - a
+        n = u.cross(v)
+        if n.z != 0:
+            gx, gy = -n.x / n.z, -n.y / n.z
+            g = math.hypot(gx, gy)
+            px, py = (x, y) if g == 0 else (x + self.radius * gx / g, y + self.radius * gy / g)
+            if inside(triangle, px, py):
+                heights.append(a.z + gx * (px - a.x) + gy * (py - a.y))
+
+        return max(heights) if heights else None
+
+class ConeCutter(FlatCutter):
+    """
+    Drop-cutter queries for a conical tool of the given `radius`, whose
+    surface rises `slope` for each unit of distance from its tip:
+
+    >>> from petrify.solid import Box
+    >>> from petrify.space import Vector
+    >>> dropped = Dropped(Box(Point(0, 0, 0), Vector(1, 1, 1)), ConeCutter(1.0, 1.0))
+    >>> dropped.height(0.5, 0.5)
+    1.0
+    >>> dropped.height(1.5, 0.5)
+    0.5
+
+    """
+    def __init__(self, radius, slope):
+        super().__init__(radius)
+        self.slope = slope
+
+    def below(self, p, x, y):
+        """ The tip height at which the cone centered at (`x`, `y`) touches `p`. """
+        return p.z - self.slope * math.hypot(p.x - x, p.y - y)
+
+    def drop(self, triangle, x, y):
+        """
+        The height at which the tip of the tool centered at (`x`, `y`) first
+        touches `triangle`, or `None` if it never does.
+
+        """
+        k = self.slope
+        heights = []
+        for a, b in zip(triangle, (*triangle[1:], triangle[0])):
+            ts = self.clip(a, b, x, y)
+            if not ts:
+                continue
+            # Along the edge, height less the cone is concave; its peak is
+            # where the edge climbs as steeply as the cone's side.
+            dx, dy = b.x - a.x, b.y - a.y
+            length = math.hypot(dx, dy)
+            if length > 0:
+                m = (b.z - a.z) / length
+                if abs(m) < k:
+                    along = ((x - a.x) * dx + (y - a.y) * dy) / length
+                    across = abs((x - a.x) * dy - (y - a.y) * dx) / length
+                    peak = (along + across * m / math.sqrt(k * k - m * m)) / length
+                    ts.append(min(max(peak, ts[0]), ts[-1]))
+            for t in ts:
+                heights.append(self.below(a + (b - a) * t, x, y))
+
+        # A facet shallower than the cone touches its tip; a steeper one
+        # touches the rim on its uphill side.
+        a, b, c = triangle
+        u, v = b - a, c - a
+        n = u.cross(v)
+        if n.z != 0:
+            gx, gy = -n.x / n.z, -n.y / n.z
+            g = math.hypot(gx, gy)
+            px, py = (x, y) if g <= k else (x + self.radius * gx / g, y + self.radius * gy / g)
+            if inside(triangle, px, py):
+                z = a.z + gx * (px - a.x) + gy * (py - a.y)
+                heights.append(z - k * math.hypot(px - x, py - y))
+
+        return max(heights) if heights else None
+
+def cutter(tool):
+    """ The drop-cutter model for a `tool`. """
+    if isinstance(tool, StraightTip):
+        return FlatCutter(tool.radius)
+    if isinstance(tool, VBit):
+        return ConeCutter(tool.radius, tool.depth(1.0))
+    raise ValueError("no drop-cutter for {0}".format(type(tool).__name__))
+
+class Dropped:
+    """
+    Drop-cutter queries of a `cutter` against a `solid`, with its triangles
+    bucketed in a grid so each query only considers those under the tool.
+
+    """
+    def __init__(self, solid, cutter):
+        self.cutter = cutter
+        tris = list(triangles(solid.polygons))
+
+        def bounds(t):
+            xs, ys = [p.x for p in t], [p.y for p in t]
+            return (min(xs), min(ys), max(xs), max(ys), t)
+
+        boxes = [bounds(t) for t in tris]
+        if boxes:
+            area = (
+                (max(b[2] for b in boxes) - min(b[0] for b in boxes)) *
+                (max(b[3] for b in boxes) - min(b[1] for b in boxes))
+            )
+            size = max(math.sqrt(area / len(boxes)), cutter.radius)
+        else:
+            size = 1.0
+        self.grid = BoxGrid(boxes, size or 1.0)
+
+    def height(self, x, y):
+        r = self.cutter.radius
+        nearby = self.grid.query(x - r, y - r, x + r, y + r)
+        heights = (self.cutter.drop(t, x, y) for t in nearby)
+        heights = [h for h in heights if h is not None]
+        return max(heights) if heights else None
+
+class SurfaceCut(Cut):
+    """
+    Cuts each of `passes`, sequences of three-dimensional points, retracting
+    to the machine clearance between them.
+
+    """
+    def __init__(self, passes, configuration):
+        self.passes = passes
+        self.configuration = configuration
+
+    def commands(self):
+        m = self.configuration.machine
+        s = self.configuration.speeds.to(m.format)
+        clearance = m.clearance.m_as(self.configuration.units)
+
+        for path in self.passes:
+            start = path[0]
+            yield (self, Motion(z=clearance, f=s.z))
+            yield (self, Motion(x=start.x, y=start.y, f=s.xy))
+            yield (self, Motion(z=start.z, f=s.z))
+            for p in path[1:]:
+                yield (self, Motion(x=p.x, y=p.y, z=p.z, f=s.xy))
+        if self.passes:
+            yield (self, Motion(z=clearance, f=s.z))
+
+def extent(surface, margin):
+    e = surface.solid.envelope()
+    return (
+        e.origin.x - margin, e.origin.y - margin,
+        e.extent.x + margin, e.extent.y + margin
+    )
+
+class RasterFinish:
+    """
+    Finishes a surface with parallel passes along x, spaced by `stepover` and
+    sampled every `resolution` (both fractions of the tool diameter),
+    following the surface at each sample.
+
+    """
+    def __init__(self, stepover, resolution=0.1):
+        assert(stepover > 0 and stepover <= 1)
+        assert(resolution > 0)
+        self.stepover = stepover
+        self.resolution = resolution
+
+    def surface(self, configuration, surface):
+        tool = configuration.tool
+        dropped = Dropped(surface.solid, cutter(tool))
+        x0, y0, x1, y1 = extent(surface, tool.radius)
+
+        def z(x, y):
+            h = dropped.height(x, y)
+            floor = surface.bottom
+            return max(floor if h is None else h, floor) - surface.top
+
+        xs = list(frange(x0, x1, self.resolution * tool.diameter, inclusive=True))
+        passes = []
+        for ix, y in enumerate(frange(y0, y1, self.stepover * tool.diameter, inclusive=True)):
+            row = xs if ix % 2 == 0 else list(reversed(xs))
+            path = [Point(x, y, z(x, y)) for x in row]
+            passes.append(simplify(stepped(path)))
+        # Rows are cut separately, as the link between them is never checked
+        # against the surface.
+        return SurfaceCut(passes, configuration)
+
+def stepped(path):
+    """
+    Inserts a corner between neighbouring samples of differing heights, so
+    the tool climbs before moving over and moves over before descending,
+    rather than cutting diagonally into a wall between them.
+
+    """
+    if not path:
+        return path
+    stepped = [path[0]]
+    for p, q in zip(path, path[1:]):
+        if q.z > p.z:
+            stepped.append(Point(p.x, p.y, q.z))
+        elif q.z < p.z:
+            stepped.append(Point(q.x, q.y, p.z))
+        stepped.append(q)
+    return stepped
+
+class WaterlineFinish:
+    """
+    Finishes a surface with closed contours at constant heights every `dz`,
+    tracing where the tool just touches the surface. Contours are traced over
+    a grid of drop-cutter heights sampled every `resolution` (a fraction of
+    the tool diameter).
+
+    """
+    def __init__(self, dz, resolution=0.1):
+        assert(dz > 0)
+        assert(resolution > 0)
+        self.dz = dz
+        self.resolution = resolution
+
+    def surface(self, configuration, surface):
+        tool = configuration.tool
+        dropped = Dropped(surface.solid, cutter(tool))
+        step = self.resolution * tool.diameter
+        x0, y0, x1, y1 = extent(surface, tool.radius + step)
+
+        xs = list(frange(x0, x1, step, inclusive=True))
+        ys = list(frange(y0, y1, step, inclusive=True))
+        heights = [[dropped.height(x, y) for x in xs] for y in ys]
+        heights = [[-math.inf if h is None else h for h in row] for row in heights]
+
+        passes = []
+        for level in frange(surface.top - self.dz, surface.bottom, -self.dz, inclusive=True):
+            for loop in contours(xs, ys, heights, level):
+                loop = [Point(p.x, p.y, level - surface.top) for p in loop]
+                passes.append([*loop, loop[0]])
+        return SurfaceCut(passes, configuration)
+
+def simplify(path):
+    """ Drops points lying on the straight line between their neighbors. """
+    kept = path[:1]
+    for p, q in zip(path[1:], path[2:]):
+        a = kept[-1]
+        if (p - a).cross(q - p).magnitude_squared() > 1e-18:
+            kept.append(p)
+    return kept + path[-1:] if len(path) > 1 else kept
+
+def contours(xs, ys, heights, level):
+    """
+    Traces closed loops around grid cells whose `heights` reach `level`, with
+    marching squares. Loops run counterclockwise around the higher region.
+
+    """
+    def above(i, j):
+        return heights[j][i] >= level
+
+    def crossing(a, b):
+        # Interpolate from the lower-indexed corner so neighbouring cells
+        # produce identical points.
+        (i0, j0), (i1, j1) = sorted((a, b))
+        h0, h1 = heights[j0][i0], heights[j1][i1]
+        t = 0.5 if h0 == h1 or math.isinf(h0) or math.isinf(h1) else (level - h0) / (h1 - h0)
+        return Point(
+            xs[i0] + (xs[i1] - xs[i0]) * t,
+            ys[j0] + (ys[j1] - ys[j0]) * t,
+            0
+        )
+
+    segments = []
+    for j in range(len(ys) - 1):
+        for i in range(len(xs) - 1):
+            corners = [(i, j), (i + 1, j), (i + 1, j + 1), (i, j + 1)]
+            inside = [above(*c) for c in corners]
+            if all(inside) or not any(inside):
+                continue
+
+            exits, entries = [], []
+            for k in range(4):
+                a, b = corners[k], corners[(k + 1) % 4]
+                if inside[k] and not inside[(k + 1) % 4]:
+                    exits.append((k, crossing(a, b)))
+                elif inside[(k + 1) % 4] and not inside[k]:
+                    entries.append((k, crossing(a, b)))
+
+            if len(exits) == 2:
+                # Saddle: join the high corners through the middle of the
+                # cell if it is high too, otherwise keep them apart.
+                center = sum(heights[cj][ci] for ci, cj in corners) / 4
+                joined = center >= level
+                for k, p in exits:
+                    following = [(e - k) % 4 for e, _ in entries]
+                    pick = min if joined else max
+                    e = entries[following.index(pick(following))][1]
+                    segments.append((p, e))
+            else:
+                segments.append((exits[0][1], entries[0][1]))
+
+    return chain(segments)
@@ -0,0 +1,100 @@
+"""
+Streams machine commands out as compact G-code:
+
+>>> import io
+>>> out = io.StringIO()
+>>> writer = Writer(out, precision=3)
+>>> writer.write(Motion(x=1.0, y=2.0, f=900))
+>>> writer.write(Motion(x=1.5, y=2.0, f=900))
+>>> writer.write(Motion(z=-0.12345, f=200))
+>>> writer.flush()
+>>> print(out.getvalue(), end='')
+G01 X1 Y2 F900
+X1.5
+Z-0.123 F200
+
+Motion mode, feedrate, and axis words are modal, so each is only written when
+it differs from the machine's current state at the configured `precision`.
+Lines are collected and written to `f` in chunks of `chunk` lines.
+
+"""
+from .motion import Arc, Motion
+
+class Writer:
+    def __init__(self, f, precision=4, chunk=4096):
+        self.f = f
+        self.spec = '.{0}f'.format(precision)
+        self.chunk = chunk
+        self.lines = []
+        self.reset()
+
+    def reset(self):
+        """ Forgets all modal state, forcing every word to be written again. """
+        self.mode = None
+        self.axes = {}
+        self.feed = None
+
+    def number(self, v):
+        s = format(v, self.spec)
+        if '.' in s:
+            s = s.rstrip('0').rstrip('.')
+        return '0' if s == '-0' else s
+
+    def line(self, line):
+        self.lines.append(line)
+        if len(self.lines) >= self.chunk:
+            self.flush()
+
+    def flush(self):
+        if self.lines:
+            self.f.write('\n'.join(self.lines))
+            self.f.write('\n')
+            self.lines = []
+
+    def motion(self, command):
+        arc = isinstance(command, Arc)
+        if arc:
+            mode = 'G02' if command.clockwise else 'G03'
+        else:
+            mode = 'G01'
+
+        words = []
+        for axis, v in (('X', command.x), ('Y', command.y), ('Z', command.z)):
+            if v is not None:
+                s = self.number(v)
+                if self.axes.get(axis) != s:
+                    self.axes[axis] = s
+                    words.append(axis + s)
+
+        if arc:
+            words.append('I' + self.number(command.i))
+            words.append('J' + self.number(command.j))
+        elif not words:
+            # The tool is already here; there's nothing to move.
+            return
+
+        if mode != self.mode:
+            self.mode = mode
+            words.insert(0, mode)
+
+        if command.f is not None:
+            f = self.number(command.f)
+            if f != self.feed:
+                self.feed = f
+                words.append('F' + f)
+        assert self.feed is not None
+
+        self.line(' '.join(words))
+
+    def write(self, command):
+        if isinstance(command, Motion):
+            self.motion(command)
+        else:
+            # Other commands may change machine state in ways we don't track.
+            self.line(command.gcode())
+            self.reset()
+
+    def write_all(self, commands):
+        for _, command in commands:
+            self.write(command)
+        self.flush()
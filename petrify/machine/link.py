@@ -0,0 +1,61 @@
+import math
+
+from ..plane import LineSegment
+
+def crosses(boundary, a, b):
+    """
+    Checks whether moving straight from `a` to `b` crosses any segment of
+    the `boundary` anywhere other than the endpoints of the move.
+
+    """
+    if a == b:
+        return False
+    move = LineSegment(a, b)
+    for segment in boundary.segments():
+        i = move.intersect(segment)
+        if i is not None and i != a and i != b:
+            return True
+    return False
+
+def distance_squared(p, a, b):
+    """ Squared distance from point `p` to the segment between `a` and `b`. """
+    vx, vy = b.x - a.x, b.y - a.y
+    wx, wy = p.x - a.x, p.y - a.y
+    d = vx * vx + vy * vy
+    u = 0 if d == 0 else max(0, min(1, (wx * vx + wy * vy) / d))
+    dx, dy = wx - u * vx, wy - u * vy
+    return dx * dx + dy * dy
+
+class StayDown:
+    """
+    Links successive toolpaths at cutting depth instead of retracting to the
+    clearance plane.
+
+    A link is only made when the straight move between toolpaths stays within
+    the tool-center `boundary` (usually the pocket offset by the tool radius)
+    and every point along it is within `radius` of a path already cut at the
+    current depth, so the tool never plows through uncut stock.
+
+    """
+    def __init__(self, boundary, radius):
+        self.boundary = boundary
+        self.radius = radius
+
+    def covered(self, p, cleared):
+        r2 = self.radius ** 2
+        return any(distance_squared(p, a, b) <= r2 for a, b in cleared)
+
+    def connects(self, a, b, cleared):
+        if a == b:
+            return True
+        if crosses(self.boundary, a, b):
+            return False
+
+        count = max(2, math.ceil((b - a).magnitude() / (self.radius / 2)))
+        samples = [a + (b - a) * (ix / count) for ix in range(1, count)]
+        inside = [False] * len(samples)
+        for e in self.boundary.exterior:
+            inside = [i or c for i, c in zip(inside, e.contains_many(samples))]
+        for h in self.boundary.interior:
+            inside = [i and not c for i, c in zip(inside, h.contains_many(samples))]
+        return all(inside) and all(self.covered(p, cleared) for p in samples)
@@ -1,3 +1,5 @@
+import math
+
 from ..geometry import tau
 from ..generic import Point
 from ..plane import Line, LineSegment, Vector
@@ -88,6 +90,13 @@ class Motion:
             f=other.f or self.f
         )
 
+    def distance(self, state):
+        """ The distance travelled moving from a prior `state`. """
+        end = state.merge(self)
+        return (
+            Point(end.x, end.y, end.z) - Point(state.x, state.y, state.z)
+        ).magnitude()
+
     def gcode(self):
         assert(self.f is not None)
         parts = ['G01']
@@ -97,6 +106,48 @@ class Motion:
         parts.append('F{0}'.format(self.f))
         return ' '.join(parts)
 
+class Arc(Motion):
+    """
+    A circular move in the XY plane to (`x`, `y`) around a center offset
+    (`i`, `j`) from the starting position, optionally changing `z` along the
+    way to form a helix.
+
+    """
+    def __init__(self, x, y, i, j, clockwise, z=None, f=None):
+        super().__init__(x=x, y=y, z=z, f=f)
+        self.i = i
+        self.j = j
+        self.clockwise = clockwise
+
+    def __add__(self, v):
+        if not isinstance(v, Vector):
+            return NotImplemented
+        return Arc(self.x + v.x, self.y + v.y, self.i, self.j, self.clockwise, self.z, self.f)
+
+    def __repr__(self):
+        return "Arc(x={0.x}, y={0.y}, i={0.i}, j={0.j}, clockwise={0.clockwise})".format(self)
+
+    def distance(self, state):
+        cx, cy = state.x + self.i, state.y + self.j
+        r = math.hypot(self.i, self.j)
+        start = math.atan2(state.y - cy, state.x - cx)
+        end = math.atan2(self.y - cy, self.x - cx)
+        angle = (start - end if self.clockwise else end - start) % tau
+        length = r * (angle or tau)
+        dz = (self.z - state.z) if self.z is not None else 0
+        return math.hypot(length, dz)
+
+    def gcode(self):
+        assert(self.f is not None)
+        parts = ['G02' if self.clockwise else 'G03']
+        parts.append('X{0}'.format(self.x))
+        parts.append('Y{0}'.format(self.y))
+        if self.z: parts.append('Z{0}'.format(self.z))
+        parts.append('I{0}'.format(self.i))
+        parts.append('J{0}'.format(self.j))
+        parts.append('F{0}'.format(self.f))
+        return ' '.join(parts)
+
 class Cut:
     def props(self, **props):
         return AnnotatedPhase(self, props)
@@ -104,22 +155,45 @@ class Cut:
     def then(self, other):
         return Sequence([self, other])
 
-    def gcode(self, f):
-        for parent, command in self.commands():
-            f.write(command.gcode())
-            f.write('\n')
+    def compile(self):
+        """
+        Compiles the commands of this cut into a columnar
+        :py:class:`~petrify.machine.compiled.Compiled` cut.
+
+        """
+        from .compiled import Compiled
+        return Compiled(self.commands())
+
+    def gcode(self, f, precision=4):
+        """
+        Writes this cut to `f` as G-code, with coordinates rounded to the given
+        `precision` and modal words only written when they change.
+
+        """
+        from .gcode import Writer
+        Writer(f, precision).write_all(self.commands())
+
+    def time(self, machine=None):
+        """
+        Estimates the time taken by this cut, in the time units of its
+        feedrates. When a `machine` with
+        :py:class:`~petrify.machine.tool.Kinematics` is given, acceleration
+        and cornering are accounted for; otherwise every move is assumed to
+        run at its full feedrate.
+
+        """
+        if machine is not None and machine.kinematics is not None:
+            from .timing import estimate
+            acceleration, deviation = machine.kinematics.to(machine.format)
+            return estimate(self.commands(), acceleration, deviation)
 
-    def time(self):
         state = Motion(0, 0, 0, 0)
         dt = 0
         for (parent, cmd) in self.commands():
             if isinstance(cmd, Motion):
-                prior = Point(state.x, state.y, state.z)
+                d = cmd.distance(state)
                 state = state.merge(cmd)
-                fr = state.f
-                cur = Point(state.x, state.y, state.z)
-                d = (cur - prior).magnitude()
-                dt += (d / fr)
+                dt += (d / state.f)
 
         return dt
 
@@ -170,10 +244,28 @@ class AnnotatedPhase(Cut):
         return ((self, command) for _, command in self.inner.commands())
 
 class CutSteps(Cut):
-    def __init__(self, passes, steps, configuration):
+    """
+    Cuts every pass at each of the given depth `steps`. By default the tool
+    retracts to the machine clearance between passes; an optional `linking`
+    strategy (see :py:class:`~petrify.machine.link.StayDown`) can instead
+    keep the tool at depth when moving between them.
+
+    When `arc_tolerance` is given, runs of points along each pass that lie on
+    a circle are cut as arcs (see :py:mod:`~petrify.machine.arc`).
+
+    """
+    def __init__(self, passes, steps, configuration, linking=None, arc_tolerance=None):
         self.passes = passes
         self.steps = steps
         self.configuration = configuration
+        self.linking = linking
+        self.arc_tolerance = arc_tolerance
+
+    def moves(self, path, f):
+        if self.arc_tolerance is None:
+            return (Motion(x=point.x, y=point.y, f=f) for point in path[1:])
+        from . import arc
+        return arc.moves(path, self.arc_tolerance, f)
 
     def commands(self):
         m = self.configuration.machine
@@ -181,15 +273,44 @@ class CutSteps(Cut):
 
         clearance = m.clearance.m_as(self.configuration.units)
 
+        # With linking, the tool position at depth and the segments already
+        # cut at the current (or, between steps, the previous) depth.
+        position = None
+        depth = None
+        previous = []
+
         for step in self.steps:
+            cleared = []
             for p in self.passes:
                 path = p.path
-                yield (self, Motion(z=clearance, f=s.z))
-                yield (self, Motion(x=path[0].x, y=path[0].y, f=s.xy))
-                yield (self, Motion(z=step, f=s.z))
-                for point in path[1:]:
-                    yield (self, Motion(x=point.x, y=point.y, f=s.xy))
-                yield (self, Motion(z=clearance, f=s.z))
+                linked = (
+                    position is not None and
+                    self.linking.connects(position, path[0], cleared or previous)
+                )
+                if linked:
+                    yield (self, Motion(x=path[0].x, y=path[0].y, f=s.xy))
+                    if depth == step:
+                        cleared.append((position, path[0]))
+                    else:
+                        # Linked at the previous depth, so nothing was cut
+                        # at this one.
+                        yield (self, Motion(z=step, f=s.z))
+                else:
+                    yield (self, Motion(z=clearance, f=s.z))
+                    yield (self, Motion(x=path[0].x, y=path[0].y, f=s.xy))
+                    yield (self, Motion(z=step, f=s.z))
+                for motion in self.moves(path, s.xy):
+                    yield (self, motion)
+
+                if self.linking is None:
+                    yield (self, Motion(z=clearance, f=s.z))
+                else:
+                    cleared.extend(zip(path, path[1:]))
+                    position, depth = path[-1], step
+            previous = cleared
+
+        if position is not None:
+            yield (self, Motion(z=clearance, f=s.z))
 
 class Batch(Cut):
     def __init__(self, phases):
@@ -0,0 +1,118 @@
+"""
+Rest machining support: finding where a smaller tool still has stock to remove
+after a larger tool has already cleared a pocket.
+
+A tool of radius `R` sweeps the pocket offset inwards by `R`, then grown back
+out by `R`. A smaller tool of radius `r` centered within `R - r` of that inward
+offset only ever touches stock the larger tool already removed, so only tool
+centers outside that distance need to be cut:
+
+>>> square = Polygon([Point(0, 0), Point(0, 4), Point(4, 4), Point(4, 0)])
+>>> cleared = Cleared(square.offset(-1), 0.75)
+>>> cleared.intervals(2)
+[(0.25, 3.75)]
+>>> [(round(a, 3), round(b, 3)) for a, b in cleared.intervals(0.5)]
+[(0.441, 3.559)]
+
+"""
+import math
+
+from ..geometry import quantum
+from ..plane import Line, Point, Polygon, Vector
+
+def merge(intervals):
+    """ Merges overlapping `intervals`, returning them in sorted order. """
+    merged = []
+    for a, b in sorted(intervals):
+        if merged and a <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], b))
+        else:
+            merged.append((a, b))
+    return merged
+
+def difference(intervals, holes):
+    """
+    Removes sorted, non-overlapping `holes` from each of `intervals`,
+    dropping anything shorter than the geometric quantum:
+
+    >>> difference([(0, 10)], [(2, 3), (5, 6)])
+    [(0, 2), (3, 5), (6, 10)]
+
+    """
+    result = []
+    for a, b in intervals:
+        for h0, h1 in holes:
+            if h1 <= a or h0 >= b:
+                continue
+            if h0 - a > quantum:
+                result.append((a, h0))
+            a = max(a, h1)
+        if b - a > quantum:
+            result.append((a, b))
+    return result
+
+def disc(center, d, y):
+    dy = y - center.y
+    if abs(dy) > d:
+        return None
+    dx = math.sqrt(d * d - dy * dy)
+    return (center.x - dx, center.x + dx)
+
+def capsule(a, b, d, y):
+    """ Where the horizontal line at `y` is within `d` of the segment `ab`. """
+    ends = [i for i in (disc(a, d, y), disc(b, d, y)) if i is not None]
+
+    v = b - a
+    if v.magnitude_squared() > 0:
+        n = Vector(-v.y, v.x).normalized() * d
+        corners = [a + n, b + n, b - n, a - n]
+        xs = []
+        for p, q in zip(corners, corners[1:] + corners[:1]):
+            if (p.y - y) * (q.y - y) <= 0 and p.y != q.y:
+                xs.append(p.x + (q.x - p.x) * (y - p.y) / (q.y - p.y))
+        if xs:
+            ends.append((min(xs), max(xs)))
+
+    if not ends:
+        return None
+    return (min(e[0] for e in ends), max(e[1] for e in ends))
+
+def crossings(segments, y):
+    """ Intervals of the horizontal line at `y` inside the bounded region. """
+    scan = Line(Point(0, y), Vector(1, 0))
+    intersects = (scan.intersect(l) for l in segments if l.v.y != 0)
+    xs = sorted(i.x for i in intersects if i is not None)
+    return list(zip(xs[::2], xs[1::2]))
+
+class Swept:
+    """
+    The set of tool centers within `distance` of any of `segments`, queried
+    one horizontal scanline at a time.
+
+    """
+    def __init__(self, segments, distance):
+        self.segments = list(segments)
+        self.distance = distance
+
+    def near(self, y):
+        if self.distance <= 0:
+            return []
+        near = (capsule(s.p1, s.p2, self.distance, y) for s in self.segments)
+        return [i for i in near if i is not None]
+
+    def intervals(self, y):
+        """ Sorted intervals along the line at `y` within the swept set. """
+        return merge(self.near(y))
+
+class Cleared(Swept):
+    """
+    The set of tool centers within `distance` of a `region`, queried one
+    horizontal scanline at a time.
+
+    """
+    def __init__(self, region, distance):
+        super().__init__(region.segments(), distance)
+
+    def intervals(self, y):
+        """ Sorted intervals along the line at `y` within the cleared set. """
+        return merge([*crossings(self.segments, y), *self.near(y)])
@@ -0,0 +1,223 @@
+import math
+
+from .motion import PlanarToolpath
+from ..plane import Point
+
+def travel(toolpaths, start):
+    """ The total rapid distance needed to visit `toolpaths` in order. """
+    total = 0
+    current = start
+    for p in toolpaths:
+        total += (p.path[0] - current).magnitude()
+        current = p.path[-1]
+    return total
+
+def reversed_toolpath(toolpath):
+    p = PlanarToolpath(None)
+    p.path = list(reversed(toolpath.path))
+    return p
+
+class EndpointGrid:
+    """
+    Uniform spatial hash over toolpath endpoints, used to find the nearest
+    unvisited endpoint without scanning every remaining toolpath.
+
+    """
+    def __init__(self, endpoints, size):
+        self.size = size
+        self.cells = {}
+        self.count = 0
+        for p, item in endpoints:
+            self.cells.setdefault(self.key(p), {})[item] = p
+            self.count += 1
+
+        keys = list(self.cells.keys()) or [(0, 0)]
+        self.low = (min(k[0] for k in keys), min(k[1] for k in keys))
+        self.high = (max(k[0] for k in keys), max(k[1] for k in keys))
+
+    def key(self, p):
+        return (math.floor(p.x / self.size), math.floor(p.y / self.size))
+
+    def remove(self, p, item):
+        cell = self.cells[self.key(p)]
+        del cell[item]
+        self.count -= 1
+
+    def ring(self, center, r):
+        cx, cy = center
+        if r == 0:
+            yield center
+            return
+        for x in range(cx - r, cx + r + 1):
+            yield (x, cy - r)
+            yield (x, cy + r)
+        for y in range(cy - r + 1, cy + r):
+            yield (cx - r, y)
+            yield (cx + r, y)
+
+    def nearest(self, p):
+        if self.count == 0:
+            return None
+
+        center = self.key(p)
+        limit = max(
+            abs(center[0] - self.low[0]), abs(center[0] - self.high[0]),
+            abs(center[1] - self.low[1]), abs(center[1] - self.high[1])
+        )
+
+        best, best_d = None, None
+        for r in range(limit + 1):
+            # Anything in this ring or beyond is at least (r - 1) cells away.
+            if best is not None and (r - 1) * self.size > best_d:
+                break
+            for key in self.ring(center, r):
+                for item, q in self.cells.get(key, {}).items():
+                    d = (q - p).magnitude()
+                    if best is None or d < best_d:
+                        best, best_d = item, d
+        return best
+
+class Sequenced:
+    """
+    Reorders a list of :py:class:`~petrify.machine.motion.PlanarToolpath` to
+    minimize rapid travel between them, starting from `start`:
+
+    >>> def line(x):
+    ...     p = PlanarToolpath(Point(x, 0))
+    ...     p.move_to(Point(x + 1, 0))
+    ...     return p
+    >>> order = Sequenced([line(10), line(0), line(5)])
+    >>> [p.path[0] for p in order.toolpaths]
+    [Point(0, 0), Point(5, 0), Point(10, 0)]
+    >>> order.saved
+    17.0
+
+    A nearest-neighbor tour is built first, then improved with 2-opt moves
+    over a sliding `window` of the tour. When `reverse` is set, open toolpaths
+    may be cut in the opposite direction; closed loops are never reversed.
+
+    The original order is kept if it happens to be shorter.
+
+    """
+    def __init__(self, toolpaths, start=Point(0, 0), reverse=True, window=32, passes=4):
+        self.original = list(toolpaths)
+        self.start = start
+        self.reverse = reverse
+        self.window = window
+        self.passes = passes
+
+        self.before = travel(self.original, start)
+        tour = self.improve(self.nearest_neighbor())
+        candidate = [self.oriented(ix, flipped) for ix, flipped in tour]
+
+        after = travel(candidate, start)
+        if after < self.before:
+            self.toolpaths = candidate
+            self.after = after
+        else:
+            self.toolpaths = self.original
+            self.after = self.before
+
+    @property
+    def saved(self):
+        return self.before - self.after
+
+    def closed(self, ix):
+        path = self.original[ix].path
+        return path[0] == path[-1]
+
+    def reversible(self, ix):
+        return self.reverse or self.closed(ix)
+
+    def entry(self, ix, flipped):
+        path = self.original[ix].path
+        return path[-1] if flipped else path[0]
+
+    def exit(self, ix, flipped):
+        path = self.original[ix].path
+        return path[0] if flipped else path[-1]
+
+    def oriented(self, ix, flipped):
+        toolpath = self.original[ix]
+        if flipped and not self.closed(ix):
+            return reversed_toolpath(toolpath)
+        return toolpath
+
+    def nearest_neighbor(self):
+        n = len(self.original)
+        if n == 0:
+            return []
+
+        endpoints = []
+        for ix, toolpath in enumerate(self.original):
+            endpoints.append((toolpath.path[0], (ix, False)))
+            if self.reverse and not self.closed(ix):
+                endpoints.append((toolpath.path[-1], (ix, True)))
+
+        # Size cells so each holds roughly one endpoint, without letting
+        # degenerate (e.g. collinear) layouts create absurdly small cells.
+        xs = [p.x for p, _ in endpoints]
+        ys = [p.y for p, _ in endpoints]
+        width, height = max(xs) - min(xs), max(ys) - min(ys)
+        size = max(math.sqrt(width * height / n), max(width, height) / n)
+        grid = EndpointGrid(endpoints, size or 1.0)
+
+        tour = []
+        current = self.start
+        while len(tour) < n:
+            ix, flipped = grid.nearest(current)
+            grid.remove(self.entry(ix, False), (ix, False))
+            if self.reverse and not self.closed(ix):
+                grid.remove(self.entry(ix, True), (ix, True))
+            tour.append((ix, flipped))
+            current = self.exit(ix, flipped)
+
+        return tour
+
+    def improve(self, tour):
+        n = len(tour)
+        hypot = math.hypot
+
+        heads = [(p.path[0].x, p.path[0].y) for p in self.original]
+        tails = [(p.path[-1].x, p.path[-1].y) for p in self.original]
+
+        def entry(step):
+            return tails[step[0]] if step[1] else heads[step[0]]
+
+        def exit(step):
+            return heads[step[0]] if step[1] else tails[step[0]]
+
+        # Prefix counts of toolpaths that can't be reversed, allowing a constant
+        # time check that a whole segment is reversible. Only fully reversible
+        # segments are ever flipped, so these counts never change.
+        fixed = [0]
+        for ix, _ in tour:
+            fixed.append(fixed[-1] + (0 if self.reversible(ix) else 1))
+
+        for _ in range(self.passes):
+            improved = False
+            for i in range(n):
+                ax, ay = (self.start.x, self.start.y) if i == 0 else exit(tour[i - 1])
+                ix, iy = entry(tour[i])
+                for j in range(i, min(n, i + self.window)):
+                    if fixed[j + 1] - fixed[i] > 0:
+                        break
+
+                    # Reversing tour[i..j] only changes the two links at either
+                    # end of the segment; links inside it keep their lengths.
+                    jx, jy = exit(tour[j])
+                    old = hypot(ax - ix, ay - iy)
+                    new = hypot(ax - jx, ay - jy)
+                    if j + 1 < n:
+                        bx, by = entry(tour[j + 1])
+                        old += hypot(jx - bx, jy - by)
+                        new += hypot(ix - bx, iy - by)
+
+                    if new < old - 1e-9:
+                        tour[i:j + 1] = [(k, not f) for k, f in reversed(tour[i:j + 1])]
+                        ix, iy = entry(tour[i])
+                        improved = True
+            if not improved:
+                break
+
+        return tour
@@ -1,12 +1,113 @@
 from ..solid import PlanarPolygon, PolygonExtrusion
-from ..space import Plane
-from ..plane import ComplexPolygon
+from ..space import Plane, Point, Polygon, Vector
+from ..plane import Point as Point2
 from ..util import frange
 
 from .. import decompose, geometry
 
+def newell(points):
+    """ The (unnormalized) normal of a planar loop of `points`. """
+    x = y = z = 0
+    for a, b in zip(points, (*points[1:], points[0])):
+        x += (a.y - b.y) * (a.z + b.z)
+        y += (a.z - b.z) * (a.x + b.x)
+        z += (a.x - b.x) * (a.y + b.y)
+    return Vector(x, y, z)
+
+def crossing(a, b, da, db):
+    # Always interpolate shared edges in the same direction, so both faces
+    # touching an edge produce exactly the same point.
+    if a.xyz > b.xyz:
+        a, b, da, db = b, a, db, da
+    return a + (b - a) * (da / (da - db))
+
+def section(faces, normal, k):
+    """
+    Cross-sections a closed mesh of `faces` (each a list of points) with the
+    plane at distance `k`
+    along the unit `normal`, returning the closed loops of points where they
+    meet. Loops are oriented with material to their right when viewed from
+    the direction the `normal` points.
+
+    Vertices lying exactly on the plane are treated as above it, so faces
+    coplanar with it contribute nothing and shared edges aren't doubled.
+
+    """
+    segments = []
+    for points in faces:
+        distances = [normal.dot(p) - k for p in points]
+        above = [d >= 0 for d in distances]
+        if all(above) or not any(above):
+            continue
+
+        crossings = []
+        for ix in range(len(points)):
+            jx = (ix + 1) % len(points)
+            if above[ix] != above[jx]:
+                crossings.append(crossing(
+                    points[ix], points[jx], distances[ix], distances[jx]
+                ))
+
+        # Outward face normals define which way each section edge runs.
+        direction = newell(points).cross(normal)
+        crossings.sort(key=direction.dot)
+        for a, b in zip(crossings[::2], crossings[1::2]):
+            if a != b:
+                segments.append((a, b))
+
+    return chain(segments)
+
+def chain(segments):
+    """ Joins directed `segments` end to start into closed loops. """
+    def key(p):
+        return tuple(p.snap(geometry.quantum).xyz)
+
+    starts = {}
+    for segment in segments:
+        starts.setdefault(key(segment[0]), []).append(segment)
+
+    loops = []
+    for segment in segments:
+        following = starts.get(key(segment[0]))
+        if not following or segment not in following:
+            continue
+
+        first = key(segment[0])
+        loop = []
+        current = segment
+        while current is not None:
+            starts[key(current[0])].remove(current)
+            loop.append(current[0])
+            end = key(current[1])
+            if end == first:
+                break
+            candidates = starts.get(end)
+            current = candidates[0] if candidates else None
+
+        if len(loop) > 2:
+            loops.append(loop)
+    return loops
+
+def _section(args):
+    # Points don't survive pickling, so process pool jobs use plain tuples.
+    faces, normal, k = args
+    faces = [[Point(*p) for p in face] for face in faces]
+    loops = section(faces, Vector(*normal), k)
+    return [[tuple(p.xyz) for p in loop] for loop in loops]
+
 class Sliced:
-    def __init__(self, solid, basis, rectangle, start, end, step):
+    """
+    Slices a `solid` into layers parallel to the plane of a `basis`, every
+    `step` from `start` to `end` along its normal, within the given
+    `rectangle` of the basis.
+
+    Layers are only computed when first needed. Each is found by directly
+    cross-sectioning the faces of the solid that span its height, as found
+    by the solid's :py:meth:`~petrify.solid.Node.index`. Given a number of
+    `processes`, all layers are instead computed up front in a process pool.
+
+    """
+    def __init__(self, solid, basis, rectangle, start, end, step, processes=None):
         self.solid = solid
         self.basis = basis
         self.slice = rectangle
@@ -15,11 +116,66 @@ class Sliced:
         self.end = end
         self.step = step
 
-        r = frange(self.start, self.end, self.step, inclusive=True)
-        self.slices = [(zl, self._slice(zl)) for zl in r]
+        self.layers = list(frange(self.start, self.end, self.step, inclusive=True))
+        self.normal = self.basis.normal().normalized()
+        self._slices = {}
+        if processes is not None:
+            self._parallel(processes)
+
+    @property
+    def slices(self):
+        return list(self)
+
+    def __iter__(self):
+        return ((z, self[z]) for z in self.layers)
+
+    def __getitem__(self, z):
+        if z not in self._slices:
+            self._slices[z] = self._layer(z, self._faces(z))
+        return self._slices[z]
+
+    def _height(self, delta):
+        return self.normal.dot(self.basis.origin) + delta
+
+    def _faces(self, delta):
+        return self.solid.index(self.normal).crossing(self._height(delta))
+
+    def _layer(self, delta, faces, loops=None):
+        if loops is None:
+            faces = [polygon.points for polygon in faces]
+            loops = section(faces, self.normal, self._height(delta))
+
+        stepped = self.basis + (self.normal * delta)
+        bx, by = stepped.bx, stepped.by
+        inside = self.slice.contains
+        for loop in loops:
+            for p in loop:
+                v = p - stepped.origin
+                if not inside(Point2(v.dot(bx) / bx.magnitude_squared(), v.dot(by) / by.magnitude_squared())):
+                    # Sections leaving the slicing rectangle need clipping.
+                    return self._slab(delta)
+
+        polygons = (decompose.collate_collinear(Polygon(loop)) for loop in loops)
+        return [p for p in polygons if len(p.points) > 2]
+
+    def _parallel(self, processes):
+        from concurrent.futures import ProcessPoolExecutor
+
+        swept = [(z, self._faces(z)) for z in self.layers]
+        normal = tuple(self.normal.xyz)
+        jobs = [
+            ([[tuple(p.xyz) for p in f.points] for f in faces], normal, self._height(z))
+            for z, faces in swept
+        ]
+        with ProcessPoolExecutor(processes) as pool:
+            sections = list(pool.map(_section, jobs))
+
+        for (z, faces), loops in zip(swept, sections):
+            loops = [[Point(*p) for p in loop] for loop in loops]
+            self._slices[z] = self._layer(z, faces, loops)
 
-    def _slice(self, delta):
-        normal = self.basis.normal().normalized()
+    def _slab(self, delta):
+        normal = self.normal
         stepped = self.basis + (normal * delta)
         base = PlanarPolygon(stepped, self.slice)
         slicer = PolygonExtrusion(base, normal * self.step)
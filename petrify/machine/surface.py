@@ -0,0 +1,19 @@
+from ..geometry import valid_scalar
+
+class Surface:
+    """
+    The upper surface of a `solid`, to be finished in three dimensions. Heights
+    are measured from the `top` of the stock, which defaults to the top of the
+    solid, and cutting stops at the `bottom`, defaulting to its base.
+
+    """
+    def __init__(self, solid, top=None, bottom=None):
+        self.solid = solid
+        envelope = solid.envelope()
+        self.top = envelope.extent.z if top is None else top
+        self.bottom = envelope.origin.z if bottom is None else bottom
+
+    def __mul__(self, v):
+        if not valid_scalar(v): return NotImplemented
+        return Surface(self.solid * v, self.top * v, self.bottom * v)
+    __rmul__ = __mul__
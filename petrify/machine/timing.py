@@ -0,0 +1,130 @@
+"""
+Estimates machining time with an acceleration-limited motion model, similar to
+the planners used by common motion controllers:
+
+>>> commands = [Motion(x=10.0, f=600.0), Motion(x=20.0, f=600.0)]
+>>> naive = 20.0 / 600.0
+>>> accelerated = estimate(((None, c) for c in commands), 36000.0, 0.01)
+>>> round(accelerated - naive, 6)
+0.016667
+
+Each move accelerates from its entry speed towards its feedrate and
+decelerates to its exit speed with a trapezoidal velocity profile. Speeds
+at the junction between moves are limited by the angle between them and the
+controller's `deviation`, then propagated backwards and forwards so every
+move can actually reach its planned exit speed.
+
+"""
+import math
+
+from .motion import Arc, Motion
+
+def direction(dx, dy, dz, length):
+    return (dx / length, dy / length, dz / length)
+
+def moves(commands):
+    """
+    Flattens `commands` into `(length, entry, exit, feed)` tuples, where
+    `entry` and `exit` are the unit directions of travel at either end of the
+    move. `None` is yielded for commands that bring the machine to a stop.
+
+    """
+    x = y = z = 0.0
+    f = 0.0
+    for _, command in commands:
+        if not isinstance(command, Motion):
+            yield None
+            continue
+
+        nx = x if command.x is None else command.x
+        ny = y if command.y is None else command.y
+        nz = z if command.z is None else command.z
+        f = f if command.f is None else command.f
+
+        if isinstance(command, Arc):
+            length = command.distance(Motion(x, y, z, f))
+            flat = math.hypot(command.i, command.j)
+            # Tangents are perpendicular to the radius at either end, scaled
+            # to leave room for any helical z travel.
+            scale = math.sqrt(max(0.0, length ** 2 - (nz - z) ** 2)) / flat
+            sign = -1 if command.clockwise else 1
+            rx, ry = -command.i, -command.j
+            ex, ey = nx - (x + command.i), ny - (y + command.j)
+            entry = direction(-ry * sign * scale, rx * sign * scale, nz - z, length)
+            exit = direction(-ey * sign * scale, ex * sign * scale, nz - z, length)
+        else:
+            dx, dy, dz = nx - x, ny - y, nz - z
+            length = math.sqrt(dx * dx + dy * dy + dz * dz)
+            if length > 0:
+                entry = exit = direction(dx, dy, dz, length)
+
+        if length > 0:
+            yield (length, entry, exit, f)
+        x, y, z = nx, ny, nz
+
+def junction(a, b, acceleration, deviation):
+    """
+    The fastest speed the machine can turn from direction `a` to `b`, using
+    the same junction deviation model as common motion controllers.
+
+    """
+    cos = -(a[0] * b[0] + a[1] * b[1] + a[2] * b[2])
+    if cos > 0.999999:
+        return 0.0
+    if cos < -0.999999:
+        return math.inf
+    sin = math.sqrt((1 - cos) / 2)
+    return math.sqrt(acceleration * deviation * sin / (1 - sin))
+
+def duration(length, entry, exit, feed, acceleration):
+    """ The time taken by a single trapezoidal (or triangular) move. """
+    accelerate = (feed ** 2 - entry ** 2) / (2 * acceleration)
+    decelerate = (feed ** 2 - exit ** 2) / (2 * acceleration)
+    if accelerate + decelerate <= length:
+        cruise = length - accelerate - decelerate
+        return (
+            (feed - entry) / acceleration +
+            (feed - exit) / acceleration +
+            cruise / feed
+        )
+    peak = math.sqrt((2 * acceleration * length + entry ** 2 + exit ** 2) / 2)
+    return (peak - entry) / acceleration + (peak - exit) / acceleration
+
+def estimate(commands, acceleration, deviation):
+    """
+    Estimates the time taken to run `commands` on a machine with the given
+    `acceleration` and junction `deviation`. Units follow the feedrates of
+    the commands, as with :py:meth:`~petrify.machine.motion.Cut.time`.
+
+    """
+    lengths, feeds, speeds = [], [], [0.0]
+    prior = None
+    for move in moves(commands):
+        if move is None:
+            speeds[-1] = 0.0
+            prior = None
+            continue
+
+        length, entry, exit, feed = move
+        if prior is not None:
+            limit = junction(prior[2], entry, acceleration, deviation)
+            speeds[-1] = min(limit, feed, prior[3])
+        lengths.append(length)
+        feeds.append(feed)
+        speeds.append(0.0)
+        prior = move
+
+    # Entry speeds can't exceed what each move can shed before its exit...
+    for ix in reversed(range(len(lengths))):
+        reachable = math.sqrt(speeds[ix + 1] ** 2 + 2 * acceleration * lengths[ix])
+        speeds[ix] = min(speeds[ix], reachable)
+
+    # ...and exit speeds can't exceed what each move can build from its entry.
+    for ix in range(len(lengths)):
+        reachable = math.sqrt(speeds[ix] ** 2 + 2 * acceleration * lengths[ix])
+        speeds[ix + 1] = min(speeds[ix + 1], reachable)
+
+    return sum(
+        duration(length, speeds[ix], speeds[ix + 1], feed, acceleration)
+        for ix, (length, feed) in enumerate(zip(lengths, feeds))
+    )
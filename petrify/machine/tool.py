@@ -1,6 +1,9 @@
+import math
+
 from .engrave import Engrave
 from .pocket import Pocket
 from .part import Part
+from .surface import Surface
 from ..geometry import valid_scalar
 from .. import units
 
@@ -39,6 +42,61 @@ class StraightTip:
     def radius(self):
         return self.diameter / 2
 
+class VBit:
+    """
+    Specifies a V-shaped engraving tool with the specified `number`, included
+    tip `angle` in degrees, and `diameter` at its widest:
+
+    >>> tool = VBit(2, 90, 1 / 4) * u.inch
+
+    The depth at which it cuts a groove of a given radius follows from its
+    angle:
+
+    >>> round(VBit(2, 90, 6).depth(1.5), 6)
+    1.5
+
+    """
+    def __init__(self, number, angle, diameter, name=None):
+        assert 0 < angle < 180
+        self.number = number
+        self.angle = angle
+        self.diameter = diameter
+        self.name = name or '{0} {1}° v-bit'.format(diameter, angle)
+
+    def __mul__(self, v):
+        if not valid_scalar(v): return NotImplemented
+        return VBit(self.number, self.angle, self.diameter * v, self.name)
+    __rmul__ = __mul__
+
+    @property
+    def radius(self):
+        return self.diameter / 2
+
+    def depth(self, radius):
+        """ How deep the tip must go to cut `radius` wide at the surface. """
+        return radius / math.tan(math.radians(self.angle) / 2)
+
+class Kinematics:
+    """
+    Describes how a machine changes speed, with a maximum `acceleration` and the
+    `junction_deviation` its controller uses to limit cornering speed:
+
+    >>> kinematics = Kinematics(500 * u.mm / u.second ** 2, 0.01 * u.mm)
+
+    """
+    def __init__(self, acceleration, junction_deviation):
+        assert acceleration.check('[length] / [time] ** 2'), \
+            "does not have length / time ** 2 units: {0!r}".format(acceleration)
+        self.acceleration = acceleration
+        self.junction_deviation = units.assert_lengthy(junction_deviation)
+
+    def to(self, format):
+        """ Magnitudes in the length and xy feedrate units of `format`. """
+        return (
+            self.acceleration.m_as(format.xy ** 2 / format.units),
+            self.junction_deviation.m_as(format.units)
+        )
+
 class Machine:
     """
     Defines a machine with a given clearance plane that can be configured to
@@ -47,15 +105,27 @@ class Machine:
     A machine configuration is obtained via `.configure` and can be used to
     cut out shapes.
 
+    Optional :py:class:`Kinematics` give more accurate time estimates via
+    :py:meth:`~petrify.machine.motion.Cut.time`.
+
     """
-    def __init__(self, clearance, format):
+    def __init__(self, clearance, format, kinematics=None):
         self.clearance = clearance
         self.format = format
+        self.kinematics = kinematics
 
     def configure(self, feed, speeds, tool):
         return Configuration(feed, speeds, tool, self)
 
 
+# The feed method that cuts each kind of shape.
+STRATEGIES = (
+    (Pocket, 'pocket'),
+    (Part, 'part'),
+    (Engrave, 'engrave'),
+    (Surface, 'surface'),
+)
+
 class Configuration:
     def __init__(self, feed, speeds, tool, machine):
         self.speeds = speeds
@@ -71,11 +141,29 @@ class Configuration:
     def tool(self):
         return self._tool.m_as(self.units)
 
-    def cut(self, shape):
+    def cut(self, shape, after=None):
+        """
+        Cuts out a `shape`. When `after` is the configuration of a larger tool
+        that has already cleared a pocket, only the stock that tool could not
+        reach is cut. Only pockets can be rest machined, and only by feeds
+        with a `rest` strategy.
+
+        Feeds that cannot cut the given kind of shape, such as a
+        :py:class:`~petrify.machine.vcarve.VCarveFeed` given a pocket, raise a
+        `ValueError`.
+
+        """
         shape = shape.m_as(self.machine.format.units)
-        if isinstance(shape, Pocket):
-            return self.feed.pocket(self, shape)
-        elif isinstance(shape, Part):
-            return self.feed.part(self, shape)
-        elif isinstance(shape, Engrave):
-            return self.feed.engrave(self, shape)
+        if after is not None:
+            if not isinstance(shape, Pocket):
+                raise ValueError("only pockets can be rest machined, not a {0}".format(type(shape).__name__))
+            if not hasattr(self.feed, 'rest'):
+                raise ValueError("{0} cannot rest machine a pocket".format(type(self.feed).__name__))
+            return self.feed.rest(self, shape, after._tool.m_as(self.units))
+        for kind, strategy in STRATEGIES:
+            if isinstance(shape, kind):
+                if not hasattr(self.feed, strategy):
+                    raise ValueError("{0} cannot cut a {1}".format(
+                        type(self.feed).__name__, kind.__name__
+                    ))
+                return getattr(self.feed, strategy)(self, shape)
@@ -1,6 +1,7 @@
 import math
 
-from ..util import locate_circle
+from ..index import BoxGrid
+from ..util import locate_circles
 from ..plane import Circle
 
 
@@ -20,10 +21,19 @@ class CutLine:
     def from_lines(cls, a, b):
         def _close(p, r, l):
             return Circle(p, r).connect(l).v.magnitude_squared() < 0.001
-        endpoints = [(dl, locate_circle(p, a.v.cross(), b)) for dl, p in ((0, a.p1), (1, a.p2))]
-        endpoints = [(dl, s) for dl, s in endpoints if s is not None]
+
+        cs = [(a.connect(p), p) for p in (b.p1, b.p2)]
+        near, far = sorted(cs, key=lambda v: v[0].magnitude_squared())
+        located = locate_circles([
+            (a.p1, a.v.cross(), b),
+            (a.p2, a.v.cross(), b),
+            (far[1], b.v.cross(), a),
+            (near[1], b.v.cross(), a),
+        ])
+
+        endpoints = [(dl, s) for dl, s in zip((0, 1), located[:2]) if s is not None]
         endpoints = [(dl, (p, r, x)) for dl, (p, r, x) in endpoints if _close(p, r, b)]
-        midpoints = cls.midpoints(a, b)
+        midpoints = cls._midpoints(a, near[0], *located[2:])
         midpoints = [(x, (p, r, x)) for p, r, x in midpoints if _close(p, r, a)]
         cuts = [*endpoints, *midpoints]
         ordered = [(x, p, r) for x, (p, r, _) in sorted(cuts, key=lambda v: (v[0], -v[1][1]))]
@@ -34,17 +44,17 @@ class CutLine:
 
     @classmethod
     def midpoints(cls, a, b):
-        cuts = []
         cs = [(a.connect(p), p) for p in (b.p1, b.p2)]
         near, far = sorted(cs, key=lambda v: v[0].magnitude_squared())
+        located = locate_circles([(p, b.v.cross(), a) for _, p in (far, near)])
+        return cls._midpoints(a, near[0], *located)
 
-        _, p_far = far
-        far = locate_circle(p_far, b.v.cross(), a)
+    @classmethod
+    def _midpoints(cls, a, connection, far, cut):
+        cuts = []
         if far:
             cuts.append(far)
 
-        connection, p_near = near
-        cut = locate_circle(p_near, b.v.cross(), a)
         if cut:
             cuts.append(cut)
             p, r, x = cut
@@ -56,26 +66,119 @@ class CutLine:
         return cuts
 
 def clearance(segment, others):
+    """
+    The path of the largest circles touching `segment` that fit between it and
+    `others`, as `(center, radius)` pairs ordered along the segment.
+
+    """
     lines = [CutLine.from_lines(segment, other) for other in others]
     cuts = [l for _ls in lines if _ls is not None for l in _ls]
-    cuts = [c for c in cuts if c is not None]
 
     ordered = sorted(cuts, key=lambda c: c.start[0])
     active = []
     path = []
-    prior = None
 
     ix = 0
 
     points = sorted(set([p[0] for l in ordered for p in (l.start, l.end)]))
-    for position in sorted(points):
+    for position, following in zip(points, [*points[1:], None]):
         while ix < len(ordered) and ordered[ix].start[0] <= position:
             active.append(ordered[ix])
             ix += 1
         active = [line for line in active if position <= line.end[0]]
 
-        places = [cut.interpolate(position) for cut in active]
-        places = sorted(places, key=lambda pair: pair[1])
-        path.append(places[0])
+        places = (cut.interpolate(position) for cut in active)
+        path.append(min(places, key=lambda pair: pair[1]))
+        if following is not None:
+            spanning = [l for l in active if l.end[0] >= following]
+            path.extend(lower_crossings(spanning, position, following))
 
     return path
+
+def lower_crossings(lines, start, end):
+    """
+    Where the smallest circle among `lines` changes strictly between the
+    positions `start` and `end`, which every line spans.
+
+    """
+    def radius(line, v):
+        return line.interpolate(v)[1]
+
+    def slope(line):
+        return radius(line, end) - radius(line, start)
+
+    if not lines:
+        return []
+
+    crossings = []
+    v = start
+    current = min(lines, key=lambda l: (radius(l, start), slope(l)))
+    while True:
+        best = None
+        for line in lines:
+            dv = slope(line) - slope(current)
+            if dv >= 0:
+                continue
+            # Both radii are linear in position between start and end.
+            gap = radius(line, start) - radius(current, start)
+            x = start - gap * (end - start) / dv
+            if v < x < end and (best is None or x < best[0]):
+                best = (x, line)
+        if best is None:
+            return crossings
+        v, current = best
+        crossings.append(current.interpolate(v))
+
+class Clearance:
+    """
+    Finds :py:func:`clearance` paths for each of a fixed set of `segments`,
+    such as those of a polygon, considering only nearby segments.
+
+    Segments are bucketed in a grid. Each search starts with the segments
+    near the one being queried, and widens until every circle found lies
+    within the searched distance, at which point no farther segment can
+    touch any of them.
+
+    """
+    def __init__(self, segments):
+        self.segments = list(segments)
+        boxes = [
+            (min(s.p1.x, s.p2.x), min(s.p1.y, s.p2.y),
+             max(s.p1.x, s.p2.x), max(s.p1.y, s.p2.y), ix)
+            for ix, s in enumerate(self.segments)
+        ]
+        lengths = [s.v.magnitude() for s in self.segments]
+        self.size = (sum(lengths) / len(lengths)) if lengths else 1.0
+        self.grid = BoxGrid(boxes, self.size or 1.0)
+
+    def nearby(self, ix, reach):
+        s = self.segments[ix]
+        found = self.grid.query(
+            min(s.p1.x, s.p2.x) - reach, min(s.p1.y, s.p2.y) - reach,
+            max(s.p1.x, s.p2.x) + reach, max(s.p1.y, s.p2.y) + reach
+        )
+        return [self.segments[j] for j in found if j != ix]
+
+    def along(self, ix):
+        """ The clearance path along the segment at index `ix`. """
+        segment = self.segments[ix]
+        reach = max(self.size, segment.v.magnitude())
+        while True:
+            others = self.nearby(ix, reach)
+            path = clearance(segment, others)
+            widest = max((r for _, r in path), default=0)
+            if 2 * widest <= reach or len(others) == len(self.segments) - 1:
+                return path
+            reach = max(reach * 2, 2 * widest)
+
+    def __iter__(self):
+        return (self.along(ix) for ix in range(len(self.segments)))
+
+def medial_axis(polygon):
+    """
+    Pairs every segment of a `polygon` (simple or complex) with its
+    :py:func:`clearance` path, tracing the polygon's medial axis.
+
+    """
+    index = Clearance(polygon.segments())
+    return list(zip(index.segments, index))
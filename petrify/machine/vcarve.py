@@ -0,0 +1,67 @@
+"""
+V-carving: engraving with a :py:class:`~petrify.machine.tool.VBit` whose tip
+follows the medial axis of the engraved shape, plunging deeper wherever the
+shape is wider. A square with sides of 4 is carved to a depth of 2 at its
+center with a 90° bit:
+
+>>> from petrify.plane import Point, Polygon
+>>> from .tool import VBit
+>>> square = Polygon([Point(0, 0), Point(0, 4), Point(4, 4), Point(4, 0)])
+>>> passes = carved(square, VBit(1, 90, 6), 5)
+>>> round(min(p.z for path in passes for p in path), 6)
+-2.0
+
+"""
+from ..plane import ComplexPolygon
+from ..space import Point
+from .finish import SurfaceCut
+from .tool import VBit
+from .util import Clearance
+
+def carved(polygon, tool, depth):
+    """
+    One closed pass of three-dimensional points around each loop of a
+    `polygon`, carving it with a `tool` no deeper than `depth`.
+
+    """
+    if not isinstance(polygon, ComplexPolygon):
+        polygon = ComplexPolygon([polygon])
+
+    # Clearance circles lie to the right of each segment, so loops are
+    # oriented with the carved region on that side.
+    loops = [
+        *(p.to_clockwise() for p in polygon.exterior),
+        *(p.to_counterclockwise() for p in polygon.interior),
+    ]
+    segments = [s for loop in loops for s in loop.segments()]
+    index = Clearance(segments)
+
+    passes = []
+    ix = 0
+    for loop in loops:
+        path = []
+        for _ in loop.segments():
+            for center, r in index.along(ix):
+                z = -min(tool.depth(min(r, tool.radius)), depth)
+                p = Point(center.x, center.y, z)
+                if not path or p != path[-1]:
+                    path.append(p)
+            ix += 1
+        if path:
+            passes.append([*path, path[0]] if path[0] != path[-1] else path)
+    return passes
+
+class VCarveFeed:
+    """
+    Engraves with a V-bit in a single pass around each loop of the shape, its
+    depth following the largest circle that fits within the shape. The
+    engraving depth limits how deep the bit goes; wider areas are left with a
+    flat bottom for a separate clearing operation.
+
+    """
+    def engrave(self, configuration, engrave):
+        tool = configuration.tool
+        if not isinstance(tool, VBit):
+            raise ValueError("v-carving requires a VBit, not {0!r}".format(tool))
+
+        return SurfaceCut(carved(engrave.polygon, tool, engrave.depth), configuration)
@@ -191,6 +191,27 @@ class Matrix2:
         self.k = Ai * Bc + Aj * Bg + Ak * Bk
         return self
 
+    def transform_points(self, points):
+        """
+        Transforms many `points` at once, without dispatching on each:
+
+        >>> Matrix2.translate(1, 0).transform_points([Point(0, 0), Point(1, 1)])
+        [Point(1, 0), Point(2, 1)]
+
+        A :py:class:`~petrify.plane.array.PointArray2` is transformed as a
+        whole, and returned as one.
+
+        """
+        if hasattr(points, '_apply_transform'):
+            return self * points
+
+        a, b, c = self.a, self.b, self.c
+        e, f, g = self.e, self.f, self.g
+        return [
+            Point2(a * x + b * y + c, e * x + f * y + g)
+            for x, y in (p.xy for p in points)
+        ]
+
     # Static constructors
     @classmethod
     def identity(cls):
@@ -350,10 +371,26 @@ class Polygon2(AbstractPolygon, Planar):
     >>> len(tri)
     3
 
+    Polygons are treated as immutable. Their envelope and edge table are
+    computed on first use and dropped when `points` is reassigned, but not
+    when the list of points is edited in place.
+
     """
+    __slots__ = ['_points', '_edges', '_envelope']
+
     def __init__(self, points):
         self.points = points
 
+    @property
+    def points(self):
+        return self._points
+
+    @points.setter
+    def points(self, points):
+        self._points = points
+        self._edges = None
+        self._envelope = None
+
     def __repr__(self):
         return 'Polygon({0!r})'.format(self.points)
 
@@ -473,6 +510,22 @@ class Polygon2(AbstractPolygon, Planar):
         """
         return ComplexPolygon(exterior=[self], interior=[]).offset(amount)
 
+    def offsets(self, amounts):
+        """
+        Finds the dynamic offset of this polygon for each of the given
+        `amounts`, in the same order:
+
+        >>> square = Polygon([Point(0, 0), Point(0, 1), Point(1, 1), Point(1, 0)])
+        >>> [o.exterior for o in square.offsets([-0.1, -10])]
+        [[Polygon([Point(0.1, 0.1), Point(0.1, 0.9), Point(0.9, 0.9), Point(0.9, 0.1)])], []]
+
+        .. note::
+            This is much cheaper than calling :py:meth:`offset` once per
+            amount, as the offset engine only prepares this polygon once.
+
+        """
+        return ComplexPolygon(exterior=[self], interior=[]).offsets(amounts)
+
     def index_of(self, point):
         """
         Finds index of given `point`:
@@ -580,14 +633,41 @@ class Polygon2(AbstractPolygon, Planar):
         False
 
         """
-        for l in self.segments():
-            if l.v.magnitude_squared() > 0 and l.connect(p).v.magnitude_squared() == 0:
-                return True
+        if self._touches(p):
+            return True
         test = Ray2(Point2(p.x, p.y), Vector2(1, 0))
         intersects = (l.intersect(test) for l in self.segments())
         intersects = set(i for i in intersects if i is not None)
         return len(intersects) % 2 == 1
 
+    def _touches(self, p):
+        return any(
+            l.v.magnitude_squared() > 0 and l.connect(p).v.magnitude_squared() == 0
+            for l in self.segments()
+        )
+
+    def contains_many(self, points):
+        """
+        Tests whether each of many `points` lies within this polygon, returning
+        a NumPy array of booleans:
+
+        >>> tri = Polygon([Point(2, 0), Point(0, 0), Point(1, 1)])
+        >>> [bool(c) for c in tri.contains_many([Point(1.0, 0.5), Point(0.5, 1.5)])]
+        [True, False]
+
+        The polygon's edges are indexed on first use, so repeated queries on
+        the same polygon are cheaper. Without NumPy, each point is tested with
+        :py:meth:`contains` and a list is returned.
+
+        """
+        try:
+            from .containment import EdgeTable
+        except ImportError:
+            return [self.contains(p) for p in points]
+        if self._edges is None:
+            self._edges = EdgeTable([self])
+        return self._edges.contains(points)
+
     def shift(self, n):
         """
         Shift the points in this polygon by `n`:
@@ -610,10 +690,10 @@ class Polygon2(AbstractPolygon, Planar):
 
         """
         from ..shape import Rectangle
-        sx = min(p.x for p in self.points)
-        sy = min(p.y for p in self.points)
-        ex = max(p.x for p in self.points)
-        ey = max(p.y for p in self.points)
+        if self._envelope is None:
+            xs, ys = zip(*(p.xy for p in self.points))
+            self._envelope = (min(xs), min(ys), max(xs), max(ys))
+        sx, sy, ex, ey = self._envelope
         return Rectangle(Point2(sx, sy), Vector2(ex-sx, ey-sy))
 Polygon2.PointsConstructor = Polygon2
 Polygon = Polygon2
@@ -637,11 +717,17 @@ class ComplexPolygon2:
     >>> ComplexPolygon([square]) - Vector(1, 1)
     ComplexPolygon([Polygon([Point(-1, -1), Point(-1, 0), Point(0, 0), Point(0, -1)])])
 
+    Like :py:class:`Polygon`, complex polygons are treated as immutable: cached
+    data is dropped when `interior` or `exterior` is reassigned, but not when
+    either list is edited in place.
+
     """
+    _edges = None
+    _envelope = None
+
     def __init__(self, polygons=None, interior=None, exterior=None):
         if polygons is not None:
-            self.interior = []
-            self.exterior = []
+            interior, exterior = [], []
             for ix, polygon in enumerate(polygons):
                 simple = polygon.simplify()
                 if simple is None:
@@ -652,13 +738,33 @@ class ComplexPolygon2:
                 first = simple.points[0]
                 others = (*polygons[:ix], *polygons[ix + 1:])
                 if any(other.contains(first) for other in others):
-                    self.interior.append(simple)
+                    interior.append(simple)
                 else:
-                    self.exterior.append(simple)
+                    exterior.append(simple)
+            self.interior = interior
+            self.exterior = exterior
         elif interior is not None and exterior is not None:
             self.interior = interior
             self.exterior = exterior
 
+    @property
+    def interior(self):
+        return self._interior
+
+    @interior.setter
+    def interior(self, interior):
+        self._interior = interior
+        self._edges = self._envelope = None
+
+    @property
+    def exterior(self):
+        return self._exterior
+
+    @exterior.setter
+    def exterior(self, exterior):
+        self._exterior = exterior
+        self._edges = self._envelope = None
+
     def to_clockwise(self):
         """
         Converts all sub-polygons to clockwise:
@@ -700,6 +806,48 @@ class ComplexPolygon2:
     def segments(self):
         return [s for p in self.polygons for s in p.segments()]
 
+    def contains(self, p):
+        """
+        Tests whether a point lies within this polygon and outside its holes:
+
+        >>> square = Polygon([Point(0, 0), Point(0, 3), Point(3, 3), Point(3, 0)])
+        >>> ring = ComplexPolygon([square, (square / 3) + Vector(1, 1)])
+        >>> ring.contains(Point(0.5, 0.5))
+        True
+        >>> ring.contains(Point(1.5, 1.5))
+        False
+        >>> ring.contains(Point(1, 1.5))
+        True
+
+        Points on the edge of a hole count as inside.
+
+        """
+        if any(polygon._touches(p) for polygon in self.polygons):
+            return True
+        return sum(polygon.contains(p) for polygon in self.polygons) % 2 == 1
+
+    def contains_many(self, points):
+        """
+        Tests whether each of many `points` lies within this polygon and
+        outside its holes, returning a NumPy array of booleans:
+
+        >>> square = Polygon([Point(0, 0), Point(0, 3), Point(3, 3), Point(3, 0)])
+        >>> ring = ComplexPolygon([square, (square / 3) + Vector(1, 1)])
+        >>> [bool(c) for c in ring.contains_many([Point(0.5, 0.5), Point(1.5, 1.5)])]
+        [True, False]
+
+        Points on the edge of a hole count as inside. Without NumPy, each
+        point is tested with :py:meth:`contains` and a list is returned.
+
+        """
+        try:
+            from .containment import EdgeTable
+        except ImportError:
+            return [self.contains(p) for p in points]
+        if self._edges is None:
+            self._edges = EdgeTable(self.polygons)
+        return self._edges.contains(points)
+
     @property
     def polygons(self):
         return (*self.exterior, *self.interior)
@@ -727,6 +875,25 @@ class ComplexPolygon2:
         from .. import engines
         return engines.offset.offset(self, amount)
 
+    def offsets(self, amounts):
+        """
+        Finds the dynamic offset of this complex polygon for each of the given
+        `amounts`, returning a list of :py:class:`ComplexPolygon2` in the same
+        order:
+
+        >>> square = Polygon([Point(0, 0), Point(0, 1), Point(1, 1), Point(1, 0)])
+        >>> complex = ComplexPolygon([square + Vector(1, 1), square * 3])
+        >>> [o.interior for o in complex.offsets([-0.1, -0.2])]
+        [[Polygon([Point(0.9, 0.9), Point(0.9, 2.1), Point(2.1, 2.1), Point(2.1, 0.9)])], [Polygon([Point(0.8, 0.8), Point(0.8, 2.2), Point(2.2, 2.2), Point(2.2, 0.8)])]]
+
+        The offset engine prepares each polygon once and emits every requested
+        offset from that shared state, which makes this the preferred way to
+        build concentric or multi-pass offsets.
+
+        """
+        from .. import engines
+        return engines.offset.offsets(self, list(amounts))
+
     def __truediv__(self, v):
         return ComplexPolygon(
             interior=[p / v for p in self.interior],
@@ -759,9 +926,11 @@ class ComplexPolygon2:
         Rectangle(Point(0, 0), Vector(3, 3))
 
         """
-        from ..shape import Rectangle
-        rectangles = Polygon([p for polygon in self.polygons for p in polygon.envelope().points])
-        return rectangles.envelope()
+        if self._envelope is None:
+            self._envelope = Polygon(
+                [p for polygon in self.polygons for p in polygon.envelope().points]
+            )
+        return self._envelope.envelope()
 
     def centered(self, point):
         """
@@ -0,0 +1,53 @@
+"""
+Batches of two-dimensional points and vectors, stored as contiguous NumPy
+arrays and operated on all at once:
+
+>>> from . import Matrix2, Point, Vector
+>>> points = PointArray2([Point(0, 0), Point(3, 4)])
+>>> points + Vector(1, 1)
+PointArray2([[1.0, 1.0], [4.0, 5.0]])
+>>> (points - Point(0, 0)).magnitude()
+array([0., 5.])
+>>> Matrix2.scale(2, 1) * points
+PointArray2([[0.0, 0.0], [6.0, 4.0]])
+>>> points.snap(2)
+PointArray2([[0.0, 0.0], [4.0, 4.0]])
+
+Indexing and iteration give back scalar points and vectors:
+
+>>> list(points)
+[Point(0.0, 0.0), Point(3.0, 4.0)]
+
+Arrays must be on the left of operators shared with scalar types.
+
+"""
+import numpy as np
+
+from ..array import VectorArray
+from .point import Point2, Vector2
+
+class VectorArray2(VectorArray):
+    """ An array of :py:class:`~petrify.plane.Vector2`. """
+    __slots__ = []
+    dimensions = 2
+    matrix_size = 3
+    element = Vector2
+
+    @property
+    def x(self): return self.values[:, 0]
+
+    @property
+    def y(self): return self.values[:, 1]
+
+    def cross(self):
+        """ Each vector rotated a quarter turn clockwise. """
+        return self._wrap(np.stack([self.values[:, 1], -self.values[:, 0]], axis=1))
+
+class PointArray2(VectorArray2):
+    """ An array of :py:class:`~petrify.plane.Point2`. """
+    __slots__ = []
+    is_point = True
+    element = Point2
+
+VectorArray2.vectors = PointArray2.vectors = VectorArray2
+VectorArray2.points = PointArray2.points = PointArray2
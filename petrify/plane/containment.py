@@ -0,0 +1,97 @@
+"""
+Bulk point-in-polygon tests against precomputed edge tables.
+
+An :py:class:`EdgeTable` stores every edge of one or more loops as NumPy
+arrays, bucketed into horizontal slabs so each query point is only tested
+against edges spanning its height:
+
+>>> from . import Point, Polygon
+>>> square = Polygon([Point(0, 0), Point(0, 2), Point(2, 2), Point(2, 0)])
+>>> table = EdgeTable([square])
+>>> table.contains([Point(1, 1), Point(3, 1), Point(2, 1)]).tolist()
+[True, False, True]
+
+Points are inside when a ray from them crosses the loops an odd number of
+times, so holes of a complex polygon are excluded. Points on an edge are
+always inside.
+
+"""
+import numpy as np
+
+def coordinates(points):
+    """ An `(n, 2)` array of the given points, point array or array. """
+    values = getattr(points, 'values', points)
+    if isinstance(values, np.ndarray):
+        return values.reshape((-1, 2)).astype(np.float64, copy=False)
+    return np.array([p.xy for p in points], dtype=np.float64).reshape((-1, 2))
+
+class EdgeTable:
+    def __init__(self, loops):
+        starts, ends = [], []
+        for loop in loops:
+            points = [p.xy for p in loop.points]
+            starts.extend(points)
+            ends.extend(points[1:] + points[:1])
+
+        start = np.array(starts, dtype=np.float64).reshape((-1, 2))
+        end = np.array(ends, dtype=np.float64).reshape((-1, 2))
+        self.x0, self.y0 = start.T
+        self.x1, self.y1 = end.T
+
+        self.low = np.minimum(self.y0, self.y1)
+        self.high = np.maximum(self.y0, self.y1)
+
+        # Slabs of equal height, each holding the edges that overlap it.
+        count = max(1, int(np.sqrt(len(start))))
+        self.bottom = self.low.min() if len(start) else 0.0
+        top = self.high.max() if len(start) else 0.0
+        self.height = (top - self.bottom) / count or 1.0
+        first = self.slab(self.low, count)
+        last = self.slab(self.high, count)
+        self.slabs = [
+            np.nonzero((first <= ix) & (last >= ix))[0] for ix in range(count)
+        ]
+
+    def slab(self, y, count):
+        """ The slab index of each height in `y`; heights outside get -1. """
+        ix = np.floor((y - self.bottom) / self.height).astype(np.int64)
+        # Heights level with the very top belong to the last slab.
+        ix[ix == count] = count - 1
+        ix[(ix < 0) | (ix >= count)] = -1
+        return ix
+
+    def contains(self, points):
+        """ A boolean array of whether each of `points` lies inside. """
+        xy = coordinates(points)
+        inside = np.zeros(len(xy), dtype=bool)
+        if not len(self.x0):
+            return inside
+
+        slab = self.slab(xy[:, 1], len(self.slabs))
+        candidates = slab >= 0
+
+        for ix in np.unique(slab[candidates]):
+            query = np.nonzero(slab == ix)[0]
+            edges = self.slabs[ix]
+            if not len(edges):
+                continue
+            inside[query] = self._test(xy[query], edges)
+        return inside
+
+    def _test(self, xy, edges):
+        px, py = xy[:, 0:1], xy[:, 1:2]
+        x0, y0 = self.x0[edges], self.y0[edges]
+        x1, y1 = self.x1[edges], self.y1[edges]
+
+        # Half-open crossing rule: each edge covers heights from its lower
+        # end up to, but not including, its upper end.
+        spans = (y0 > py) != (y1 > py)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            x = x0 + (py - y0) * (x1 - x0) / (y1 - y0)
+        crossings = np.count_nonzero(spans & (px < x), axis=1)
+
+        cross = (x1 - x0) * (py - y0) - (y1 - y0) * (px - x0)
+        on = (cross == 0) & \
+            (px >= np.minimum(x0, x1)) & (px <= np.maximum(x0, x1)) & \
+            (py >= self.low[edges]) & (py <= self.high[edges])
+        return (crossings % 2 == 1) | on.any(axis=1)
@@ -149,6 +149,8 @@ class Ray2(Line2):
     Ray(Point(0, 0), Vector(1, 1))
 
     """
+    __slots__ = ()
+
     def __repr__(self):
         return 'Ray({0!r}, {1!r})'.format(self.p, self.v)
 
@@ -164,6 +166,8 @@ class LineSegment2(Line2):
     LineSegment(Point(0, 0), Point(1, 1))
 
     """
+    __slots__ = ()
+
     def __repr__(self):
         return 'LineSegment({0!r}, {1!r})'.format(self.p, self.p2)
 
@@ -1,4 +1,6 @@
 class Planar:
+    __slots__ = ()
+
     @property
     def embedding(self):
         from petrify import plane
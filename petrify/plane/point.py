@@ -261,6 +261,7 @@ class Vector2(generic.Concrete, generic.Vector, Planar):
         def snap(v):
             return round(v / grid) * grid
         return self.__class__(snap(self.x), snap(self.y))
+generic.swizzle(Vector2, 'xy')
 Vector = Vector2
 
 class Point2(Vector2, Geometry, generic.Point):
@@ -22,10 +22,10 @@ import math
 from geomdl import BSpline
 from geomdl import utilities
 
+from . import tessellation
 from .plane import ComplexPolygon2, Polygon2, Point2, Vector2
 from .generic import Point, Vector
 from .geometry import tau
-from .util import frange
 
 def assert_type(v, name, options):
     if isinstance(options, list):
@@ -77,16 +77,26 @@ class Circle(Polygon2):
 
     >>> circle = Circle(Point(0, 0), 1, 5)
 
+    Without `segments`, the count comes from a `tolerance` or the global
+    setting in :py:mod:`petrify.tessellation`:
+
+    >>> from petrify.tessellation import Tolerance
+    >>> len(Circle(Point(0, 0), 10, tolerance=Tolerance(chord=0.1)))
+    23
+
     """
 
-    def __init__(self, origin, radius, segments=10):
+    def __init__(self, origin, radius, segments=None, tolerance=None):
         self.origin = origin
         self.radius = radius
+        segments = tessellation.segments(radius, segments, tolerance)
 
-        angles = (tau * float(a) / segments for a in range(segments))
+        # Scale and translate the cached unit circle.
+        x, y = origin.x, origin.y
+        kind = Point2 if isinstance(origin, Point2) else Vector2
         super().__init__([
-            self.origin + Vector(math.cos(theta) * radius, math.sin(theta) * radius)
-            for theta in angles
+            kind(x + c * radius, y + s * radius)
+            for c, s in tessellation.unit_circle(segments)
         ])
 
 def bezier(a, b, c, d, segments=10):
@@ -137,9 +147,9 @@ def arc(center, radius, start, end, segments=10):
     [Point(10.0, 0.0), Point(5.0, 5.0), Point(0.0, 0.0)]
 
     """
-    angles = frange(start, end, (end - start) / (segments - 1), inclusive=True)
-    return [Point(math.cos(theta), math.sin(theta)) * radius + Vector(*center.xy)
-            for theta in angles]
+    x, y = center.xy
+    return [Point2(c * radius + x, s * radius + y)
+            for c, s in tessellation.unit_arc(start, end, segments)]
 
 def fillet(a, b, c, r, segments=10):
     """
@@ -20,12 +20,14 @@ All of the above classes subclass :py:class:`Node`, which allows object joining
 via CSG union and difference operations.
 
 """
-import math
-
-from . import engines, plane, shape, units, util, visualize
+from . import engines, plane, shape, tessellation, units, util, visualize
 from .generic import Polygon, Point, Vector
-from .space import _pmap, Matrix, PlanarPolygon, Face, Basis, Vector3
-from .geometry import tau, valid_scalar
+from .space import Matrix, PlanarPolygon, Face, Basis, Point3, Polygon3, Vector3
+from .geometry import valid_scalar
+
+# Extrusions with at least this many quads between their slices build them
+# from vertex arrays, when numpy is installed.
+BATCHED = 64
 
 def perpendicular(axis):
     "Return a vector that is perpendicular to the given axis."
@@ -67,11 +69,25 @@ class Node:
     >>> (box * u.mm).units
     <Unit('millimeter')>
 
+    Nodes are treated as immutable. Their envelope and indices are built on
+    first use and dropped when `polygons` is reassigned, but not when the
+    list of polygons is edited in place.
+
     """
     def __init__(self, polygons):
         self.polygons = polygons
         self.view_data = {}
 
+    @property
+    def polygons(self):
+        return self._polygons
+
+    @polygons.setter
+    def polygons(self, polygons):
+        self._polygons = polygons
+        for cached in ('_envelope', '_bound', '_indices', '_bvh'):
+            self.__dict__.pop(cached, None)
+
     def view(self, **data):
         return View(self, **data)
 
@@ -79,7 +95,10 @@ class Node:
         if isinstance(other, Vector3):
             return self.translate(other)
         elif isinstance(other, Node):
-            n = Node(engines.csg.union(self.polygons, other.polygons))
+            if self.apart(other):
+                n = Node([*self.polygons, *other.polygons])
+            else:
+                n = Node(engines.csg.union(self.polygons, other.polygons))
             n.parts = [self, other]
             return n
         else:
@@ -89,7 +108,10 @@ class Node:
         if isinstance(other, Vector3):
             return self.scale(other)
         elif isinstance(other, Node):
-            n = Node(engines.csg.intersect(self.polygons, other.polygons))
+            if self.apart(other):
+                n = Node([])
+            else:
+                n = Node(engines.csg.intersect(self.polygons, other.polygons))
             n.parts = [self, other]
             return n
         elif valid_scalar(other):
@@ -108,7 +130,10 @@ class Node:
         if isinstance(other, Vector3):
             return self.translate(-other)
         elif isinstance(other, Node):
-            n = Node(engines.csg.subtract(self.polygons, other.polygons))
+            if self.apart(other):
+                n = Node(list(self.polygons))
+            else:
+                n = Node(engines.csg.subtract(self.polygons, other.polygons))
             n.original = self
             n.removal = other
             return n
@@ -136,11 +161,88 @@ class Node:
         >>> extruded.envelope()
         Box(Point(0, 0, 0), Vector(1, 2, 1))
 
+        Its corners are found once, on first use.
+
         """
-        origin = _pmap(Point, min, self.points)
-        extent = _pmap(Point, max, self.points)
+        if '_envelope' not in self.__dict__:
+            xs, ys, zs = zip(*(p.xyz for polygon in self.polygons for p in polygon.points))
+            origin = Point(min(xs), min(ys), min(zs))
+            extent = Point(max(xs), max(ys), max(zs))
+            self._envelope = (origin, extent)
+        origin, extent = self._envelope
         return Box(origin, extent - origin)
 
+    def bound(self):
+        """
+        Returns an axis-aligned box containing this shape, which may be larger
+        than its :py:meth:`envelope` but is cheaper to carry through
+        transforms:
+
+        >>> from petrify.geometry import tau
+        >>> box = Box(Point(0, 0, 0), Vector(1, 1, 1))
+        >>> box.rotate(Vector(0, 0, 1), tau / 8).bound().size().rounded(3)
+        Vector(1.414, 1.414, 1.0)
+
+        """
+        return self.envelope()
+
+    def apart(self, other):
+        """
+        Whether the bounds of this and an `other` node are separated, in which
+        case CSG operations between them are skipped:
+
+        >>> box = Box(Point(0, 0, 0), Vector(1, 1, 1))
+        >>> box.apart(box + Vector(2, 0, 0))
+        True
+        >>> box.apart(box + Vector(0.5, 0, 0))
+        False
+
+        """
+        a, b = self.bound(), other.bound()
+        return any(
+            a.extent[axis] < b.origin[axis] or b.extent[axis] < a.origin[axis]
+            for axis in range(3)
+        )
+
+    def index(self, normal=Vector(0, 0, 1)):
+        """
+        Returns a :py:class:`~petrify.index.FaceIndex` of this shape's
+        polygons along a `normal`, built on first use and kept for later
+        queries:
+
+        >>> box = Box(Point(0, 0, 0), Vector(1, 1, 1))
+        >>> len(box.index().crossing(0.5))
+        4
+        >>> box.index() is box.index()
+        True
+
+        """
+        from .index import FaceIndex
+        indices = self.__dict__.setdefault('_indices', {})
+        key = tuple(normal.normalized().xyz)
+        if key not in indices:
+            indices[key] = FaceIndex(self.polygons, normal)
+        return indices[key]
+
+    def bvh(self):
+        """
+        Returns a :py:class:`~petrify.space.bvh.BVH` over this shape's
+        polygons for ray casts, closest point and collision queries, built on
+        first use:
+
+        >>> from petrify.space import Ray
+        >>> box = Box(Point(0, 0, 0), Vector(1, 1, 1))
+        >>> box.bvh().intersect(Ray(Point(0.5, 0.5, 3), Vector(0, 0, -1)))
+        Point(0.5, 0.5, 1.0)
+        >>> box.bvh() is box.bvh()
+        True
+
+        """
+        from .space.bvh import BVH
+        if '_bvh' not in self.__dict__:
+            self._bvh = BVH(self.polygons)
+        return self._bvh
+
     def mesh(self):
         import numpy as np
         import pythreejs as js
@@ -374,19 +476,27 @@ class Extrusion(Node):
 
     def generate_polygons(self):
         """ Calculates all polygons for this shape. """
-        levels = [
-            [
-                *s.to_face(Face.Positive).project(exterior=True),
-                *s.to_face(Face.Negative).project(exterior=False)
-            ] for s in self.slices
-        ]
-
         bottom = self.create_cap(self.slices[0], Face.Positive)
-        middle = [
-            p for la, lb in zip(levels, levels[1:])
-            for a, b in zip(la, lb)
-            for p in self.ring(a, b)
-        ]
+        quads = (len(self.slices) - 1) * len(self.slices[0].polygon)
+        middle = None
+        if quads >= BATCHED:
+            try:
+                middle = self.batched_rings()
+            except ImportError:
+                # numpy is optional; build quad by quad without it.
+                pass
+        if middle is None:
+            levels = [
+                [
+                    *s.to_face(Face.Positive).project(exterior=True),
+                    *s.to_face(Face.Negative).project(exterior=False)
+                ] for s in self.slices
+            ]
+            middle = [
+                p for la, lb in zip(levels, levels[1:])
+                for a, b in zip(la, lb)
+                for p in self.ring(a, b)
+            ]
         top = self.create_cap(self.slices[-1], Face.Negative)
 
         return [*bottom, *middle, *top]
@@ -401,6 +511,73 @@ class Extrusion(Node):
                      for la, lb in zip(lines, lines[1:] + [lines[0]])]
         return [p for p in polygons if p is not None]
 
+    def batched_rings(self):
+        """
+        Builds the same quads as :py:meth:`ring` for every pair of slices at
+        once, from a single array of all projected vertices. Only quads with
+        coinciding vertices are simplified point by point.
+
+        """
+        import numpy as np
+
+        def loops(s):
+            polygon = s.polygon
+            if isinstance(polygon, plane.ComplexPolygon):
+                return [
+                    *((Face.Positive, p) for p in polygon.exterior),
+                    *((Face.Negative, p) for p in polygon.interior),
+                ]
+            return [(Face.Positive, polygon)]
+
+        layout = loops(self.slices[0])
+        offsets = [0]
+        for _, loop in layout:
+            offsets.append(offsets[-1] + len(loop.points))
+
+        xy = np.array([
+            [p.xy for _, loop in loops(s) for p in loop.points]
+            for s in self.slices
+        ], dtype=np.float64)
+
+        # Wind each loop of each slice as its face would.
+        order = np.empty(xy.shape[:2], dtype=np.int64)
+        for (direction, _), start, end in zip(layout, offsets, offsets[1:]):
+            x, y = xy[:, start:end, 0], xy[:, start:end, 1]
+            dx = np.roll(x, -1, axis=1) - x
+            clockwise = (dx * (np.roll(y, -1, axis=1) + y)).sum(axis=1) > 0
+            wanted = np.array([Face.clockwise(s.basis, direction) for s in self.slices])
+            forward = np.arange(start, end)
+            order[:, start:end] = np.where((clockwise == wanted)[:, np.newaxis], forward, forward[::-1])
+        xy = np.take_along_axis(xy, order[:, :, np.newaxis], axis=1)
+
+        def axes(name):
+            return np.array([getattr(s.basis, name).xyz for s in self.slices], dtype=np.float64)[:, np.newaxis]
+        vertices = axes('origin') + axes('bx') * xy[:, :, 0:1] + axes('by') * xy[:, :, 1:2]
+        points = [[Point3(*v) for v in level] for level in vertices.tolist()]
+
+        # Quads run from the upper ring down to the lower one, as in `ring`;
+        # only those with vertices that snap together need simplifying.
+        tolerance = 0.0001
+        degenerate = []
+        for start, end in zip(offsets, offsets[1:]):
+            a, b = vertices[:-1, start:end], vertices[1:, start:end]
+            corners = np.stack([b, np.roll(b, -1, axis=1), np.roll(a, -1, axis=1), a], axis=2)
+            snapped = np.round(corners / tolerance) * tolerance
+            degenerate.append((snapped == np.roll(snapped, 1, axis=2)).all(axis=3).any(axis=2).tolist())
+
+        polygons = []
+        for ix, (bottom, top) in enumerate(zip(points, points[1:])):
+            for start, end, flags in zip(offsets, offsets[1:], degenerate):
+                for jx in range(start, end):
+                    nx = jx + 1 if jx + 1 < end else start
+                    quad = Polygon3([top[jx], top[nx], bottom[nx], bottom[jx]])
+                    if flags[ix][jx - start]:
+                        quad = quad.simplify(tolerance)
+                        if quad is None:
+                            continue
+                    polygons.append(quad)
+        return polygons
+
 class Transformed(Node):
     """
     Geometry that has had a matrix transform applied to it.
@@ -414,12 +591,28 @@ class Transformed(Node):
         self.matrix = matrix
 
         polygons = [
-            Polygon([matrix * point for point in polygon.points])
+            Polygon(matrix.transform_points(polygon.points))
             for polygon in prior.polygons
         ]
         super().__init__(polygons)
         self.view_data = prior.view_data
 
+    def bound(self):
+        if '_envelope' in self.__dict__:
+            return self.envelope()
+        if '_bound' not in self.__dict__:
+            # The eight corners of the prior bound, transformed, contain
+            # every transformed point without visiting any of them.
+            prior = self.prior.bound()
+            o, e = prior.origin, prior.extent
+            corners = self.matrix.transform_points([
+                Point(x, y, z) for x in (o.x, e.x) for y in (o.y, e.y) for z in (o.z, e.z)
+            ])
+            xs, ys, zs = zip(*(p.xyz for p in corners))
+            self._bound = (Point(min(xs), min(ys), min(zs)), Point(max(xs), max(ys), max(zs)))
+        origin, extent = self._bound
+        return Box(origin, extent - origin)
+
 class Union(Node):
     """
     Defines a union of a list of `parts`:
@@ -523,18 +716,45 @@ class Spun(Node):
 
         super().__init__(self.generate_polygons())
 
+    @classmethod
+    def revolved(cls, axis, start, profile, segments=None, tolerance=None):
+        """
+        Spins a single `profile` a full turn around the `axis` in `segments`
+        steps, by default chosen from its furthest point from the axis:
+
+        >>> from petrify.tessellation import Tolerance
+        >>> tri = Polygon([Point(1, 0), Point(2, 1), Point(1, 2)])
+        >>> len(Spun.revolved(Vector.basis.z, Vector.basis.y, tri, 4).turns)
+        5
+        >>> fine = Tolerance(chord=0.01)
+        >>> len(Spun.revolved(Vector.basis.z, Vector.basis.y, tri, tolerance=fine).turns)
+        33
+
+        """
+        radius = max(abs(p.x) for p in profile.points)
+        segments = tessellation.segments(radius, segments, tolerance)
+        return cls(axis, start, [profile] * (segments + 1))
+
     def profile(self, polygon, angle):
-        bx = self.start.rotate(self.axis, angle)
-        return Polygon([
-            (p.x * bx + p.y * self.axis).point()
+        return self._profile(polygon, self.start.rotate(self.axis, angle))
+
+    def _profile(self, polygon, bx):
+        axis = self.axis
+        return Polygon3([
+            Point3(
+                p.x * bx.x + p.y * axis.x,
+                p.x * bx.y + p.y * axis.y,
+                p.x * bx.z + p.y * axis.z
+            )
             for p in polygon.points
         ])
 
     def profiles(self):
         steps = len(self.turns) - 1
+        table = tessellation.unit_circle(steps, closed=True)
         return [
-            self.profile(polygon, tau * float(ix) / steps)
-            for ix, polygon in enumerate(self.turns)
+            self._profile(polygon, self.start.rotate_by(self.axis, c, s))
+            for polygon, (c, s) in zip(self.turns, table)
         ]
 
     def construction(self):
@@ -575,15 +795,19 @@ class Cylinder(PolygonExtrusion):
         the radius of the cylinder.
     `segments` :
         the number of quads to use when approximating the cylinder.
+    `tolerance` :
+        a :py:class:`~petrify.tessellation.Tolerance` choosing the number of
+        quads from the radius when `segments` is not given. Defaults to the
+        global :py:data:`petrify.tessellation.quality`.
 
     """
 
-    def __init__(self, origin, axis, radius, segments=10):
+    def __init__(self, origin, axis, radius, segments=None, tolerance=None):
         self.origin = origin
         self.axis = axis
         self.radius = radius
 
-        circle = shape.Circle(Point(0, 0), radius, segments)
+        circle = shape.Circle(Point(0, 0), radius, segments, tolerance)
         bx = perpendicular(axis).normalized()
         by = bx.cross(axis).normalized()
         bottom = PlanarPolygon(Basis(origin, bx, by), circle)
@@ -609,22 +833,23 @@ class Sphere(Extrusion):
     `segments` :
         the number of longitudinal circles and segments to use when
         approximating the sphere.
+    `tolerance` :
+        a :py:class:`~petrify.tessellation.Tolerance` choosing `segments` from
+        the radius when they are not given. Defaults to the global
+        :py:data:`petrify.tessellation.quality`.
 
     """
-    def __init__(self, center, radius, segments=10):
+    def __init__(self, center, radius, segments=None, tolerance=None):
         self.center = center
         self.radius = radius
+        segments = tessellation.segments(radius, segments, tolerance)
 
-        angles = list(tau * float(a) / segments for a in range(segments))
         circle = shape.Circle(Point(0, 0), self.radius, segments)
 
         start = Basis.xy + Vector(*center.xyz)
         dz = Vector.basis.z * self.radius
         slices = [
-            PlanarPolygon(
-                start + (dz * math.cos(beta)),
-                circle * math.sin(beta)
-            )
-            for beta in (a / 2 for a in angles)
+            PlanarPolygon(start + (dz * c), circle * s)
+            for c, s in tessellation.unit_semicircle(segments)
         ]
         super().__init__(slices)
@@ -37,3 +37,28 @@ def solve_matrix(A):
             A[k][n] -= A[k][i] * x[i]
 
     return x
+
+def solve_2x2(A):
+    """
+    Solve a system of two equations, given as a 2x3 augmented matrix, in
+    closed form. Singular systems raise `ZeroDivisionError`.
+
+    """
+    (a, b, e), (c, d, f) = A
+    det = a * d - b * c
+    return [(e * d - b * f) / det, (a * f - e * c) / det]
+
+def solve_2x2s(systems):
+    """
+    Solve many 2x3 augmented systems at once, giving `None` for any that are
+    singular.
+
+    """
+    solutions = []
+    for (a, b, e), (c, d, f) in systems:
+        det = a * d - b * c
+        if det == 0:
+            solutions.append(None)
+        else:
+            solutions.append([(e * d - b * f) / det, (a * f - e * c) / det])
+    return solutions
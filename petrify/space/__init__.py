@@ -81,11 +81,20 @@ class Polygon3(AbstractPolygon, Spatial):
     >>> len(tri)
     3
 
+    The plane is only computed when first used.
+
     """
+    __slots__ = ['points', '_plane']
 
     def __init__(self, points):
         self.points = points
-        self.plane = Plane(*points[0:3])
+        self._plane = None
+
+    @property
+    def plane(self):
+        if self._plane is None:
+            self._plane = Plane(*self.points[0:3])
+        return self._plane
 
     def inverted(self):
         """
@@ -267,6 +276,8 @@ class Ray3(Line3):
     direction.
 
     """
+    __slots__ = ()
+
     def __repr__(self):
         return 'Ray({0!r}, {1!r})'.format(self.p, self.v)
 
@@ -275,6 +286,8 @@ class Ray3(Line3):
 Ray = Ray3
 
 class LineSegment3(Line3):
+    __slots__ = ()
+
     def __hash__(self):
         return hash((self.p, self.v))
 
@@ -688,6 +701,25 @@ class Face(PlanarPolygon):
     Negative = -1
 
     def __init__(self, basis, direction, polygon):
+        if Face.clockwise(basis, direction):
+            polygon = polygon.to_clockwise()
+        else:
+            polygon = polygon.to_counterclockwise()
+        super().__init__(basis, polygon)
+        self.direction = direction
+
+    @staticmethod
+    def clockwise(basis, direction):
+        """
+        Whether the exterior of a face in the given `direction` winds
+        clockwise when drawn on `basis`:
+
+        >>> Face.clockwise(Basis.xy, Face.Positive)
+        True
+        >>> Face.clockwise(Basis.xy, Face.Negative)
+        False
+
+        """
         assert direction in [Face.Positive, Face.Negative]
         a = basis.normal().angle(Vector3.basis.x)
         if a == tau / 4:
@@ -695,12 +727,7 @@ class Face(PlanarPolygon):
             if a == tau / 4:
                 a = basis.normal().angle(Vector3.basis.z)
         inverted = a > tau / 4
-        if inverted ^ (direction == Face.Negative):
-            polygon = polygon.to_counterclockwise()
-        else:
-            polygon = polygon.to_clockwise()
-        super().__init__(basis, polygon)
-        self.direction = direction
+        return not (inverted ^ (direction == Face.Negative))
 
     def simplified_projection(self):
         if isinstance(self.polygon, plane.Polygon) and self.polygon.is_convex():
@@ -0,0 +1,57 @@
+"""
+Batches of three-dimensional points and vectors, stored as contiguous NumPy
+arrays and operated on all at once:
+
+>>> from . import Matrix3, Point, Vector
+>>> points = PointArray3([Point(0, 0, 0), Point(1, 2, 3)])
+>>> points + Vector(1, 1, 1)
+PointArray3([[1.0, 1.0, 1.0], [2.0, 3.0, 4.0]])
+>>> (points - Point(1, 0, 0)).magnitude_squared()
+array([ 1., 13.])
+>>> Matrix3.translate(1, 0, 0) * points
+PointArray3([[1.0, 0.0, 0.0], [2.0, 2.0, 3.0]])
+>>> list(VectorArray3([Vector(1, 0, 0)]).cross(Vector(0, 1, 0)))
+[Vector(0.0, 0.0, 1.0)]
+
+Indexing and iteration give back scalar points and vectors:
+
+>>> points[1]
+Point(1.0, 2.0, 3.0)
+
+Arrays must be on the left of operators shared with scalar types.
+
+"""
+import numpy as np
+
+from ..array import VectorArray
+from .point import Point3, Vector3
+
+class VectorArray3(VectorArray):
+    """ An array of :py:class:`~petrify.space.Vector3`. """
+    __slots__ = []
+    dimensions = 3
+    matrix_size = 4
+    element = Vector3
+
+    @property
+    def x(self): return self.values[:, 0]
+
+    @property
+    def y(self): return self.values[:, 1]
+
+    @property
+    def z(self): return self.values[:, 2]
+
+    def cross(self, other):
+        """ The cross products of these vectors with `other`. """
+        values, _ = self._coerce(other)
+        return VectorArray3._wrap(np.cross(self.values, values))
+
+class PointArray3(VectorArray3):
+    """ An array of :py:class:`~petrify.space.Point3`. """
+    __slots__ = []
+    is_point = True
+    element = Point3
+
+VectorArray3.vectors = PointArray3.vectors = VectorArray3
+VectorArray3.points = PointArray3.points = PointArray3
@@ -0,0 +1,313 @@
+"""
+A bounding volume hierarchy over the faces of a mesh, for ray casts, closest
+point queries and collision tests that only visit faces near the query:
+
+>>> from petrify.solid import Box
+>>> from . import Point, Ray, Vector
+>>> bvh = BVH(Box(Point(0, 0, 0), Vector(1, 1, 1)).polygons)
+>>> bvh.intersect(Ray(Point(0.5, 0.5, 5), Vector(0, 0, -1)))
+Point(0.5, 0.5, 1.0)
+>>> bvh.closest(Point(3, 0.5, 0.5))
+Point(1.0, 0.5, 0.5)
+>>> bvh.overlaps(BVH(Box(Point(0.5, 0.5, 0.5), Vector(1, 1, 1)).polygons))
+True
+
+Faces are split into triangles as in :py:meth:`petrify.solid.Node.mesh`,
+sorted along a Morton curve through their centroids and grouped into leaves.
+Boxes of neighbouring leaves are then merged pairwise, level by level, up to
+a single root. Queries walk the tree a level at a time, testing every
+surviving box of a level at once.
+
+Most uses should go through :py:meth:`petrify.solid.Node.bvh`, which builds
+the hierarchy once per node.
+
+"""
+import numpy as np
+
+from . import LineSegment3, Point3, Ray3
+
+LEAF = 4
+
+def _dot(a, b):
+    return (a * b).sum(axis=-1)
+
+def _spread(v):
+    """ Spreads the low ten bits of each of `v` to every third bit. """
+    v = v.astype(np.uint64)
+    for shift, mask in ((16, 0x030000FF), (8, 0x0300F00F), (4, 0x030C30C3), (2, 0x09249249)):
+        v = (v | (v << np.uint64(shift))) & np.uint64(mask)
+    return v
+
+def morton(points):
+    """ Morton codes of `points`, an `(n, 3)` array, within their bounds. """
+    lo, hi = points.min(axis=0), points.max(axis=0)
+    scale = np.where(hi > lo, hi - lo, 1.0)
+    cells = np.clip((points - lo) / scale * 1023, 0, 1023).astype(np.uint64)
+    x, y, z = (_spread(c) for c in cells.T)
+    return x | (y << np.uint64(1)) | (z << np.uint64(2))
+
+def triangles(polygons):
+    """
+    Corner arrays `a`, `b` and `c` of the fan triangles of `polygons`, and the
+    index of the polygon each triangle came from.
+
+    """
+    corners, owners = [], []
+    for ix, polygon in enumerate(polygons):
+        points = [p.xyz for p in polygon.points]
+        for jx in range(1, len(points) - 1):
+            corners.append((points[0], points[jx], points[jx + 1]))
+            owners.append(ix)
+    corners = np.array(corners, dtype=np.float64).reshape((-1, 3, 3))
+    return corners[:, 0], corners[:, 1], corners[:, 2], np.array(owners, dtype=np.int64)
+
+def crossings(o, d, a, b, c, start, end):
+    """
+    Parameters `t` along lines `o + t * d` where they cross triangles `abc`,
+    and whether each does so between `start` and `end`. All arrays broadcast
+    row by row.
+
+    """
+    e1, e2 = b - a, c - a
+    p = np.cross(d, e2)
+    det = _dot(e1, p)
+    s = o - a
+    q = np.cross(s, e1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        u = _dot(s, p) / det
+        v = _dot(d, q) / det
+        t = _dot(e2, q) / det
+        eps = 1e-9
+        hit = (det != 0) & (u >= -eps) & (v >= -eps) & (u + v <= 1 + eps) & \
+            (t >= start - eps) & (t <= end + eps)
+    return t, hit
+
+def closest_points(p, a, b, c):
+    """ The closest point on each triangle `abc` to each of `p`. """
+    ab, ac = b - a, c - a
+    ap, bp, cp = p - a, p - b, p - c
+    d1, d2 = _dot(ab, ap), _dot(ac, ap)
+    d3, d4 = _dot(ab, bp), _dot(ac, bp)
+    d5, d6 = _dot(ab, cp), _dot(ac, cp)
+    va = d3 * d6 - d5 * d4
+    vb = d5 * d2 - d1 * d6
+    vc = d1 * d4 - d3 * d2
+
+    # The Voronoi regions of each corner and edge, tested in order, then the
+    # face itself.
+    with np.errstate(divide='ignore', invalid='ignore'):
+        on_ab = d1 / (d1 - d3)
+        on_ac = d2 / (d2 - d6)
+        on_bc = (d4 - d3) / ((d4 - d3) + (d5 - d6))
+        total = va + vb + vc
+        v, w = vb / total, vc / total
+
+    conditions = [
+        (d1 <= 0) & (d2 <= 0),
+        (d3 >= 0) & (d4 <= d3),
+        (vc <= 0) & (d1 >= 0) & (d3 <= 0),
+        (d6 >= 0) & (d5 <= d6),
+        (vb <= 0) & (d2 >= 0) & (d6 <= 0),
+        (va <= 0) & (d4 - d3 >= 0) & (d5 - d6 >= 0),
+    ]
+    choices = [
+        a,
+        b,
+        a + ab * on_ab[:, np.newaxis],
+        c,
+        a + ac * on_ac[:, np.newaxis],
+        b + (c - b) * on_bc[:, np.newaxis],
+    ]
+    conditions = [m[:, np.newaxis] for m in conditions]
+    face = a + ab * v[:, np.newaxis] + ac * w[:, np.newaxis]
+    return np.select(conditions, choices, face)
+
+def _merged(lo, hi):
+    """ Boxes of each pair of neighbouring boxes, with any odd one carried. """
+    even = len(lo) - len(lo) % 2
+    low = np.minimum(lo[0:even:2], lo[1:even:2])
+    high = np.maximum(hi[0:even:2], hi[1:even:2])
+    return np.concatenate([low, lo[even:]]), np.concatenate([high, hi[even:]])
+
+def _children(nodes, count):
+    children = np.concatenate([2 * nodes, 2 * nodes + 1])
+    return children[children < count]
+
+def _line(line):
+    """ Origin, direction and parameter range of a line, ray or segment. """
+    o = np.array(line.p.xyz, dtype=np.float64)
+    d = np.array(line.v.xyz, dtype=np.float64)
+    if isinstance(line, LineSegment3):
+        return o, d, 0.0, 1.0
+    elif isinstance(line, Ray3):
+        return o, d, 0.0, np.inf
+    return o, d, -np.inf, np.inf
+
+class BVH:
+    """
+    A hierarchy of axis-aligned boxes over the fan triangles of `polygons`,
+    with at most `leaf` triangles in each of the lowest boxes.
+
+    """
+    def __init__(self, polygons, leaf=LEAF):
+        self.polygons = list(polygons)
+        self.leaf = leaf
+
+        a, b, c, owners = triangles(self.polygons)
+        order = np.argsort(morton((a + b + c) / 3), kind='stable') \
+            if len(owners) else owners
+        self.a, self.b, self.c = a[order], b[order], c[order]
+        self.owners = owners[order]
+
+        self.levels = []
+        if len(owners):
+            lo = np.minimum(np.minimum(self.a, self.b), self.c)
+            hi = np.maximum(np.maximum(self.a, self.b), self.c)
+            # Pad the leaves slightly so rays grazing flat faces still visit
+            # them.
+            pad = 1e-9 * max(1.0, np.abs(np.concatenate([lo, hi])).max())
+            starts = np.arange(0, len(owners), leaf)
+            level = (np.minimum.reduceat(lo, starts) - pad, np.maximum.reduceat(hi, starts) + pad)
+            self.levels.append(level)
+            while len(level[0]) > 1:
+                level = _merged(*level)
+                self.levels.append(level)
+            # Root first, so the children of node `i` on one level are nodes
+            # `2i` and `2i + 1` on the next.
+            self.levels.reverse()
+
+    def __len__(self):
+        return len(self.owners)
+
+    def _members(self, leaves):
+        ix = (leaves[:, np.newaxis] * self.leaf + np.arange(self.leaf)).ravel()
+        return ix[ix < len(self.owners)]
+
+    def _search(self, keep):
+        """
+        Triangles in leaves reached by descending through the boxes passing
+        `keep(lo, hi)`, which tests the boxes of a level at once.
+
+        """
+        nodes = np.zeros(min(1, len(self.owners)), dtype=np.int64)
+        for depth, (lo, hi) in enumerate(self.levels):
+            if depth:
+                nodes = _children(nodes, len(lo))
+            nodes = nodes[keep(lo[nodes], hi[nodes])]
+            if not len(nodes):
+                break
+        return self._members(nodes)
+
+    def cast(self, line):
+        """
+        The first point along `line`, a :py:class:`~petrify.space.Line`,
+        :py:class:`~petrify.space.Ray` or
+        :py:class:`~petrify.space.LineSegment`, where it crosses a face, and
+        that face; or `None` if it crosses none.
+
+        """
+        o, d, start, end = _line(line)
+        parallel = d == 0
+
+        def keep(lo, hi):
+            with np.errstate(divide='ignore', invalid='ignore'):
+                t0, t1 = (lo - o) / d, (hi - o) / d
+            inside = (lo <= o) & (o <= hi)
+            near = np.where(parallel, np.where(inside, -np.inf, np.inf), np.minimum(t0, t1))
+            far = np.where(parallel, np.where(inside, np.inf, -np.inf), np.maximum(t0, t1))
+            return np.maximum(near.max(axis=1), start) <= np.minimum(far.min(axis=1), end)
+
+        ix = self._search(keep)
+        t, hit = crossings(o, d, self.a[ix], self.b[ix], self.c[ix], start, end)
+        if not hit.any():
+            return None
+        best = np.argmin(np.where(hit, t, np.inf))
+        point = Point3(*(o + d * t[best]).tolist())
+        return point, self.polygons[self.owners[ix[best]]]
+
+    def intersect(self, line):
+        """ The first point along `line` where it crosses a face, or `None`. """
+        hit = self.cast(line)
+        return hit[0] if hit else None
+
+    def nearest(self, point):
+        """ The closest point on any face to `point`, and that face. """
+        q = np.array(point.xyz, dtype=np.float64)
+
+        def keep(lo, hi):
+            # Every box holds a face, so none lies further than the nearest
+            # box's farthest corner.
+            near = np.maximum(np.maximum(lo - q, q - hi), 0)
+            far = np.maximum(np.abs(lo - q), np.abs(hi - q))
+            near, far = _dot(near, near), _dot(far, far)
+            return near <= far.min()
+
+        ix = self._search(keep)
+        if not len(ix):
+            return None
+        closest = closest_points(q, self.a[ix], self.b[ix], self.c[ix])
+        distances = _dot(closest - q, closest - q)
+        best = np.argmin(np.where(np.isnan(distances), np.inf, distances))
+        return Point3(*closest[best].tolist()), self.polygons[self.owners[ix[best]]]
+
+    def closest(self, point):
+        """ The closest point on any face to `point`, or `None` if empty. """
+        found = self.nearest(point)
+        return found[0] if found else None
+
+    def colliding(self, other):
+        """
+        Pairs of faces from this and an `other` hierarchy that cross each
+        other. Faces that only touch within a shared plane are not reported.
+
+        """
+        if not self.levels or not other.levels:
+            return []
+
+        a = b = np.zeros(1, dtype=np.int64)
+        da = db = 0
+        while True:
+            alo, ahi = self.levels[da]
+            blo, bhi = other.levels[db]
+            touching = np.all((alo[a] <= bhi[b]) & (blo[b] <= ahi[a]), axis=1)
+            a, b = a[touching], b[touching]
+
+            # Descend whichever hierarchy has further to go.
+            remaining_a = len(self.levels) - da - 1
+            remaining_b = len(other.levels) - db - 1
+            if not len(a) or not (remaining_a or remaining_b):
+                break
+            elif remaining_a >= remaining_b:
+                da += 1
+                count = len(self.levels[da][0])
+                a, b = np.concatenate([2 * a, 2 * a + 1]), np.concatenate([b, b])
+                valid = a < count
+            else:
+                db += 1
+                count = len(other.levels[db][0])
+                a, b = np.concatenate([a, a]), np.concatenate([2 * b, 2 * b + 1])
+                valid = b < count
+            a, b = a[valid], b[valid]
+
+        ta = a[:, np.newaxis, np.newaxis] * self.leaf + \
+            np.arange(self.leaf)[np.newaxis, :, np.newaxis]
+        tb = b[:, np.newaxis, np.newaxis] * other.leaf + \
+            np.arange(other.leaf)[np.newaxis, np.newaxis, :]
+        ta, tb = (v.ravel() for v in np.broadcast_arrays(ta, tb))
+        valid = (ta < len(self.owners)) & (tb < len(other.owners))
+        ta, tb = ta[valid], tb[valid]
+
+        first = (self.a[ta], self.b[ta], self.c[ta])
+        second = (other.a[tb], other.b[tb], other.c[tb])
+        hit = np.zeros(len(ta), dtype=bool)
+        for corners, triangle in ((first, second), (second, first)):
+            for p, q in zip(corners, corners[1:] + corners[:1]):
+                _, crossed = crossings(p, q - p, *triangle, 0.0, 1.0)
+                hit |= crossed
+
+        pairs = sorted(set(zip(self.owners[ta[hit]].tolist(), other.owners[tb[hit]].tolist())))
+        return [(self.polygons[i], other.polygons[j]) for i, j in pairs]
+
+    def overlaps(self, other):
+        """ Whether any face of this hierarchy crosses one of `other`. """
+        return bool(self.colliding(other))
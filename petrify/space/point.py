@@ -257,6 +257,14 @@ class Vector3(generic.Concrete, generic.Vector, Spatial):
 
         """
 
+        return self.rotate_by(axis, math.cos(theta), math.sin(theta))
+
+    def rotate_by(self, axis, cosine, sine):
+        """
+        Return a new vector rotated around `axis` by the angle with the given
+        `cosine` and `sine`, such as those from a cached table.
+
+        """
         # Adapted from equations published by Glenn Murray.
         # http://inside.mines.edu/~gmurray/ArbitraryAxisRotation/ArbitraryAxisRotation.html
         x, y, z = self.x, self.y,self.z
@@ -265,8 +273,8 @@ class Vector3(generic.Concrete, generic.Vector, Spatial):
         # Extracted common factors for simplicity and efficiency
         r2 = u**2 + v**2 + w**2
         r = math.sqrt(r2)
-        ct = math.cos(theta)
-        st = math.sin(theta) / r
+        ct = cosine
+        st = sine / r
         dt = (u*x + v*y + w*z) * (1 - ct) / r2
         return Vector3((u * dt + x * ct + (-w * y + v * z) * st),
                        (v * dt + y * ct + ( w * x - u * z) * st),
@@ -311,6 +319,7 @@ class Vector3(generic.Concrete, generic.Vector, Spatial):
     basis = Basis()
 
 generic.Vector.basis = Vector3.basis
+generic.swizzle(Vector3, 'xyz')
 Vector = Vector3
 Vector3.bx = Vector3.basis.x
 Vector3.by = Vector3.basis.y
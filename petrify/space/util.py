@@ -1,4 +1,6 @@
 class Spatial:
+    __slots__ = ()
+
     @property
     def embedding(self):
         from petrify import space
@@ -0,0 +1,157 @@
+"""
+Choice of how many segments approximate a curved shape.
+
+Curved primitives such as :py:class:`~petrify.shape.Circle`,
+:py:class:`~petrify.solid.Cylinder` and :py:class:`~petrify.solid.Sphere`
+take an explicit number of `segments`. When none is given they ask the global
+:py:data:`quality` setting, which by default always answers ten:
+
+>>> segments(1)
+10
+>>> segments(100)
+10
+
+A :py:class:`Tolerance` instead picks the fewest segments that keep every
+chord within a distance of the true curve, so small features get few facets
+and large ones enough to stay smooth:
+
+>>> fine = Tolerance(chord=0.01)
+>>> segments(1, tolerance=fine)
+23
+>>> segments(100, tolerance=fine)
+223
+
+Set it globally to apply it to every curve built without explicit
+`segments`:
+
+>>> import petrify.tessellation
+>>> petrify.tessellation.quality = fine
+>>> segments(1)
+23
+>>> petrify.tessellation.quality = Fixed(10)
+
+Tolerances may carry `pint`_ units, given the units of the model:
+
+>>> from petrify import u
+>>> segments(25.4, tolerance=Tolerance(chord=0.0004 * u.inch, units=u.mm))
+112
+>>> segments(1, tolerance=Tolerance(chord=0.0004 * u.inch, units=u.inch))
+112
+
+.. _`pint`: https://pint.readthedocs.io/en/0.9/
+
+Curves built with the same number of segments share cached tables of the
+cosines and sines of their angles, such as :py:func:`unit_circle`.
+
+"""
+import functools
+import math
+
+from .geometry import tau
+from .util import frange
+
+def _magnitude(v, units):
+    if hasattr(v, 'm_as'):
+        assert units is not None, "units of the model are needed for {0!r}".format(v)
+        return v.m_as(units)
+    return v
+
+class Fixed:
+    """ Always approximates curves with the same number of `count` segments. """
+    def __init__(self, count):
+        assert count >= 3
+        self.count = count
+
+    def __repr__(self):
+        return "Fixed({0!r})".format(self.count)
+
+    def segments(self, radius):
+        return self.count
+
+class Tolerance:
+    """
+    Approximates a full turn of a curve with enough segments that no chord
+    strays further than `chord` from it, and no segment turns through more
+    than `angle` radians. Either may be omitted.
+
+    The count is kept between `minimum` and `maximum`. `units` are the units
+    of model coordinates, needed when `chord` is a `pint` quantity and the
+    radius is not.
+
+    """
+    def __init__(self, chord=None, angle=None, minimum=6, maximum=720, units=None):
+        assert chord is not None or angle is not None, "a chord or angle tolerance is required"
+        assert 3 <= minimum <= maximum
+        self.chord = chord
+        self.angle = angle
+        self.minimum = minimum
+        self.maximum = maximum
+        self.units = units
+
+    def __repr__(self):
+        return "Tolerance(chord={0!r}, angle={1!r})".format(self.chord, self.angle)
+
+    def segments(self, radius):
+        units = self.units if self.units is not None else getattr(radius, 'units', None)
+        r = abs(_magnitude(radius, units))
+
+        counts = [self.minimum]
+        if self.chord is not None:
+            chord = _magnitude(self.chord, units)
+            # A chord spanning `theta` bulges r * (1 - cos(theta / 2)) away.
+            if 0 < chord < r:
+                counts.append(math.ceil(tau / (2 * math.acos(1 - chord / r))))
+        if self.angle is not None:
+            counts.append(math.ceil(tau / self.angle))
+        return min(max(counts), self.maximum)
+
+quality = Fixed(10)
+
+def segments(radius, segments=None, tolerance=None):
+    """
+    The number of segments approximating a full turn at `radius`: `segments`
+    if given, otherwise from `tolerance` or, failing that, the global
+    :py:data:`quality`.
+
+    """
+    if segments is not None:
+        return segments
+    return (tolerance if tolerance is not None else quality).segments(radius)
+
+@functools.lru_cache(maxsize=None)
+def unit_circle(segments, closed=False):
+    """
+    The cosine and sine of each of `segments` equal steps around a full turn,
+    computed once per count:
+
+    >>> [tuple(round(v, 3) for v in cs) for cs in unit_circle(4)]
+    [(1.0, 0.0), (0.0, 1.0), (-1.0, 0.0), (-0.0, -1.0)]
+    >>> unit_circle(4) is unit_circle(4)
+    True
+
+    A `closed` table also includes the final step back to a full turn.
+
+    """
+    count = segments + 1 if closed else segments
+    angles = (tau * float(a) / segments for a in range(count))
+    return tuple((math.cos(theta), math.sin(theta)) for theta in angles)
+
+@functools.lru_cache(maxsize=None)
+def unit_semicircle(segments):
+    """
+    The cosine and sine of each of `segments` equal steps around half a turn,
+    computed once per count.
+
+    """
+    angles = (tau * float(a) / segments / 2 for a in range(segments))
+    return tuple((math.cos(theta), math.sin(theta)) for theta in angles)
+
+@functools.lru_cache(maxsize=1024)
+def unit_arc(start, end, segments):
+    """
+    The cosine and sine of `segments` evenly spaced angles from `start` to
+    `end`, inclusive, computed once per arc.
+
+    """
+    angles = frange(start, end, (end - start) / (segments - 1), inclusive=True)
+    return tuple((math.cos(theta), math.sin(theta)) for theta in angles)
@@ -1,5 +1,5 @@
 import math
-from .solver import solve_matrix
+from .solver import solve_2x2, solve_2x2s
 
 def index_by(it, f):
     # why this isn't a stdlib function like in every other sane language escapes
@@ -17,23 +17,55 @@ def center(obj, point):
     center = (e.origin + e.extent) / 2
     return obj + (-center + point)
 
+def _circle_system(p, np, l):
+    # l.p + l.v * x + l.normal * r == p + np * r
+    # l.v * x + (l.n - pn) * r == p - l.p
+    npn = np.normalized()
+    nl = l.v.cross().normalized()
+    c = p - l.p
+    b = (nl - npn)
+    a = l.v.normalized()
+    return npn, [list(row) for row in zip(a.xy, b.xy, c.xy)]
+
+def _circle(p, npn, l, solution):
+    x, r = solution
+    x = x / l.v.magnitude()
+    if x < 0 or x > 1: return None
+    return (p + npn * r, r, x)
+
 def locate_circle(p, np, l):
     try:
-        # l.p + l.v * x + l.normal * r == p + np * r
-        # l.v * x + (l.n - pn) * r == p - l.p
-        npn = np.normalized()
-        nl = l.v.cross().normalized()
-        c = p - l.p
-        b = (nl - npn)
-        a = l.v.normalized()
-        rows = zip(a.xy, b.xy, c.xy)
-        x, r = solve_matrix(list(list(row) for row in rows))
-        x = x / l.v.magnitude()
-        if x < 0 or x > 1: return None
-        return (p + npn * r, r, x)
+        npn, system = _circle_system(p, np, l)
+        return _circle(p, npn, l, solve_2x2(system))
     except ZeroDivisionError:
         return None
 
+def locate_circles(queries):
+    """
+    Batched :py:func:`locate_circle` over `(p, np, l)` triples, solving all of
+    their systems together.
+
+    """
+    systems = []
+    for p, np, l in queries:
+        try:
+            systems.append(_circle_system(p, np, l))
+        except ZeroDivisionError:
+            systems.append(None)
+
+    solutions = iter(solve_2x2s([s for _, s in filter(None, systems)]))
+    located = []
+    for (p, _, l), system in zip(queries, systems):
+        solution = None if system is None else next(solutions)
+        if solution is None:
+            located.append(None)
+        else:
+            try:
+                located.append(_circle(p, system[0], l, solution))
+            except ZeroDivisionError:
+                located.append(None)
+    return located
+
 def frange(a, b, step, inclusive=False):
     count = math.floor((float(b) - float(a)) / step)
     for ix in range(0, count + 1):
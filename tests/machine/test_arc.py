@@ -0,0 +1,78 @@
+import doctest
+import math
+import unittest
+
+from petrify.plane import Point, Vector
+from petrify.shape import Circle
+from petrify.machine import arc, Pocket, ContourStepFeed
+from petrify.machine.arc import fit
+from petrify.machine.motion import Arc, Motion
+
+from .test_feed import mpcnc, speeds, tool
+
+def load_tests(loader, tests, ignore):
+    tests.addTests(doctest.DocTestSuite(arc))
+    return tests
+
+class TestFit(unittest.TestCase):
+    def test_lines_unchanged(self):
+        square = [Point(0, 0), Point(0, 1), Point(1, 1), Point(1, 0), Point(0, 0)]
+        self.assertEqual(list(fit(square, 0.01)), square)
+
+        line = [Point(x, 0) for x in range(10)]
+        self.assertEqual(list(fit(line, 0.01)), line)
+
+    def test_closed_circle(self):
+        points = Circle(Point(0, 0), 5, segments=64).points
+        path = [*points, points[0]]
+        moves = list(fit(path, 0.01))
+
+        arcs = [m for m in moves if isinstance(m, Arc)]
+        self.assertTrue(1 <= len(arcs) <= 2)
+        self.assertLess(len(moves), 5)
+        self.assertEqual((moves[-1].x, moves[-1].y), (path[-1].x, path[-1].y))
+        for m in arcs:
+            self.assertAlmostEqual(math.hypot(m.i, m.j), 5, places=6)
+
+    def test_tolerance(self):
+        points = Circle(Point(0, 0), 5, segments=16).points
+        self.assertFalse(any(isinstance(m, Arc) for m in fit(points, 0.001)))
+        self.assertTrue(any(isinstance(m, Arc) for m in fit(points, 0.1)))
+
+class TestArc(unittest.TestCase):
+    def test_gcode(self):
+        cw = Arc(x=10, y=0, i=5, j=0, clockwise=True, f=100)
+        ccw = Arc(x=10, y=0, i=5, j=0, clockwise=False, f=100)
+        self.assertEqual(cw.gcode(), 'G02 X10 Y0 I5 J0 F100')
+        self.assertEqual(ccw.gcode(), 'G03 X10 Y0 I5 J0 F100')
+
+    def test_distance(self):
+        start = Motion(0, 0, 0, 100)
+        half = Arc(x=10, y=0, i=5, j=0, clockwise=True)
+        quarter = Arc(x=5, y=5, i=5, j=0, clockwise=True)
+        three = Arc(x=5, y=5, i=5, j=0, clockwise=False)
+        full = Arc(x=0, y=0, i=5, j=0, clockwise=False)
+
+        self.assertAlmostEqual(half.distance(start), 5 * math.pi)
+        self.assertAlmostEqual(quarter.distance(start), 2.5 * math.pi)
+        self.assertAlmostEqual(three.distance(start), 7.5 * math.pi)
+        self.assertAlmostEqual(full.distance(start), 10 * math.pi)
+
+    def test_translate(self):
+        moved = Arc(x=10, y=0, i=5, j=0, clockwise=True) + Vector(1, 2)
+        self.assertEqual((moved.x, moved.y, moved.i, moved.j), (11, 2, 5, 0))
+
+class TestArcFeed(unittest.TestCase):
+    def test_fewer_commands_similar_time(self):
+        pocket = Pocket(Circle(Point(0, 0), 5, segments=32), 1.0)
+
+        def cut(feed):
+            configuration = mpcnc.configure(feed, speeds, tool)
+            return feed.pocket(configuration, pocket)
+
+        lines = cut(ContourStepFeed(0.5, 1.0))
+        arcs = cut(ContourStepFeed(0.5, 1.0, arc_tolerance=0.05))
+
+        count = lambda c: sum(1 for _ in c.commands())
+        self.assertLess(count(arcs), count(lines))
+        self.assertAlmostEqual(arcs.time(), lines.time(), delta=lines.time() * 0.01)
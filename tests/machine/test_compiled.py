@@ -0,0 +1,66 @@
+import doctest
+import io
+import unittest
+
+from petrify.plane import Point, Vector
+from petrify.shape import Circle
+from petrify.machine import compiled, Batch, ContourStepFeed, LinearStepFeed, Pocket
+from petrify.machine.commands import Pause
+from petrify.machine.compiled import Compiled
+from petrify.machine.motion import Arc, Motion
+
+from .test_feed import mpcnc, speeds, tool, TestLinearStepFeed
+
+def load_tests(loader, tests, ignore):
+    tests.addTests(doctest.DocTestSuite(compiled))
+    return tests
+
+def gcode(cut):
+    out = io.StringIO()
+    cut.gcode(out)
+    return out.getvalue()
+
+class TestCompiled(unittest.TestCase):
+    def cut(self):
+        pocket = TestLinearStepFeed().pocket()
+        pocket.depth = 2.0
+        feed = LinearStepFeed(0.5, 1.0)
+        scan = feed.pocket(mpcnc.configure(feed, speeds, tool), pocket)
+
+        circle = Pocket(Circle(Point(5, 5), 2, segments=16), 1.0)
+        contour = ContourStepFeed(0.5, 1.0, arc_tolerance=0.05)
+        arcs = contour.pocket(mpcnc.configure(contour, speeds, tool), circle)
+        return Batch([scan.props(color=[1, 0, 0]), Pause('flip'), arcs])
+
+    def test_round_trip(self):
+        cut = self.cut()
+        commands = list(cut.commands())
+        round_tripped = list(cut.compile().commands())
+        self.assertEqual(len(commands), len(round_tripped))
+        for (p1, c1), (p2, c2) in zip(commands, round_tripped):
+            self.assertIs(p1, p2)
+            self.assertEqual(type(c1), type(c2))
+            self.assertEqual(vars(c1), vars(c2))
+
+    def test_gcode_matches_writer(self):
+        cut = self.cut()
+        self.assertEqual(gcode(cut.compile()), gcode(cut))
+
+    def test_time(self):
+        cut = self.cut()
+        self.assertAlmostEqual(cut.compile().time(), cut.time())
+
+    def test_translate(self):
+        cut = self.cut()
+        v = Vector(3, 7)
+        self.assertEqual(gcode(cut.compile() + v), gcode(cut + v))
+
+    def test_segments(self):
+        compiled = Compiled([
+            (None, Motion(x=1.0, f=600.0)),
+            (None, Motion(y=2.0, f=600.0)),
+        ])
+        start, end, phase = compiled.segments()
+        self.assertEqual(start.tolist(), [[0, 0, 0], [1, 0, 0]])
+        self.assertEqual(end.tolist(), [[1, 0, 0], [1, 2, 0]])
+        self.assertEqual(phase.tolist(), [0, 0])
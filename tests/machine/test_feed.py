@@ -9,12 +9,18 @@ from petrify.machine import (
     Pocket,
     StraightTip,
     Tab,
+    ContourStepFeed,
     LinearStepFeed,
+    TrochoidalStepFeed,
     Machine,
-    Format
+    Format,
+    RasterFinish
 )
 from petrify.machine.feed import batch_scanlines, Speed
+from petrify.machine.link import StayDown, distance_squared
+from petrify.machine.motion import CutSteps, PlanarToolpath
 from petrify.shape import Circle
+from petrify.util import frange
 
 gspeed = u.mm / u.minute
 mpcnc = Machine(clearance=2.0 * u.mm, format=Format(u.mm, v = u.mm / u.minute))
@@ -132,6 +138,25 @@ class TestLinearStepFeed(unittest.TestCase):
         passes = feed.part(config, part).passes
         self.assertEqual(len(passes), 2)
 
+    def test_sequenced_part_keeps_direction(self):
+        # Off to one side of the origin, so the nearest end of the first
+        # piece is where it finishes.
+        r, center = 10, Point(20, -0.5)
+        circle = Polygon([
+            center + Vector(math.cos(theta) * r, math.sin(theta) * r)
+            for theta in (tau * (i + 0.5) / 12 for i in range(12))
+        ])
+        part = Part(circle, [Tab(Line(center, Vector(1, 0)), 2)], 1.0)
+
+        sequenced = LinearStepFeed(0.5, 1.0, sequence=True)
+        passes = sequenced.part(mpcnc.configure(sequenced, speeds, tool), part).passes
+        self.assertGreater(len(passes), 1)
+        for p in passes:
+            # Outlines are cut counterclockwise around the part.
+            for a, b in zip(p.path, p.path[1:]):
+                u, v = a - center, b - a
+                self.assertGreater(u.x * v.y - u.y * v.x, 0)
+
     def test_unworkable_pocket_removal(self):
         polygon = ComplexPolygon([
             Polygon([Point(0, 0), Point(0, 100), Point(100, 100), Point(100, 0)]),
@@ -161,3 +186,256 @@ class TestLinearStepFeed(unittest.TestCase):
         engrave = Engrave(polygon, 0.5)
         passes = feed.engrave(config, engrave).passes
         self.assertEqual(len(passes[0].path), 5)
+
+contour = ContourStepFeed(0.5, 1.0 * u.mm / u.layer)
+contour_config = mpcnc.configure(contour, speeds, tool)
+
+def uncut(passes, polygon, step=0.2):
+    """ Sampled tool centers within `polygon` that no pass comes near. """
+    reachable = polygon.offset(-0.25)
+    envelope = reachable.envelope()
+
+    # Segments bucketed by the unit cells their bounds overlap.
+    cells = {}
+    for path in passes:
+        for a, b in zip(path.path, path.path[1:]):
+            for x in range(math.floor(min(a.x, b.x)), math.floor(max(a.x, b.x)) + 1):
+                for y in range(math.floor(min(a.y, b.y)), math.floor(max(a.y, b.y)) + 1):
+                    cells.setdefault((x, y), []).append((a, b))
+
+    def near(p):
+        nearby = (
+            s for x in range(math.floor(p.x - 0.25), math.floor(p.x + 0.25) + 1)
+            for y in range(math.floor(p.y - 0.25), math.floor(p.y + 0.25) + 1)
+            for s in cells.get((x, y), [])
+        )
+        return any(distance_squared(p, a, b) <= 0.25 ** 2 + 1e-9 for a, b in nearby)
+
+    samples = (
+        Point(x, y)
+        for x in frange(envelope.origin.x, envelope.extent.x, step)
+        for y in frange(envelope.origin.y, envelope.extent.y, step)
+    )
+    return [p for p in samples if reachable.contains(p) and not near(p)]
+
+def off_centre_island():
+    return ComplexPolygon([
+        Polygon([Point(0, 0), Point(0, 6), Point(6, 6), Point(6, 0)]),
+        Polygon([Point(1, 1), Point(1, 5), Point(2.5, 5), Point(2.5, 1)]),
+    ])
+
+class TestContourStepFeed(unittest.TestCase):
+    def test_square(self):
+        square = Polygon([Point(0, 0), Point(0, 2), Point(2, 2), Point(2, 0)])
+        passes = contour.pocket(contour_config, Pocket(square, 1.0)).passes
+
+        self.assertEqual(len(passes), 1)
+        self.assertEqual(passes[0].path, [
+            Point(0.25, 0.25), Point(0.25, 1.75), Point(1.75, 1.75), Point(1.75, 0.25), Point(0.25, 0.25),
+            Point(0.5, 0.5), Point(0.5, 1.5), Point(1.5, 1.5), Point(1.5, 0.5), Point(0.5, 0.5),
+            Point(0.75, 0.75), Point(0.75, 1.25), Point(1.25, 1.25), Point(1.25, 0.75), Point(0.75, 0.75),
+            Point(0.875, 0.875), Point(0.875, 1.125), Point(1.125, 1.125), Point(1.125, 0.875), Point(0.875, 0.875),
+        ])
+
+    def test_island(self):
+        polygon = ComplexPolygon([
+            Polygon([Point(0, 0), Point(0, 3), Point(3, 3), Point(3, 0)]),
+            Polygon([Point(1, 1), Point(1, 2), Point(2, 2), Point(2, 1)])
+        ])
+        passes = contour.pocket(contour_config, Pocket(polygon, 1.0)).passes
+
+        island = Polygon([Point(0.75, 0.75), Point(0.75, 2.25), Point(2.25, 2.25), Point(2.25, 0.75)])
+        for path in passes:
+            for point in path.path:
+                self.assertTrue(0.25 <= point.x <= 2.75 and 0.25 <= point.y <= 2.75)
+                on_edge = any(s.connect(point).v.magnitude_squared() == 0 for s in island.segments())
+                self.assertTrue(on_edge or not island.contains(point))
+
+    def test_off_centre_island(self):
+        polygon = off_centre_island()
+        passes = contour.pocket(contour_config, Pocket(polygon, 1.0)).passes
+        self.assertEqual(uncut(passes, polygon), [])
+
+    def test_fewer_retracts_than_scanlines(self):
+        comb = Pocket(Polygon([
+            Point(0, 0), Point(10, 0), Point(10, 10), Point(8, 10),
+            Point(8, 2), Point(6, 2), Point(6, 10), Point(4, 10),
+            Point(4, 2), Point(2, 2), Point(2, 10), Point(0, 10)
+        ]), 1.0)
+
+        scanned = feed.pocket(config, comb).passes
+        contoured = contour.pocket(contour_config, comb).passes
+        self.assertLess(len(contoured), len(scanned))
+
+class TestStayDown(unittest.TestCase):
+    def commands(self, feed, pocket):
+        configuration = mpcnc.configure(feed, speeds, tool)
+        return [m for _, m in feed.pocket(configuration, pocket).commands()]
+
+    def retracts(self, commands):
+        return sum(1 for m in commands if m.z == 2.0)
+
+    def test_fewer_retracts(self):
+        pocket = TestLinearStepFeed().pocket()
+        pocket.depth = 2.0
+
+        for cls in (LinearStepFeed, ContourStepFeed):
+            retracting = self.commands(cls(0.5, 1.0), pocket)
+            linked = self.commands(cls(0.5, 1.0, stay_down=True), pocket)
+            self.assertLess(self.retracts(linked), self.retracts(retracting))
+            self.assertEqual(linked[-1].z, 2.0)
+
+    def test_links_avoid_island(self):
+        pocket = TestLinearStepFeed().pocket()
+        island = Polygon([Point(0.75, 0.75), Point(0.75, 2.25), Point(2.25, 2.25), Point(2.25, 0.75)])
+
+        commands = self.commands(LinearStepFeed(0.5, 1.0, stay_down=True), pocket)
+        current, raised = None, True
+        for m in commands:
+            if m.z is not None:
+                raised = m.z == 2.0
+            elif not raised and current is not None:
+                middle = current + (Point(m.x, m.y) - current) * 0.5
+                on_edge = any(s.connect(middle).v.magnitude_squared() == 0 for s in island.segments())
+                self.assertTrue(on_edge or not island.contains(middle))
+            if m.x is not None:
+                current = Point(m.x, m.y)
+
+    def test_uncut_stock(self):
+        square = Polygon([Point(0, 0), Point(0, 10), Point(10, 10), Point(10, 0)])
+        linking = StayDown(square.offset(-0.5), 0.5)
+        cleared = [(Point(1, 1), Point(1, 9))]
+
+        self.assertTrue(linking.connects(Point(1, 9), Point(1.5, 1), cleared))
+        self.assertFalse(linking.connects(Point(1, 9), Point(9, 9), cleared))
+
+    def test_links_between_depths(self):
+        def toolpath(*points):
+            path = PlanarToolpath(points[0])
+            for p in points[1:]:
+                path.move_to(p)
+            return path
+
+        # The last pass runs back to the start of the first, so the move
+        # between depths stays down at the shallower depth. That move cuts
+        # nothing at the deeper one, so the later link along it must retract.
+        passes = [
+            toolpath(Point(1, 1), Point(1, 3), Point(1.4, 3), Point(1.4, 1)),
+            toolpath(Point(8, 1), Point(8, 3)),
+            toolpath(Point(1, 1), Point(9, 1)),
+        ]
+        square = Polygon([Point(0, 0), Point(0, 10), Point(10, 10), Point(10, 0)])
+        linking = StayDown(square.offset(-0.5), 0.5)
+        cut = CutSteps(passes, [-1.0, -2.0], config, linking=linking)
+
+        z = None
+        for _, m in cut.commands():
+            if m.z is not None:
+                z = m.z
+            if (m.x, m.y) == (8, 1):
+                self.assertEqual(z, 2.0)
+
+trochoidal = TrochoidalStepFeed(0.5, 1.0 * u.mm / u.layer)
+trochoidal_config = mpcnc.configure(trochoidal, speeds, tool)
+
+class TestTrochoidalStepFeed(unittest.TestCase):
+    def segments(self, passes):
+        return [s for p in passes for s in zip(p.path, p.path[1:])]
+
+    def test_clears_pocket(self):
+        square = Polygon([Point(0, 0), Point(0, 3), Point(3, 3), Point(3, 0)])
+        passes = trochoidal.pocket(trochoidal_config, Pocket(square, 1.0)).passes
+        segments = self.segments(passes)
+
+        for p in (p for path in passes for p in path.path):
+            self.assertTrue(0.25 - 1e-9 <= p.x <= 2.75 + 1e-9)
+            self.assertTrue(0.25 - 1e-9 <= p.y <= 2.75 + 1e-9)
+
+        # Every point the tool can reach is within a tool radius of the path.
+        for x in range(3, 28, 4):
+            for y in range(3, 28, 4):
+                p = Point(x / 10, y / 10)
+                nearest = min(distance_squared(p, a, b) for a, b in segments)
+                self.assertLessEqual(nearest, 0.25 ** 2)
+
+    def test_bounded_advance(self):
+        square = Polygon([Point(0, 0), Point(0, 3), Point(3, 3), Point(3, 0)])
+        passes = trochoidal.pocket(trochoidal_config, Pocket(square, 1.0)).passes
+
+        # Each loop starts no more than `advance` of the diameter from the last.
+        for path in passes:
+            starts = path.path[::16]
+            for a, b in zip(starts, starts[1:]):
+                self.assertLessEqual((b - a).magnitude(), 0.1 * 0.5 + 1e-9)
+
+    def test_narrow_pocket(self):
+        narrow = Polygon([Point(0, 0), Point(0, 3), Point(0.7, 3), Point(0.7, 0)])
+        passes = trochoidal.pocket(trochoidal_config, Pocket(narrow, 1.0)).passes
+        self.assertTrue(passes)
+
+        options = dict(sequence=True, stay_down=True)
+        plain = ContourStepFeed(0.5, 1.0, **options)
+        paths = TrochoidalStepFeed(0.5, 1.0, **options).pocket(config, Pocket(narrow, 1.0)).passes
+        self.assertEqual(
+            [p.path for p in paths],
+            [p.path for p in plain.pocket(config, Pocket(narrow, 1.0)).passes]
+        )
+        self.assertEqual(vars(TrochoidalStepFeed(0.5, 1.0, **options).plain()), vars(plain))
+
+    def test_off_centre_island(self):
+        polygon = off_centre_island()
+        passes = trochoidal.pocket(trochoidal_config, Pocket(polygon, 1.0)).passes
+        self.assertEqual(uncut(passes, polygon), [])
+
+    def test_loop_direction(self):
+        square = Pocket(Polygon([Point(0, 0), Point(0, 3), Point(3, 3), Point(3, 0)]), 1.0)
+        centers = trochoidal.contours(config, square)
+        looped = trochoidal.passes(config, centers)
+        self.assertEqual(len(centers), len(looped))
+        for center, path in zip(centers, looped):
+            (_, clockwise), *_ = center.loops()
+            # The first loop turns the same way as the contour it follows.
+            self.assertEqual(Polygon(path.path[:16]).clockwise(), clockwise)
+
+class TestRestMachining(unittest.TestCase):
+    def square(self):
+        return Pocket(Polygon([Point(0, 0), Point(0, 4), Point(4, 4), Point(4, 0)]), 1.0) * u.mm
+
+    def test_corners_only(self):
+        big = mpcnc.configure(feed, speeds, StraightTip(2, 2.0) * u.mm)
+        passes = config.cut(self.square(), after=big).passes
+        full = config.cut(self.square()).passes
+
+        self.assertEqual(len(passes), 4)
+        self.assertLess(
+            sum(len(p.path) for p in passes),
+            sum(len(p.path) for p in full)
+        )
+
+        reached = Polygon([Point(1, 1), Point(1, 3), Point(3, 3), Point(3, 1)])
+        segments = [(a, b) for p in passes for a, b in zip(p.path, p.path[1:])]
+        for x in range(5, 40, 2):
+            for y in range(5, 40, 2):
+                p = Point(x / 20, y / 20)
+                outside = min(distance_squared(p, s.p1, s.p2) for s in reached.segments())
+                if reached.contains(p) or outside <= 1.0:
+                    continue
+                # Stock the large tool missed is within reach of a rest pass.
+                nearest = min(distance_squared(p, a, b) for a, b in segments)
+                self.assertLessEqual(nearest, 0.25 ** 2)
+
+    def test_smaller_prior(self):
+        small = mpcnc.configure(feed, speeds, StraightTip(2, 0.25) * u.mm)
+        self.assertEqual(config.cut(self.square(), after=small).passes, [])
+
+    def test_not_a_pocket(self):
+        big = mpcnc.configure(feed, speeds, StraightTip(2, 2.0) * u.mm)
+        square = Polygon([Point(0, 0), Point(0, 4), Point(4, 4), Point(4, 0)])
+        with self.assertRaisesRegex(ValueError, 'Part'):
+            config.cut(Part(square, [], 1.0) * u.mm, after=big)
+
+    def test_feed_without_rest(self):
+        finishing = mpcnc.configure(RasterFinish(0.5), speeds, tool)
+        big = mpcnc.configure(feed, speeds, StraightTip(2, 2.0) * u.mm)
+        with self.assertRaisesRegex(ValueError, 'RasterFinish'):
+            finishing.cut(self.square(), after=big)
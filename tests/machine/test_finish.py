@@ -0,0 +1,139 @@
+import doctest
+import math
+import random
+import unittest
+from types import SimpleNamespace
+
+from petrify import u
+from petrify.solid import Box, Node
+from petrify.space import Point, Polygon, Vector
+from petrify.machine import (
+    RasterFinish,
+    Surface,
+    VBit,
+    WaterlineFinish,
+)
+from petrify.machine import finish
+from petrify.machine.finish import ConeCutter, Dropped, FlatCutter, cutter
+from petrify.machine.motion import Motion
+
+from .test_feed import mpcnc, speeds, tool
+
+def load_tests(loader, tests, ignore):
+    tests.addTests(doctest.DocTestSuite(finish))
+    return tests
+
+def ramp():
+    """ A face rising along x from 0 to 1 over the unit square. """
+    face = Polygon([Point(0, 0, 0), Point(1, 0, 1), Point(1, 1, 1), Point(0, 1, 0)])
+    return SimpleNamespace(polygons=[face])
+
+class TestDropCutter(unittest.TestCase):
+    def test_box(self):
+        box = Box(Point(0, 0, 0), Vector(2, 2, 1))
+        dropped = Dropped(box, FlatCutter(0.25))
+        self.assertEqual(dropped.height(1, 1), 1.0)
+        self.assertEqual(dropped.height(2.2, 1), 1.0)
+        self.assertIsNone(dropped.height(2.3, 1))
+
+    def test_ramp(self):
+        dropped = Dropped(ramp(), FlatCutter(0.25))
+        # The uphill edge of the tool rests on the ramp.
+        self.assertAlmostEqual(dropped.height(0.5, 0.5), 0.75)
+        self.assertAlmostEqual(dropped.height(0.9, 0.5), 1.0)
+
+    def test_cone(self):
+        vbit = VBit(2, 90, 1.0)
+        self.assertIsInstance(cutter(vbit), ConeCutter)
+        cone = ConeCutter(0.5, vbit.depth(1.0))
+
+        # Against densely sampled points of each facet, the tip rests no
+        # lower than any point demands, and on at least one of them.
+        rng = random.Random(7)
+        for _ in range(50):
+            triangle = tuple(
+                Point(rng.uniform(-1, 1), rng.uniform(-1, 1), rng.uniform(0, 1))
+                for _ in range(3)
+            )
+            x, y = rng.uniform(-0.5, 0.5), rng.uniform(-0.5, 0.5)
+            a, b, c = triangle
+            steps = 60
+            samples = [
+                a + (b - a) * (i / steps) + (c - a) * (j / steps)
+                for i in range(steps + 1) for j in range(steps + 1 - i)
+            ]
+            demands = [
+                cone.below(p, x, y) for p in samples
+                if math.hypot(p.x - x, p.y - y) <= 0.5
+            ]
+            height = cone.drop(triangle, x, y)
+            if not demands:
+                continue
+            self.assertIsNotNone(height)
+            self.assertGreaterEqual(height, max(demands) - 1e-9)
+            self.assertLessEqual(height, max(demands) + 0.05)
+
+    def test_ramp_cone(self):
+        # A 90° cone is steeper than the ramp, so its tip rests on it.
+        dropped = Dropped(ramp(), ConeCutter(0.25, 1.0))
+        self.assertAlmostEqual(dropped.height(0.5, 0.5), 0.5)
+
+    def test_unsupported_tool(self):
+        with self.assertRaisesRegex(ValueError, 'object'):
+            cutter(object())
+
+class TestFinish(unittest.TestCase):
+    def surface(self):
+        return Surface(Box(Point(1, 1, 0), Vector(2, 2, 1)), top=1.0, bottom=-0.5) * u.mm
+
+    def test_raster(self):
+        config = mpcnc.configure(RasterFinish(0.5, 0.5), speeds, tool)
+        cut = config.cut(self.surface())
+
+        # One pass per row.
+        self.assertEqual(len(cut.passes), 11)
+        for path in cut.passes:
+            self.assertEqual(len({p.y for p in path}), 1)
+            for p in path:
+                dx, dy = p.x - min(max(p.x, 1), 3), p.y - min(max(p.y, 1), 3)
+                over = math.hypot(dx, dy) <= 0.25 + 1e-9
+                self.assertIn(round(p.z, 9), (0.0, -1.5))
+                if over:
+                    self.assertAlmostEqual(p.z, 0.0)
+
+        moves = [m for _, m in cut.commands() if isinstance(m, Motion)]
+        self.assertEqual(moves[0].z, 2.0)
+        self.assertEqual(moves[-1].z, 2.0)
+        self.assertGreater(cut.time(), 0)
+
+    def test_raster_between_samples(self):
+        # A block raised from a plate, its sides falling between samples.
+        plate = Box(Point(0, 0, 0), Vector(4, 4, 0.5))
+        block = Box(Point(1.3, 1.3, 0.5), Vector(1, 1, 0.5))
+        part = Node(plate.polygons + block.polygons)
+        config = mpcnc.configure(RasterFinish(0.5, 0.5), speeds, tool)
+        cut = config.cut(Surface(part, top=1.0, bottom=0.0) * u.mm)
+        dropped = Dropped(part, FlatCutter(0.25))
+
+        for path in cut.passes:
+            for a, b in zip(path, path[1:]):
+                for ix in range(21):
+                    p = a + (b - a) * (ix / 20)
+                    h = dropped.height(p.x, p.y)
+                    floor = max(-1.0, -math.inf if h is None else h - 1.0)
+                    self.assertGreaterEqual(p.z, floor - 1e-9)
+
+    def test_waterline(self):
+        config = mpcnc.configure(WaterlineFinish(0.5), speeds, tool)
+        cut = config.cut(self.surface())
+
+        # Levels at -0.5, -1.0 and -1.5 each trace the box once.
+        self.assertEqual(len(cut.passes), 3)
+        for loop in cut.passes:
+            self.assertEqual(loop[0], loop[-1])
+            self.assertEqual(len({p.z for p in loop}), 1)
+            for p in loop:
+                # The tool just touches the sides of the box.
+                outside = max(1 - p.x, p.x - 3, 1 - p.y, p.y - 3)
+                self.assertGreater(outside, 0.15)
+                self.assertLess(outside, 0.3 + 0.05)
@@ -0,0 +1,68 @@
+import doctest
+import io
+import unittest
+
+from petrify.machine import gcode
+from petrify.machine.commands import GCode
+from petrify.machine.gcode import Writer
+from petrify.machine.motion import Arc, Motion
+
+def load_tests(loader, tests, ignore):
+    tests.addTests(doctest.DocTestSuite(gcode))
+    return tests
+
+def written(commands, **options):
+    out = io.StringIO()
+    Writer(out, **options).write_all((None, c) for c in commands)
+    return out.getvalue().splitlines()
+
+class TestWriter(unittest.TestCase):
+    def test_modal_compression(self):
+        self.assertEqual(written([
+            Motion(z=2.0, f=200),
+            Motion(x=0.0, y=0.0, f=900),
+            Motion(z=-1.0, f=200),
+            Motion(x=1.0, y=0.0, f=900),
+            Motion(x=1.0, y=1.0, f=900),
+            Arc(x=0.0, y=2.0, i=-1.0, j=0.0, clockwise=False, f=900),
+            Arc(x=0.0, y=4.0, i=0.0, j=1.0, clockwise=False, f=900),
+            Motion(x=0.0, y=5.0, f=900),
+        ]), [
+            'G01 Z2 F200',
+            'X0 Y0 F900',
+            'Z-1 F200',
+            'X1 F900',
+            'Y1',
+            'G03 X0 Y2 I-1 J0',
+            'Y4 I0 J1',
+            'G01 Y5',
+        ])
+
+    def test_precision(self):
+        commands = [Motion(x=1.00004, y=-0.00001, f=900), Motion(x=1.00001, f=900)]
+        self.assertEqual(written(commands), ['G01 X1 Y0 F900'])
+        self.assertEqual(written(commands, precision=5), [
+            'G01 X1.00004 Y-0.00001 F900',
+            'X1.00001'
+        ])
+
+    def test_other_commands_reset_state(self):
+        self.assertEqual(written([
+            Motion(x=1.0, f=900),
+            GCode('M0 pause'),
+            Motion(x=1.0, f=900),
+        ]), ['G01 X1 F900', 'M0 pause', 'G01 X1 F900'])
+
+    def test_chunked_writes(self):
+        class Counting(io.StringIO):
+            writes = 0
+            def write(self, s):
+                self.writes += 1
+                return super().write(s)
+
+        out = Counting()
+        Writer(out, chunk=100).write_all(
+            (None, Motion(x=float(x), f=900)) for x in range(1000)
+        )
+        self.assertEqual(len(out.getvalue().splitlines()), 1000)
+        self.assertEqual(out.writes, 20)
@@ -0,0 +1,8 @@
+import doctest
+import unittest
+
+from petrify.machine import rest
+
+def load_tests(loader, tests, ignore):
+    tests.addTests(doctest.DocTestSuite(rest))
+    return tests
@@ -0,0 +1,59 @@
+import doctest
+import unittest
+
+from petrify.plane import Point
+from petrify.machine import sequence
+from petrify.machine.motion import PlanarToolpath
+from petrify.machine.sequence import Sequenced, travel
+
+def load_tests(loader, tests, ignore):
+    tests.addTests(doctest.DocTestSuite(sequence))
+    return tests
+
+def toolpath(*points):
+    p = PlanarToolpath(points[0])
+    for point in points[1:]:
+        p.move_to(point)
+    return p
+
+class TestSequenced(unittest.TestCase):
+    def test_reverses_open_paths(self):
+        a = toolpath(Point(0, 0), Point(10, 0))
+        b = toolpath(Point(0, 1), Point(10, 1))
+
+        order = Sequenced([a, b])
+        self.assertEqual([p.path for p in order.toolpaths], [
+            [Point(0, 0), Point(10, 0)],
+            [Point(10, 1), Point(0, 1)]
+        ])
+        self.assertEqual(order.after, 1.0)
+        self.assertEqual(order.saved, order.before - order.after)
+
+    def test_fixed_direction(self):
+        a = toolpath(Point(0, 0), Point(10, 0))
+        b = toolpath(Point(0, 1), Point(10, 1))
+
+        order = Sequenced([b, a], reverse=False)
+        self.assertEqual([p.path for p in order.toolpaths], [a.path, b.path])
+
+    def test_closed_loops_kept(self):
+        loop = toolpath(Point(5, 5), Point(5, 6), Point(6, 6), Point(5, 5))
+        line = toolpath(Point(20, 0), Point(0, 0))
+
+        order = Sequenced([line, loop])
+        self.assertIs(order.toolpaths[1], loop)
+        self.assertEqual(order.toolpaths[0].path, [Point(0, 0), Point(20, 0)])
+
+    def test_never_worse(self):
+        paths = [toolpath(Point(x, 0), Point(x + 1, 0)) for x in range(0, 20, 2)]
+        order = Sequenced(paths)
+        self.assertLessEqual(order.after, travel(paths, Point(0, 0)))
+
+    def test_grid(self):
+        paths = [
+            toolpath(Point(x * 3, y * 3), Point(x * 3 + 1, y * 3))
+            for x in reversed(range(30)) for y in range(30)
+        ]
+        order = Sequenced(paths)
+        self.assertEqual(len(order.toolpaths), len(paths))
+        self.assertLess(order.after, order.before / 2)
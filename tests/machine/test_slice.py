@@ -19,3 +19,45 @@ class TestSliced(unittest.TestCase):
             (1.75, [Polygon([Point(0.75, 0.25, 1.75), Point(0.25, 0.25, 1.75), Point(0.25, 0.75, 1.75), Point(0.75, 0.75, 1.75)])]),
             (2.75, [Polygon([Point(0.0, 0.0, 2.75), Point(0.0, 1.0, 2.75), Point(1.0, 1.0, 2.75), Point(1.0, 0.0, 2.75)])])
         ])
+
+def canonical(polygon):
+    points = [tuple(p.snap(0.0001).xyz) for p in polygon.points]
+    ix = points.index(min(points))
+    return tuple(points[ix:] + points[:ix])
+
+def layers(slices):
+    return [(z, sorted(canonical(p) for p in polygons)) for z, polygons in slices]
+
+class TestSection(unittest.TestCase):
+    def solid(self):
+        outer = Box(Point(0, 0, 0), Vector(4, 4, 3))
+        hole = Box(Point(1, 1, 1), Vector(2, 2, 3))
+        return outer - hole
+
+    def test_matches_slab(self):
+        r = Rectangle(Point(-1, -1), Vector(6, 6))
+        sliced = Sliced(self.solid(), Basis.xy, r, 0.5, 2.5, 1.0)
+        slabs = [(z, sliced._slab(z)) for z in sliced.layers]
+
+        self.assertEqual(layers(sliced.slices), layers(slabs))
+        self.assertEqual([len(p) for _, p in sliced.slices], [1, 2, 2])
+
+    def test_lazy(self):
+        r = Rectangle(Point(-1, -1), Vector(6, 6))
+        sliced = Sliced(self.solid(), Basis.xy, r, 0.5, 2.5, 1.0)
+        self.assertEqual(sliced._slices, {})
+        self.assertEqual(len(sliced[1.5]), 2)
+        self.assertEqual(list(sliced._slices.keys()), [1.5])
+
+    def test_parallel(self):
+        r = Rectangle(Point(-1, -1), Vector(6, 6))
+        sequential = Sliced(self.solid(), Basis.xy, r, 0.5, 2.5, 1.0)
+        parallel = Sliced(self.solid(), Basis.xy, r, 0.5, 2.5, 1.0, processes=2)
+        self.assertEqual(layers(parallel.slices), layers(sequential.slices))
+
+    def test_clipped(self):
+        r = Rectangle(Point(0, 0), Vector(2, 2))
+        sliced = Sliced(self.solid(), Basis.xy, r, 0.5, 0.5, 1.0)
+        for polygon in sliced[0.5]:
+            for p in polygon.points:
+                self.assertTrue(0 <= p.x <= 2 and 0 <= p.y <= 2)
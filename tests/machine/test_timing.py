@@ -0,0 +1,72 @@
+import doctest
+import math
+import unittest
+
+from petrify import u
+from petrify.plane import Point
+from petrify.shape import Circle
+from petrify.machine import timing, ContourStepFeed, Kinematics, Machine, Format, Pocket
+from petrify.machine.motion import Arc, Motion
+from petrify.machine.timing import estimate
+
+from .test_feed import mpcnc, speeds, tool
+
+def load_tests(loader, tests, ignore):
+    tests.addTests(doctest.DocTestSuite(timing))
+    return tests
+
+def run(commands, acceleration=36000.0, deviation=0.01):
+    return estimate(((None, c) for c in commands), acceleration, deviation)
+
+class TestEstimate(unittest.TestCase):
+    def test_collinear_moves_match_single_move(self):
+        split = [Motion(x=float(x), f=600.0) for x in range(1, 21)]
+        single = [Motion(x=20.0, f=600.0)]
+        self.assertAlmostEqual(run(split), run(single))
+
+    def test_reversal_stops(self):
+        there = [Motion(x=10.0, f=600.0)]
+        back = [Motion(x=10.0, f=600.0), Motion(x=0.0, f=600.0)]
+        self.assertAlmostEqual(run(back), 2 * run(there))
+
+    def test_slower_corners(self):
+        corner = [Motion(x=10.0, f=600.0), Motion(x=10.0, y=10.0, f=600.0)]
+        straight = [Motion(x=20.0, f=600.0)]
+        self.assertLess(run(straight), run(corner))
+        self.assertLess(run(corner), run(corner, deviation=0.0))
+
+    def test_long_moves_approach_naive(self):
+        self.assertAlmostEqual(run([Motion(x=1e6, f=600.0)]), 1e6 / 600.0, places=1)
+
+    def test_short_segments_slower_than_naive(self):
+        zigzag = [Motion(x=float(x % 2), y=x * 0.1, f=600.0) for x in range(100)]
+        naive = 99 * math.hypot(1, 0.1) / 600.0
+        self.assertGreater(run(zigzag, acceleration=3600.0), naive * 1.5)
+
+    def test_arcs_are_smooth(self):
+        arcs = [
+            Arc(x=10.0, y=10.0, i=0.0, j=10.0, clockwise=False, f=600.0),
+            Arc(x=0.0, y=20.0, i=-10.0, j=0.0, clockwise=False, f=600.0),
+        ]
+        whole = [Arc(x=0.0, y=20.0, i=0.0, j=10.0, clockwise=False, f=600.0)]
+        self.assertAlmostEqual(run(arcs), run(whole), places=4)
+
+    def test_stops(self):
+        from petrify.machine.commands import GCode
+        moves = [Motion(x=10.0, f=600.0), Motion(x=20.0, f=600.0)]
+        paused = [moves[0], GCode('M0 pause'), moves[1]]
+        self.assertAlmostEqual(run(paused), 2 * run(moves[:1]))
+
+class TestMachineTime(unittest.TestCase):
+    def test_machine_kinematics(self):
+        pocket = Pocket(Circle(Point(0, 0), 5, segments=16), 1.0)
+        feed = ContourStepFeed(0.5, 1.0)
+        cut = feed.pocket(mpcnc.configure(feed, speeds, tool), pocket)
+
+        machine = Machine(
+            clearance=2.0 * u.mm,
+            format=Format(u.mm, v=u.mm / u.minute),
+            kinematics=Kinematics(100 * u.mm / u.second ** 2, 0.01 * u.mm)
+        )
+        self.assertEqual(cut.time(mpcnc), cut.time())
+        self.assertGreater(cut.time(machine), cut.time())
@@ -1,8 +1,10 @@
 import unittest
 
+import math
+
 from petrify import Point, Polygon
 from petrify.plane import LineSegment2
-from petrify.machine.util import clearance, CutLine
+from petrify.machine.util import clearance, medial_axis, Clearance, CutLine
 
 class TestCutLine(unittest.TestCase):
     def test_parallel_lines(self):
@@ -48,6 +50,7 @@ class TestClearance(unittest.TestCase):
             (Point(0.5, 2.0), 0.5),
             (Point(0.5, 4.0), 0.5),
             (Point(0.5, 4.0), 0.5),
+            (Point(0.75, 5.25), 0.8),
             (Point(0.0, 6.0), 0.0)
         ]
         self.assertEqual([(c.snap(0.25), round(r, 1)) for c, r in path], expected)
@@ -64,3 +67,23 @@ class TestClearance(unittest.TestCase):
 
         path = clearance(segments[0], segments[1:])
         self.assertEqual(min([r for _, r in path if r > 0]), 0.5)
+
+class TestMedialAxis(unittest.TestCase):
+    def star(self):
+        return Polygon([
+            Point(math.cos(ix * math.pi / 8), math.sin(ix * math.pi / 8)) * (4 if ix % 2 else 10)
+            for ix in range(16)
+        ])
+
+    def test_matches_exhaustive(self):
+        segments = self.star().segments()
+        for segment, path in medial_axis(self.star()):
+            others = [s for s in segments if s is not segment and s != segment]
+            self.assertEqual(path, clearance(segment, others))
+
+    def test_indexed_search(self):
+        wide = Polygon([Point(0, 0), Point(0, 1), *(Point(x, 1) for x in range(2, 40)), Point(40, 0)])
+        index = Clearance(wide.segments())
+        # A thin strip only needs its immediate neighbours.
+        self.assertLess(len(index.nearby(10, index.size)), 10)
+        self.assertEqual(max(r for _, r in index.along(10)), 0.5)
@@ -0,0 +1,63 @@
+import doctest
+import unittest
+
+from petrify import u
+from petrify.plane import ComplexPolygon, Point, Polygon
+from petrify.machine import Engrave, Part, Pocket, VBit, VCarveFeed
+from petrify.machine import vcarve
+from petrify.machine.motion import Motion
+
+from .test_feed import mpcnc, speeds, tool
+
+def load_tests(loader, tests, ignore):
+    tests.addTests(doctest.DocTestSuite(vcarve))
+    return tests
+
+vbit = VBit(3, 60, 6) * u.mm
+config = mpcnc.configure(VCarveFeed(), speeds, vbit)
+
+class TestVCarve(unittest.TestCase):
+    def test_strip(self):
+        strip = Polygon([Point(0, 0), Point(0, 2), Point(10, 2), Point(10, 0)])
+        cut = config.cut(Engrave(strip, 5.0) * u.mm)
+
+        self.assertEqual(len(cut.passes), 1)
+        depths = [p.z for p in cut.passes[0]]
+        # A 60° bit cuts a groove 2 wide at a depth of sqrt(3).
+        self.assertAlmostEqual(min(depths), -(3 ** 0.5))
+        self.assertAlmostEqual(max(depths), 0)
+
+        moves = [m for _, m in cut.commands() if isinstance(m, Motion)]
+        self.assertEqual(moves[-1].z, 2.0)
+
+    def test_depth_limit(self):
+        square = Polygon([Point(0, 0), Point(0, 4), Point(4, 4), Point(4, 0)])
+        cut = config.cut(Engrave(square, 1.0) * u.mm)
+        self.assertAlmostEqual(min(p.z for p in cut.passes[0]), -1.0)
+
+    def test_island(self):
+        ring = ComplexPolygon([
+            Polygon([Point(0, 0), Point(0, 6), Point(6, 6), Point(6, 0)]),
+            Polygon([Point(2, 2), Point(2, 4), Point(4, 4), Point(4, 2)]),
+        ])
+        cut = config.cut(Engrave(ring, 5.0) * u.mm)
+
+        self.assertEqual(len(cut.passes), 2)
+        for path in cut.passes:
+            for p in path:
+                self.assertFalse(2 < p.x < 4 and 2 < p.y < 4)
+        # Along the sides, the groove spans the ring.
+        sides = [p for path in cut.passes for p in path if abs(p.x - 1) < 1e-9]
+        self.assertTrue(any(abs(p.z + 3 ** 0.5) < 1e-9 for p in sides))
+
+    def test_requires_vbit(self):
+        straight = mpcnc.configure(VCarveFeed(), speeds, tool)
+        square = Polygon([Point(0, 0), Point(0, 4), Point(4, 4), Point(4, 0)])
+        with self.assertRaises(ValueError):
+            straight.cut(Engrave(square, 1.0) * u.mm)
+
+    def test_engraving_only(self):
+        square = Polygon([Point(0, 0), Point(0, 4), Point(4, 4), Point(4, 0)])
+        for shape in (Pocket(square, 1.0), Part(square, [], 1.0)):
+            with self.assertRaisesRegex(ValueError, type(shape).__name__):
+                config.cut(shape * u.mm)
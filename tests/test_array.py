@@ -0,0 +1,84 @@
+import doctest
+import random
+import unittest
+
+from petrify import array
+from petrify.plane import array as plane_array
+from petrify.space import array as space_array
+from petrify.plane import Matrix2, Point2, Vector2
+from petrify.plane.array import PointArray2, VectorArray2
+from petrify.space import Matrix3, Point3, Vector3
+from petrify.space.array import PointArray3, VectorArray3
+from petrify.geometry import tau
+
+def load_tests(loader, tests, ignore):
+    tests.addTests(doctest.DocTestSuite(array))
+    tests.addTests(doctest.DocTestSuite(plane_array))
+    tests.addTests(doctest.DocTestSuite(space_array))
+    return tests
+
+r = random.Random(0)
+points3 = [Point3(*(r.uniform(-10, 10) for _ in range(3))) for _ in range(20)]
+vectors3 = [Vector3(*(r.uniform(-10, 10) for _ in range(3))) for _ in range(20)]
+points2 = [Point2(*(r.uniform(-10, 10) for _ in range(2))) for _ in range(20)]
+
+class Matching:
+    def assertMatches(self, array, scalars):
+        self.assertEqual(len(array), len(scalars))
+        for a, b in zip(array, scalars):
+            self.assertEqual(type(a), type(b))
+            for u, v in zip(a, b):
+                self.assertAlmostEqual(u, v)
+
+class TestArray3(Matching, unittest.TestCase):
+    def test_arithmetic(self):
+        points = PointArray3(points3)
+        vectors = VectorArray3(vectors3)
+        v = Vector3(1, 2, 3)
+
+        self.assertMatches(points + v, [p + v for p in points3])
+        self.assertMatches(points - Point3(1, 1, 1), [p - Point3(1, 1, 1) for p in points3])
+        self.assertMatches(points - points, [p - p for p in points3])
+        self.assertMatches(vectors + points, [a + b for a, b in zip(vectors3, points3)])
+        self.assertMatches(vectors * 2, [a * 2 for a in vectors3])
+        self.assertMatches(-(vectors / 2), [-(a / 2) for a in vectors3])
+        self.assertMatches(points + (1, 0, 0), [p + (1, 0, 0) for p in points3])
+
+    def test_products(self):
+        vectors = VectorArray3(vectors3)
+        v = Vector3(1, -2, 0.5)
+        for got, a in zip(vectors.dot(v), vectors3):
+            self.assertAlmostEqual(got, a.dot(v))
+        for got, a in zip(vectors.magnitude(), vectors3):
+            self.assertAlmostEqual(got, a.magnitude())
+        self.assertMatches(vectors.cross(v), [a.cross(v) for a in vectors3])
+        self.assertMatches(vectors.normalized(), [a.normalized() for a in vectors3])
+        self.assertMatches(vectors.snap(0.5), [a.snap(0.5) for a in vectors3])
+
+    def test_matrix(self):
+        m = Matrix3.translate(1, 2, 3) * Matrix3.rotate_axis(Vector3(1, 1, 0), tau / 7)
+        self.assertMatches(m * PointArray3(points3), [m * p for p in points3])
+        self.assertMatches(m * VectorArray3(vectors3), [m * v for v in vectors3])
+
+        points = PointArray3(points3)
+        m * points
+        self.assertMatches(points, points3)
+        self.assertMatches(m.transform_points(points), [m * p for p in points3])
+
+    def test_slicing(self):
+        points = PointArray3(points3)
+        self.assertEqual(points[3], points3[3])
+        self.assertMatches(points[2:5], points3[2:5])
+        self.assertEqual(list(points.z), [p.z for p in points3])
+
+class TestArray2(Matching, unittest.TestCase):
+    def test_plane(self):
+        points = PointArray2(points2)
+        m = Matrix2.translate(1, 2) * Matrix2.rotate(tau / 5)
+        self.assertMatches(m * points, [m * p for p in points2])
+        self.assertMatches(points - Point2(1, 1), [p - Point2(1, 1) for p in points2])
+        self.assertMatches(
+            (points - Point2(0, 0)).cross(),
+            [(p - Point2(0, 0)).cross() for p in points2]
+        )
+        self.assertMatches(VectorArray2([Vector2(3, 4)]).normalized(), [Vector2(0.6, 0.8)])
@@ -0,0 +1,94 @@
+import doctest
+import random
+import unittest
+
+import numpy as np
+
+from petrify.solid import Box, Sphere
+from petrify.space import bvh, Line, LineSegment, Point, Ray, Vector
+from petrify.space.bvh import BVH, closest_points, crossings, triangles
+
+def load_tests(loader, tests, ignore):
+    tests.addTests(doctest.DocTestSuite(bvh))
+    return tests
+
+def scan(tree):
+    a, b, c, _ = triangles(tree.polygons)
+    return a, b, c
+
+class TestBVH(unittest.TestCase):
+    def setUp(self):
+        self.sphere = Sphere(Point(1, 2, 3), 2, segments=16)
+        self.tree = BVH(self.sphere.polygons)
+        self.random = random.Random(0)
+
+    def direction(self):
+        r = self.random
+        return Vector(r.uniform(-1, 1), r.uniform(-1, 1), r.uniform(-1, 1))
+
+    def test_cast_matches_scan(self):
+        a, b, c = scan(self.tree)
+        for _ in range(50):
+            origin = Point(1, 2, 3) + self.direction() * 4
+            ray = Ray(origin, self.direction())
+            o, d = np.array(origin.xyz), np.array(ray.v.xyz)
+            t, hit = crossings(o, d, a, b, c, 0.0, np.inf)
+
+            found = self.tree.intersect(ray)
+            if not hit.any():
+                self.assertIsNone(found)
+            else:
+                expected = o + d * t[hit].min()
+                self.assertTrue(np.allclose(found.xyz, expected))
+
+    def test_line_kinds(self):
+        start = Point(1, 2, 10)
+        down = Vector(0, 0, -1)
+        self.assertIsNone(self.tree.intersect(Ray(start, -down)))
+        # Lines are crossed first where they enter along their direction.
+        self.assertAlmostEqual(self.tree.intersect(Line(start, -down)).z, 1, delta=0.1)
+        self.assertAlmostEqual(self.tree.intersect(Line(start, down)).z, 5, delta=0.1)
+        self.assertIsNone(self.tree.intersect(LineSegment(start, Point(1, 2, 6))))
+        point, face = self.tree.cast(LineSegment(start, Point(1, 2, 0)))
+        self.assertAlmostEqual(point.z, 5, delta=0.1)
+        self.assertIn(face, self.sphere.polygons)
+
+    def test_closest_matches_scan(self):
+        a, b, c = scan(self.tree)
+        for _ in range(50):
+            query = Point(1, 2, 3) + self.direction() * 4
+            q = np.array(query.xyz)
+            closest = closest_points(q, a, b, c)
+            expected = np.sqrt(((closest - q) ** 2).sum(axis=1)).min()
+            self.assertAlmostEqual(abs(self.tree.closest(query) - query), expected)
+
+    def test_closest_inside(self):
+        point, face = self.tree.nearest(Point(1, 2, 3))
+        self.assertAlmostEqual(abs(point - Point(1, 2, 3)), 2, delta=0.1)
+        self.assertIn(face, self.sphere.polygons)
+
+    def test_overlaps(self):
+        box = Box(Point(0, 0, 0), Vector(1, 1, 1))
+        near = Box(Point(0.5, 0.5, -1), Vector(1, 1, 3))
+        far = Box(Point(3, 0, 0), Vector(1, 1, 1))
+        self.assertTrue(box.bvh().overlaps(near.bvh()))
+        self.assertFalse(box.bvh().overlaps(far.bvh()))
+
+        pairs = box.bvh().colliding(near.bvh())
+        for first, second in pairs:
+            self.assertIn(first, box.polygons)
+            self.assertIn(second, near.polygons)
+
+    def test_overlaps_sphere(self):
+        inside = Box(Point(0.5, 1.5, 2.5), Vector(1, 1, 1))
+        crossing = Box(Point(0.5, 1.5, 4.5), Vector(1, 1, 1))
+        self.assertFalse(self.tree.overlaps(inside.bvh()))
+        self.assertTrue(self.tree.overlaps(crossing.bvh()))
+        self.assertTrue(crossing.bvh().overlaps(self.tree))
+
+    def test_empty(self):
+        tree = BVH([])
+        self.assertEqual(len(tree), 0)
+        self.assertIsNone(tree.intersect(Ray(Point(0, 0, 0), Vector(0, 0, 1))))
+        self.assertIsNone(tree.closest(Point(0, 0, 0)))
+        self.assertFalse(tree.overlaps(self.tree))
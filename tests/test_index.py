@@ -0,0 +1,51 @@
+import doctest
+import random
+import unittest
+
+from petrify import index
+from petrify.index import BoxGrid, IntervalIndex
+
+def load_tests(loader, tests, ignore):
+    tests.addTests(doctest.DocTestSuite(index))
+    return tests
+
+class TestIntervalIndex(unittest.TestCase):
+    def test_matches_scan(self):
+        r = random.Random(0)
+        intervals = []
+        for ix in range(500):
+            a = r.uniform(0, 100)
+            intervals.append((a, a + r.uniform(0, 10), ix))
+        tree = IntervalIndex(intervals)
+
+        for _ in range(100):
+            low = r.uniform(-5, 110)
+            high = low + r.choice([0, r.uniform(0, 5)])
+            expected = sorted(v for a, b, v in intervals if a <= high and b >= low)
+            self.assertEqual(sorted(tree.overlap(low, high)), expected)
+
+    def test_endpoints(self):
+        tree = IntervalIndex([(0, 1, 'a'), (1, 2, 'b'), (3, 3, 'c')])
+        self.assertEqual(sorted(tree.stab(1)), ['a', 'b'])
+        self.assertEqual(tree.stab(3), ['c'])
+        self.assertEqual(tree.stab(2.5), [])
+
+    def test_empty(self):
+        self.assertEqual(IntervalIndex([]).stab(0), [])
+
+class TestBoxGrid(unittest.TestCase):
+    def test_matches_scan(self):
+        r = random.Random(0)
+        boxes = []
+        for ix in range(300):
+            x, y = r.uniform(-20, 20), r.uniform(-20, 20)
+            boxes.append((x, y, x + r.uniform(0, 3), y + r.uniform(0, 3), ix))
+        grid = BoxGrid(boxes, 2.5)
+
+        for _ in range(100):
+            x, y = r.uniform(-25, 25), r.uniform(-25, 25)
+            x1, y1 = x + r.uniform(0, 4), y + r.uniform(0, 4)
+            expected = [v for a, b, c, d, v in boxes if a <= x1 and c >= x and b <= y1 and d >= y]
+            found = grid.query(x, y, x1, y1)
+            self.assertTrue(set(expected) <= set(found))
+            self.assertEqual(found, sorted(set(found)))
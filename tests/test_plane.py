@@ -1,13 +1,15 @@
-import doctest, unittest
+import doctest, math, random, sys, unittest
+from unittest import mock
 
 from petrify import generic, plane
-from petrify.plane import ComplexPolygon, Polygon, Point, Ray, Vector, line, point
+from petrify.plane import ComplexPolygon, Polygon, Point, Ray, Vector, containment, line, point, tau
 from petrify.shape import Circle
 
 def load_tests(loader, tests, ignore):
     tests.addTests(doctest.DocTestSuite(plane))
     tests.addTests(doctest.DocTestSuite(line))
     tests.addTests(doctest.DocTestSuite(point))
+    tests.addTests(doctest.DocTestSuite(containment))
     return tests
 
 class TestVector(unittest.TestCase):
@@ -210,6 +212,26 @@ class TestPolygon(unittest.TestCase):
         self.assertEqual(len(parts.polygons), 1)
         self.assertEqual(len(parts.polygons[0].points), 3)
 
+    def test_offsets_match_offset(self):
+        notch = Polygon([
+            Point(0, 0),
+            Point(6, 0),
+            Point(6, 5),
+            Point(3, 1),
+            Point(0, 5)
+        ])
+
+        amounts = [-0.475, 0.1, -0.1, -1.5, -10]
+        parts = notch.offsets(amounts)
+
+        self.assertEqual(len(parts), len(amounts))
+        for amount, part in zip(amounts, parts):
+            single = notch.offset(amount)
+            self.assertEqual(
+                [list(p.points) for p in part.polygons],
+                [list(p.points) for p in single.polygons]
+            )
+
     @unittest.skip
     def test_inset_split(self):
         dumbbell = Polygon([
@@ -257,7 +279,29 @@ class TestPolygon(unittest.TestCase):
             Point(1.1, -0.1)
         ])
 
+    def test_cached_envelope(self):
+        square = Polygon([Point(0, 0), Point(0, 1), Point(1, 1), Point(1, 0)])
+        first = square.envelope()
+        first.origin = Point(5, 5)
+        self.assertEqual(square.envelope().origin, Point(0, 0))
+
+        self.assertTrue(square.contains_many([Point(0.5, 0.5)])[0])
+        square.points = [p + Vector(2, 0) for p in square.points]
+        self.assertEqual(square.envelope().origin, Point(2, 0))
+        self.assertFalse(square.contains_many([Point(0.5, 0.5)])[0])
+
 class TestComplexPolygon(unittest.TestCase):
+    def test_cached_envelope(self):
+        square = Polygon([Point(0, 0), Point(0, 1), Point(1, 1), Point(1, 0)])
+        complex = ComplexPolygon([square * 3, square + Vector(1, 1)])
+        self.assertEqual(complex.envelope().extent, Point(3, 3))
+        self.assertTrue(complex.contains_many([Point(0.5, 0.5)])[0])
+
+        complex.exterior = [square * 6]
+        self.assertEqual(complex.envelope().extent, Point(6, 6))
+        complex.interior = []
+        self.assertTrue(complex.contains_many([Point(1.5, 1.5)])[0])
+
     def test_complex_add(self):
         polygon = ComplexPolygon([
             Polygon([Point(0, 0), Point(0, 3), Point(3, 3), Point(3, 0)]),
@@ -317,3 +361,49 @@ class TestComplexPolygon(unittest.TestCase):
         ])
 
         self.assertEqual(len(polygon.offset(-2).exterior), 1)
+
+class TestContainsMany(unittest.TestCase):
+    def star(self):
+        return Polygon([
+            Point(math.cos(ix * tau / 16), math.sin(ix * tau / 16)) * (4 if ix % 2 else 10)
+            for ix in range(16)
+        ])
+
+    def samples(self):
+        r = random.Random(0)
+        return [Point(r.uniform(-12, 12), r.uniform(-12, 12)) for _ in range(500)]
+
+    def test_matches_contains(self):
+        star = self.star()
+        points = self.samples()
+        self.assertEqual(
+            star.contains_many(points).tolist(),
+            [star.contains(p) for p in points]
+        )
+
+    def test_boundary(self):
+        square = Polygon([Point(0, 0), Point(0, 2), Point(2, 2), Point(2, 0)])
+        points = [Point(0, 1), Point(2, 2), Point(1, 0), Point(2.5, 2)]
+        self.assertEqual(square.contains_many(points).tolist(), [True, True, True, False])
+
+    def test_holes(self):
+        star = self.star()
+        hole = Polygon([Point(-1, -1), Point(-1, 1), Point(1, 1), Point(1, -1)])
+        complex = ComplexPolygon([star, hole])
+        points = self.samples()
+        expected = [
+            star.contains(p) and not (abs(p.x) < 1 and abs(p.y) < 1)
+            for p in points
+        ]
+        self.assertEqual(complex.contains_many(points).tolist(), expected)
+
+    def test_without_numpy(self):
+        star = self.star()
+        hole = Polygon([Point(-1, -1), Point(-1, 1), Point(1, 1), Point(1, -1)])
+        complex = ComplexPolygon([star, hole])
+        points = [*self.samples(), Point(1, 0), Point(-1, 0.5)]
+        expected = [complex.contains_many(points).tolist(), star.contains_many(points).tolist()]
+        blocked = {'numpy': None, 'petrify.plane.containment': None}
+        with mock.patch.dict(sys.modules, blocked):
+            fresh = ComplexPolygon([star, hole])
+            self.assertEqual([fresh.contains_many(points), Polygon(star.points).contains_many(points)], expected)
@@ -1,6 +1,8 @@
-import doctest, unittest
+import doctest, sys, unittest
+from unittest import mock
 from petrify import u, plane, solid
-from petrify.solid import tau, Point, Vector, Basis, PlanarPolygon, Extrusion
+from petrify.geometry import tau
+from petrify.solid import Point, Vector, Basis, PlanarPolygon, Extrusion
 
 class TestUtilities(unittest.TestCase):
     def test_perpendicular(self):
@@ -59,6 +61,47 @@ class TestExtrusion(unittest.TestCase):
         ])
         self.assertEqual(set(len(p.points) for p in final.polygons), set([3, 4]))
 
+    def generated(self, build, batched):
+        prior = solid.BATCHED
+        solid.BATCHED = 0 if batched else float('inf')
+        try:
+            return [p.points for p in build().polygons]
+        finally:
+            solid.BATCHED = prior
+
+    def test_batched(self):
+        square = plane.Polygon([
+            plane.Point(0, 0),
+            plane.Point(0, 4),
+            plane.Point(4, 4),
+            plane.Point(4, 0)
+        ])
+        hole = plane.Polygon([
+            plane.Point(1, 1),
+            plane.Point(2, 1),
+            plane.Point(2, 2),
+            plane.Point(1, 2)
+        ])
+        holed = plane.ComplexPolygon([square, hole])
+        shapes = [
+            # The poles collapse a ring of quads into triangles.
+            lambda: solid.Sphere(Point(1, 2, 3), 2, segments=12),
+            lambda: solid.Cylinder(Point(0, 0, 0), Vector(0, 0, -3), 1, segments=16),
+            lambda: solid.PolygonExtrusion(PlanarPolygon(Basis.yz, holed), Vector(-2, 0, 0)),
+            lambda: Extrusion([
+                PlanarPolygon(Basis.xy + Vector(0, 0, z), holed * (1 + z / 8))
+                for z in range(6)
+            ]),
+        ]
+        for build in shapes:
+            self.assertEqual(self.generated(build, True), self.generated(build, False))
+
+    def test_batched_without_numpy(self):
+        build = lambda: solid.Sphere(Point(1, 2, 3), 2, segments=12)
+        expected = self.generated(build, False)
+        with mock.patch.dict(sys.modules, {'numpy': None}):
+            self.assertEqual(self.generated(build, True), expected)
+
 class TestNode(unittest.TestCase):
     def test_addition(self):
         a = solid.Box(Vector(0, 0, 0), Vector(3, 3, 1))
@@ -82,6 +125,43 @@ class TestNode(unittest.TestCase):
         scaled = a / 2
         self.assertEqual(scaled.envelope().size(), Vector(1, 1, 1))
 
+    def test_cached_envelope(self):
+        a = solid.Box(Vector(0, 0, 0), Vector(2, 2, 2))
+        first = a.envelope()
+        self.assertIsNot(first, a.envelope())
+        self.assertEqual(a.envelope().extent, Point(2, 2, 2))
+
+        a.polygons = (a + Vector(1, 1, 1)).polygons
+        self.assertEqual(a.envelope().origin, Point(1, 1, 1))
+        self.assertEqual(first.origin, Point(0, 0, 0))
+
+    def test_bound(self):
+        a = solid.Box(Point(0, 0, 0), Vector(1, 2, 3))
+        moved = (a * Vector(2, 1, 1)).translate(Vector(1, 1, 1))
+        # Axis-aligned transforms keep the bound exact.
+        self.assertEqual(moved.bound().origin, moved.envelope().origin)
+        self.assertEqual(moved.bound().extent, moved.envelope().extent)
+
+        spun = a.rotate(Vector(1, 1, 1), tau / 5).rotate(Vector(0, 1, 0), tau / 7)
+        bound, envelope = spun.bound(), spun.envelope()
+        for axis in range(3):
+            self.assertLessEqual(bound.origin[axis], envelope.origin[axis] + 1e-9)
+            self.assertGreaterEqual(bound.extent[axis], envelope.extent[axis] - 1e-9)
+
+    def test_apart(self):
+        a = solid.Box(Point(0, 0, 0), Vector(1, 1, 1))
+        b = a.rotate(Vector(0, 0, 1), tau / 8).translate(Vector(3, 0, 0))
+        failing = mock.Mock(side_effect=AssertionError("CSG was not culled"))
+        with mock.patch.multiple(solid.engines.csg, union=failing, intersect=failing, subtract=failing):
+            self.assertEqual(len((a + b).polygons), len(a.polygons) + len(b.polygons))
+            self.assertEqual((a * b).polygons, [])
+            self.assertEqual((a - b).polygons, a.polygons)
+
+        # Overlapping bounds still go through CSG.
+        c = a.translate(Vector(0.5, 0.5, 0.5))
+        self.assertFalse(a.apart(c))
+        self.assertGreater(len((a + c).polygons), len(a.polygons) + len(c.polygons))
+
 class TestCollection(unittest.TestCase):
     def test_addition(self):
         a = solid.Box(Point(0, 0, 0), Vector(1, 1, 1)).view(color='red')
@@ -1,6 +1,6 @@
 import unittest
 from petrify import solid
-from petrify.solver import solve_matrix
+from petrify.solver import solve_matrix, solve_2x2, solve_2x2s
 
 class TestSolver(unittest.TestCase):
     def test_simple(self):
@@ -10,3 +10,13 @@ class TestSolver(unittest.TestCase):
             [1, -2, 0, 3],
         ])
         self.assertEqual(solution, [7, 2, 4])
+
+    def test_closed_form(self):
+        system = [[2, 1, 5], [1, -1, 1]]
+        self.assertEqual(solve_2x2(system), solve_matrix([list(r) for r in system]))
+        with self.assertRaises(ZeroDivisionError):
+            solve_2x2([[1, 2, 3], [2, 4, 6]])
+
+    def test_batched(self):
+        solutions = solve_2x2s([[[2, 1, 5], [1, -1, 1]], [[1, 2, 3], [2, 4, 6]]])
+        self.assertEqual(solutions, [[2, 1], None])
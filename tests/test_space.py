@@ -2,7 +2,7 @@ import doctest
 import unittest
 
 from petrify import generic, space
-from petrify.space import Point, Vector
+from petrify.space import LineSegment, Matrix, Plane, Point, Polygon, Vector, tau
 
 def load_tests(loader, tests, ignore):
     tests.addTests(doctest.DocTestSuite(space))
@@ -20,6 +20,16 @@ class VectorTests(unittest.TestCase):
         b = Vector(0.016835599543175706, 0.008578166424744738, 0.0)
         a.angle(b)
 
+    def test_swizzle(self):
+        v = Vector(1, 2, 3)
+        self.assertEqual(v.xyz, (1, 2, 3))
+        self.assertEqual(v.zy, (3, 2))
+        self.assertIn('xyz', vars(Vector))
+        # Longer swizzles still fall back to __getattr__.
+        self.assertEqual(v.xyzz, (1, 2, 3, 3))
+        with self.assertRaises(AttributeError):
+            v.xw
+
 class PointTests(unittest.TestCase):
     def test_generic_instance(self):
         self.assertTrue(isinstance(Point(1, 1, 1), Point))
@@ -37,3 +47,21 @@ class PointTests(unittest.TestCase):
 
     def test_normalized(self):
         self.assertEqual(Point(0, 4, 0).normalized(), Point(0, 1, 0))
+
+class PolygonTests(unittest.TestCase):
+    def test_lazy_plane(self):
+        tri = Polygon([Point(0, 0, 0), Point(1, 0, 0), Point(0, 1, 0)])
+        self.assertIsNone(tri._plane)
+        self.assertEqual(tri.plane.n, Vector(0, 0, 1))
+        self.assertIs(tri.plane, tri.plane)
+
+    def test_slots(self):
+        tri = Polygon([Point(0, 0, 0), Point(1, 0, 0), Point(0, 1, 0)])
+        for o in (tri, tri.plane, LineSegment(Point(0, 0, 0), Point(1, 0, 0))):
+            self.assertFalse(hasattr(o, '__dict__'))
+
+class MatrixTests(unittest.TestCase):
+    def test_transform_points(self):
+        m = Matrix.translate(1, 2, 3) * Matrix.rotate_axis(Vector(1, 1, 0), tau / 7)
+        points = [Point(x, x * 2, -x) for x in range(5)]
+        self.assertEqual(m.transform_points(points), [m * p for p in points])
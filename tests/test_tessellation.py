@@ -0,0 +1,103 @@
+import doctest
+import math
+import unittest
+
+from petrify import shape, solid, tessellation, u
+from petrify.geometry import tau
+from petrify.plane import Point
+from petrify.space import Point3, Vector3
+from petrify.tessellation import Fixed, Tolerance, segments
+
+def load_tests(loader, tests, ignore):
+    tests.addTests(doctest.DocTestSuite(tessellation))
+    return tests
+
+class TestTolerance(unittest.TestCase):
+    def test_chord(self):
+        for radius in (0.5, 3, 40, 1000):
+            circle = shape.Circle(Point(0, 0), radius, tolerance=Tolerance(chord=0.01))
+            n = len(circle.points)
+            # Chord midpoints lie furthest from the true circle.
+            error = radius * (1 - math.cos(tau / n / 2))
+            self.assertLessEqual(error, 0.01)
+            if n > 6:
+                looser = radius * (1 - math.cos(tau / (n - 1) / 2))
+                self.assertGreater(looser, 0.01)
+
+    def test_angle(self):
+        self.assertEqual(segments(1, tolerance=Tolerance(angle=tau / 50)), 50)
+        both = Tolerance(chord=1000, angle=tau / 12)
+        self.assertEqual(segments(1, tolerance=both), 12)
+
+    def test_limits(self):
+        coarse = Tolerance(chord=0.5, minimum=8, maximum=100)
+        self.assertEqual(coarse.segments(0.1), 8)
+        self.assertEqual(coarse.segments(0), 8)
+        self.assertEqual(coarse.segments(1e6), 100)
+
+    def test_units(self):
+        metric = Tolerance(chord=0.01 * u.mm, units=u.mm)
+        imperial = Tolerance(chord=0.01 * u.mm, units=u.inch)
+        self.assertEqual(metric.segments(25.4), imperial.segments(1))
+        self.assertEqual(Tolerance(chord=0.01 * u.mm).segments(25.4 * u.mm), metric.segments(25.4))
+        with self.assertRaises(AssertionError):
+            Tolerance(chord=0.01 * u.mm).segments(25.4)
+
+class TestQuality(unittest.TestCase):
+    def setUp(self):
+        self.prior = tessellation.quality
+
+    def tearDown(self):
+        tessellation.quality = self.prior
+
+    def test_default(self):
+        self.assertEqual(len(shape.Circle(Point(0, 0), 100).points), 10)
+
+    def test_global(self):
+        tessellation.quality = Tolerance(chord=0.05)
+        small = solid.Cylinder(Point3(0, 0, 0), Vector3(0, 0, 1), 0.5)
+        large = solid.Cylinder(Point3(0, 0, 0), Vector3(0, 0, 1), 50)
+        # Two caps plus one quad per segment.
+        self.assertEqual(len(small.polygons) - 2, segments(0.5))
+        self.assertEqual(len(large.polygons) - 2, segments(50))
+        self.assertLess(len(small.polygons), len(large.polygons))
+
+        ball = solid.Sphere(Point3(0, 0, 0), 2)
+        self.assertEqual(len(ball.slices), segments(2))
+
+    def test_explicit(self):
+        tessellation.quality = Tolerance(chord=0.0001)
+        self.assertEqual(len(shape.Circle(Point(0, 0), 1, 7).points), 7)
+        self.assertEqual(len(solid.Sphere(Point3(0, 0, 0), 1, segments=6).slices), 6)
+        tessellation.quality = Fixed(12)
+        self.assertEqual(len(shape.Circle(Point(0, 0), 1).points), 12)
+
+class TestTables(unittest.TestCase):
+    def test_unit_circle(self):
+        self.assertIs(tessellation.unit_circle(12), tessellation.unit_circle(12))
+        closed = tessellation.unit_circle(12, closed=True)
+        self.assertEqual(closed[:-1], tessellation.unit_circle(12))
+        self.assertAlmostEqual(closed[-1][0], 1)
+        self.assertAlmostEqual(closed[-1][1], 0)
+
+    def test_circle(self):
+        origin, radius = Point(1, 2), 3.5
+        circle = shape.Circle(origin, radius, 9)
+        for ix, p in enumerate(circle.points):
+            theta = tau * ix / 9
+            self.assertEqual(p, origin + Point(math.cos(theta), math.sin(theta)) * radius)
+
+    def test_arc(self):
+        points = shape.arc(Point(5, 0), 5, 0, tau / 2, 5)
+        self.assertIs(tessellation.unit_arc(0, tau / 2, 5), tessellation.unit_arc(0, tau / 2, 5))
+        for p in points:
+            self.assertAlmostEqual(abs(p - Point(5, 0)), 5)
+        self.assertEqual(points[0], Point(10, 0))
+
+    def test_spun(self):
+        square = shape.Rectangle(Point(1, 0), Point(2, 1))
+        spun = solid.Spun(Vector3(0, 0, 1), Vector3(0, 1, 0), [square] * 7)
+        for ix, profile in enumerate(spun.profiles()):
+            expected = spun.profile(square, tau * ix / 6)
+            for p, q in zip(profile.points, expected.points):
+                self.assertAlmostEqual(abs(p - q), 0)